@@ -0,0 +1,73 @@
+"""기사 1건 정규화 비용 마이크로벤치마크 (기존 parse_feed 방식 vs normalize 모듈)
+대용량 가상 피드를 feedparser로 한번 파싱해두고 기사 순회 부분만 시간 측정
+    기존 : urlparse() + parse_qs() idx 추출, 형식 안맞는 strptime() 실패 -> datetime.now() 대체 + 기사마다 경고 로그
+    개선 : 정규식 idx 추출, 캐시한 RFC-822 파싱(지정 시간대 변환), 실행당 1번 계산한 대체값, 경고 집계
+
+실행 : python -m bench.bench_normalize [기사수]
+"""
+
+import io
+import logging
+import sys
+import time
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs
+
+import feedparser
+
+from pkg.normalize import Normalizer
+from pkg.sources import get_adapter
+
+from .feeds import make_feed
+
+
+def legacy(entries, log) :
+    # 기존 parse_feed() 기사 처리 부분 그대로
+    for entry in entries :
+        target_idx = parse_qs(urlparse(entry.link).query).get('idx', [None])[0]
+        if not target_idx :
+            continue
+        raw_date = entry.get('published', '')
+        try :
+            written_dt = datetime.strptime(raw_date, '%a, %d, %b, %Y, %H:%M:%S %z').strftime('%Y-%m-%d %H:%M:%S')
+        except Exception as e :
+            log.warning(f"날짜 변환 실패 {raw_date}:{e}로 현재시간 대체")
+            written_dt = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        int(target_idx), written_dt
+
+
+def fast(entries, log) :
+    adapter = get_adapter("boannews")
+    normalizer = Normalizer()
+    for entry in entries :
+        idx = adapter.extract_id(entry.link)
+        if not idx :
+            normalizer.count("idx 추출 실패")
+            continue
+        idx, normalizer.written_dt(entry)
+    normalizer.log_summary()
+
+
+def measure(func, entries, log, repeat: int = 3) -> float :
+    best = float("inf")
+    for _ in range(repeat) :
+        start = time.perf_counter()
+        func(entries, log)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__" :
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    # 운영과 같이 경고 로그를 실제로 포맷/기록하도록 메모리 스트림 핸들러 연결
+    log = logging.getLogger("bench")
+    log.addHandler(logging.StreamHandler(io.StringIO()))
+    log.propagate = False
+
+    entries = feedparser.parse(make_feed(n)).entries
+    before = measure(legacy, entries, log)
+    after = measure(fast, entries, log)
+    print(f"entries={len(entries)}")
+    print(f"legacy : {before * 1e6 / len(entries):8.2f} us/entry ({before:.3f}s)")
+    print(f"fast   : {after * 1e6 / len(entries):8.2f} us/entry ({after:.3f}s)")
+    print(f"speedup: {before / after:.1f}x")
@@ -0,0 +1,97 @@
+"""피드 파싱 / 피드 탐색 백엔드 비교 벤치마크 (소요시간 + tracemalloc 최대 메모리)
+    피드 : feedparser.parse()  vs  fastfeed.parse_entries() (iterparse, 기사 처리 후 element 해제)
+    녹화 : 고정 피드(fixtures/category*.xml) feedparser.parse()  vs  fastfeed.load_entries()
+           category_euckr.xml 은 expat 미지원 인코딩 -> utf-8 변환 후 빠른 경로 (대체 없이 파싱되는지 검사)
+    탐색 : BeautifulSoup 전체 트리  vs  rss.scan_feed_links() 스트리밍 스캔 (홈페이지 <link> 찾기)
+    안내 : BeautifulSoup 전체 트리  vs  SoupStrainer("tr") 부분 트리 (rss 안내 페이지 "메인 카테고리" 표)
+
+실행 : python -m bench.bench_parse [기사수]
+"""
+
+import json
+import logging
+import sys
+import time
+import tracemalloc
+
+import feedparser
+from bs4 import BeautifulSoup, SoupStrainer
+
+from pkg import fastfeed, rss, rss_ps
+
+from .feeds import make_feed, read_fixture
+
+
+def measure(func, repeat: int = 3) -> dict :
+    '''최소 소요시간 + 1회 실행 최대 메모리(tracemalloc 켜면 느려지므로 시간 측정과 분리)'''
+    best = float("inf")
+    for _ in range(repeat) :
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": round(best, 6), "peak_mib": round(peak / 2 ** 20, 2)}
+
+
+def compare(name: str, before, after, repeat: int) -> dict :
+    result = {"before": measure(before, repeat), "after": measure(after, repeat)}
+    result["speedup"] = round(result["before"]["seconds"] / result["after"]["seconds"], 1)
+    result["memory_ratio"] = round(result["before"]["peak_mib"] / max(result["after"]["peak_mib"], 0.01), 1)
+    print(f"{name:10s} {result['before']['seconds']:8.4f}s {result['before']['peak_mib']:8.2f}MiB -> "
+          f"{result['after']['seconds']:8.4f}s {result['after']['peak_mib']:8.2f}MiB "
+          f"({result['speedup']}x, 메모리 {result['memory_ratio']}x)", file=sys.stderr)
+    return result
+
+
+def big_homepage(links: int = 3000) -> str :
+    '''실제 포털 홈페이지처럼 본문 링크가 많은 페이지 (표준 피드 <link> 는 head 에)'''
+    home = read_fixture("home.html").decode("utf-8")
+    body = "".join(f'<div class="item"><a href="/media/view.asp?idx={i}">기사 {i}</a><span>요약 {i}</span></div>'
+                   for i in range(links))
+    return home.replace("</body>", body + "</body>")
+
+
+def big_guide(rows: int = 500) -> str :
+    '''rss 안내 페이지 앞뒤로 표 바깥 본문을 붙여서 키운 페이지'''
+    guide = read_fixture("rss_guide.html").decode("utf-8").replace("{base}", "http://127.0.0.1")
+    filler = "".join(f"<div><p>안내 문단 {i}</p><a href='/x/{i}'>링크</a></div>" for i in range(rows))
+    return guide.replace("<body>", "<body>" + filler).replace("</body>", filler + "</body>")
+
+
+if __name__ == "__main__" :
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    logging.basicConfig(level=logging.ERROR)   # 대체 경로 경고가 반복 측정마다 찍히지 않도록
+    feed = make_feed(n)
+    home = big_homepage()
+    guide = big_guide()
+
+    # 두 백엔드 결과 필드가 같은지 먼저 확인
+    slow = feedparser.parse(feed).entries
+    fast = fastfeed.parse_entries(feed)
+    assert len(slow) == len(fast) == n
+    assert all(s.link == f.link and s.title == f.title and s.author == f.author for s, f in zip(slow, fast))
+    recorded = {name : read_fixture(name) for name in ("category.xml", "category_euckr.xml")}
+    for name, content in recorded.items() :
+        assert [e.link for e in fastfeed.parse_entries(content)] == \
+            [e.link for e in feedparser.parse(content).entries], name
+    assert rss_ps._extract_targets(BeautifulSoup(guide, "html.parser")) == \
+        rss_ps._extract_targets(BeautifulSoup(guide, "html.parser", parse_only=SoupStrainer("tr")))
+
+    report = {
+        "entries": n,
+        "feed": compare("feed", lambda : feedparser.parse(feed).entries, lambda : fastfeed.parse_entries(feed), 3),
+        "recorded": {name : compare(name.split(".")[0], lambda c=content : feedparser.parse(c).entries,
+                                    lambda c=content : fastfeed.load_entries(c, label=name), 20)
+                     for name, content in recorded.items()},
+        "discover": compare("discover",
+                            lambda : BeautifulSoup(home, "html.parser").find_all("link", rel="alternate"),
+                            lambda : rss.scan_feed_links(home).alternates, 5),
+        "guide": compare("guide",
+                         lambda : rss_ps._extract_targets(BeautifulSoup(guide, "html.parser")),
+                         lambda : rss_ps._extract_targets(BeautifulSoup(guide, "html.parser",
+                                                                        parse_only=SoupStrainer("tr"))), 5),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
@@ -0,0 +1,126 @@
+"""벤치마크용 MariaDB 대역 (sqlite3 메모리 DB)
+db_conn.insert_news_many() 가 쓰는 연결 객체 인터페이스만 흉내
+    conn.cursor() (with 문 지원) / cursor.executemany() / cursor.execute() / conn.commit() / conn.rollback()
+MariaDB 전용 문법은 실행 직전에 sqlite 문법으로 변환
+    %s                          -> ?
+    ON DUPLICATE KEY UPDATE     -> ON CONFLICT(키) DO UPDATE SET
+    VALUES(컬럼)                 -> excluded.컬럼
+    NOW() / DATE_SUB(NOW(), INTERVAL %s DAY) -> datetime('now', ...)
+    SELECT ... FOR UPDATE       -> FOR UPDATE 제거 (sqlite 는 쓰기 트랜잭션 단위 잠금)
+테이블은 INSERT 대상 / SELECT ... FOR UPDATE 대상 이름으로 처음 쓸 때 자동 생성 (site 컬럼 있으면 키 site + idx)
+"""
+
+import re
+import sqlite3
+
+_INSERT_TABLE = re.compile(r"INSERT\s+INTO\s+(\w+)", re.I)
+_LOCK_TABLE = re.compile(r"SELECT\s.+?\sFROM\s+(\w+)\s.*FOR\s+UPDATE", re.I | re.S)
+_VALUES_FUNC = re.compile(r"VALUES\((\w+)\)")
+_DATE_SUB = re.compile(r"DATE_SUB\(\s*NOW\(\)\s*,\s*INTERVAL\s+\?\s+DAY\s*\)", re.I)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    {site}idx INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    creator TEXT,
+    written_dt TEXT,
+    description TEXT,
+    description_full BLOB,
+    category TEXT,
+    save_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY ({key})
+)
+"""
+
+
+def translate(sql: str) -> str :
+    '''MariaDB 쿼리 -> sqlite 쿼리 (이 저장소에서 쓰는 문법만)'''
+    sql = sql.replace("%s", "?")
+    if "ON DUPLICATE KEY UPDATE" in sql :
+        key = "site, idx" if re.search(r"\(\s*site\s*,", sql) else "idx"
+        sql = sql.replace("ON DUPLICATE KEY UPDATE", f"ON CONFLICT({key}) DO UPDATE SET")
+        sql = _VALUES_FUNC.sub(r"excluded.\1", sql)
+    sql = sql.replace(" FOR UPDATE", "")
+    sql = _DATE_SUB.sub("datetime('now', '-' || ? || ' days')", sql)
+    return sql.replace("NOW()", "datetime('now')")
+
+
+class FakeCursor :
+    def __init__(self, conn) :
+        self._conn = conn
+        self._cur = conn.db.cursor()
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self, exc_type, exc, tb) :
+        self.close()
+
+    def _prepare(self, sql: str) -> str :
+        m = _INSERT_TABLE.search(sql)
+        if m :
+            self._conn.ensure_table(m.group(1), with_site=bool(re.search(r"\(\s*site\s*,", sql)))
+        m = _LOCK_TABLE.search(sql)
+        if m :
+            self._conn.ensure_table(m.group(1), with_site=bool(re.search(r"\bsite\s*=", sql)))
+        return translate(sql)
+
+    def execute(self, sql: str, params=()) :
+        self._cur.execute(self._prepare(sql), params)
+        self._conn.statements += 1
+
+    def executemany(self, sql: str, rows) :
+        self._cur.executemany(self._prepare(sql), rows)
+        self._conn.statements += 1
+
+    def fetchall(self) :
+        return self._cur.fetchall()
+
+    def fetchone(self) :
+        return self._cur.fetchone()
+
+    @property
+    def rowcount(self) :
+        return self._cur.rowcount
+
+    def close(self) :
+        self._cur.close()
+
+
+class FakeConnection :
+    '''
+    param path : sqlite 파일 경로 (기본 메모리 DB)
+        conn = FakeConnection()
+        insert_news_many(conn, rows)
+        conn.count("boannews_rss")
+    '''
+    def __init__(self, path: str = ":memory:") :
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.statements = 0
+        self._tables: set[str] = set()
+
+    def ensure_table(self, table: str, with_site: bool = False) -> None :
+        if table in self._tables :
+            return
+        self.db.execute(_SCHEMA.format(table=table, site="site TEXT NOT NULL, " if with_site else "",
+                                       key="site, idx" if with_site else "idx"))
+        self._tables.add(table)
+
+    def cursor(self) :
+        return FakeCursor(self)
+
+    def commit(self) :
+        self.db.commit()
+
+    def rollback(self) :
+        self.db.rollback()
+
+    def ping(self) :
+        pass
+
+    def count(self, table: str) -> int :
+        return self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) :
+        self.db.close()
@@ -0,0 +1,24 @@
+"""벤치마크용 가상 피드 생성 (보안뉴스 rss 2.0 형식)"""
+
+import os
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def make_feed(n: int, start_idx: int = 100000, category: str = "보안") -> bytes :
+    '''기사 n건짜리 rss 2.0 피드 bytes (description 은 실제 피드처럼 html 조각 포함)'''
+    items = "".join(
+        f"<item><title>{category} 테스트 기사 {i}</title>"
+        f"<link>https://www.boannews.com/media/view.asp?idx={start_idx + i}&amp;kind=1</link>"
+        f"<description><![CDATA[<p>요약 {i} <b>보안</b> 이슈 관련 기사 본문 일부입니다.</p>]]></description>"
+        f"<author>보안뉴스</author>"
+        f"<pubDate>Mon, 13 Oct 2026 {i % 24:02d}:{i % 60:02d}:00 +0900</pubDate></item>"
+        for i in range(n)
+    )
+    return (f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            f'<title>보안뉴스 - {category}</title>{items}</channel></rss>').encode("utf-8")
+
+
+def read_fixture(name: str) -> bytes :
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f :
+        return f.read()
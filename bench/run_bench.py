@@ -0,0 +1,169 @@
+"""오프라인 벤치마크 : 실제 boannews.com / MariaDB 없이 수집 단계별 소요시간 측정
+    로컬 HTTP 서버(bench.server) : 고정 홈/RSS 안내 페이지 + 가상 카테고리 피드(기사 entries건씩)
+    DB 대역(bench.fake_db)       : sqlite3 메모리 DB
+측정 항목 (각각 repeat 회 실행, 최소/중앙값 기록)
+    discover_feeds   : 홈페이지 -> rss 안내 페이지 주소 탐색
+    get_rss          : rss 안내 페이지 -> 카테고리 목록
+    parse_feed       : 대용량 가상 피드(big_entries건) 1개 파싱 (다운로드 제외)
+    parse_feed_recorded[_euckr] : 녹화 피드(fixtures/category.xml, euc-kr 인코딩본) 파싱
+    run_collection   : 목록 탐색 + 병렬 다운로드 + 파싱 전체
+    run_collection_recorded     : 녹화 피드 2개(utf-8, euc-kr)만 수집 (범용 어댑터, 피드 주소 지정)
+    insert_news_many : run_collection 결과 전체 upsert
+결과는 JSON 으로 출력, --baseline 으로 이전 결과 주면 중앙값이 threshold 이상 느려진 항목 표시 후 종료코드 1
+
+실행 : python -m bench.run_bench [--entries 2500] [--big-entries 10000] [--repeat 5] [--output result.json]
+       python -m bench.run_bench --baseline result.json   # 회귀 검사 (cron 배포 전)
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from pkg import rss, rss_ps
+from pkg.db_conn import insert_news_many
+from pkg.sources import get_adapter
+
+from .fake_db import FakeConnection
+from .feeds import make_feed, read_fixture
+from .server import FixtureServer, RECORDED
+
+
+def measure(func, repeat: int) -> dict :
+    '''func() 를 repeat 회 실행, 마지막 반환값의 건수(len)와 소요시간 통계'''
+    times = []
+    value = None
+    for _ in range(repeat) :
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    items = len(value) if hasattr(value, "__len__") else None
+    median = statistics.median(times)
+    result = {
+        "repeat": repeat,
+        "min_s": round(min(times), 6),
+        "median_s": round(median, 6),
+        "max_s": round(max(times), 6),
+        "items": items,
+    }
+    if items :
+        result["us_per_item"] = round(median * 1e6 / items, 3)
+    return result
+
+
+def git_revision() :
+    try :
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError) :
+        return None
+
+
+def run(entries: int = 2500, big_entries: int = 10000, repeat: int = 5, latency: float = 0.0) -> dict :
+    results = {}
+    with FixtureServer(entries=entries, latency=latency) as server :
+        home = server.base + "/"
+        adapter = get_adapter("boannews", base_url=home)
+
+        results["discover_feeds"] = measure(lambda : rss.discover_feeds(home), repeat)
+        results["get_rss"] = measure(lambda : rss_ps.get_rss(url=home), repeat)
+
+        big = make_feed(big_entries)
+        target = {"category": "보안", "url": server.base + "/rss/big.xml"}
+        results["parse_feed"] = measure(lambda : rss_ps.parse_feed(target, big, adapter=adapter), repeat)
+
+        # 가상 피드만으로는 안 지나가는 경로 (실제 기사 형태, euc-kr 디코딩) 도 측정
+        recorded = {"보안" : server.base + "/rss/recorded.xml", "보안(euc-kr)" : server.base + "/rss/recorded_euckr.xml"}
+        for name, (category, url) in zip(("parse_feed_recorded", "parse_feed_recorded_euckr"), recorded.items()) :
+            fixture = read_fixture(RECORDED[url[len(server.base):]])
+            recorded_target = {"category": category, "url": url}
+            results[name] = measure(lambda : rss_ps.parse_feed(recorded_target, fixture, adapter=adapter), repeat)
+
+        rows = []
+        def collect() :
+            rows[:] = rss_ps.run_collection(adapter=adapter)
+            return rows
+        results["run_collection"] = measure(collect, repeat)
+
+        recorded_adapter = get_adapter("rss", site="boannews", base_url=home, feeds=recorded, id_param="idx")
+        results["run_collection_recorded"] = measure(lambda : rss_ps.run_collection(adapter=recorded_adapter), repeat)
+
+        conn = FakeConnection()
+        results["insert_news_many"] = measure(lambda : insert_news_many(conn, rows) or rows, repeat)
+        results["insert_news_many"]["table_rows"] = conn.count("boannews_rss")
+        conn.close()
+        requests_served = server.requests
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "entries": entries,
+            "big_entries": big_entries,
+            "latency_s": latency,
+            "http_requests": requests_served,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list :
+    '''중앙값 기준 baseline 대비 threshold(비율) 이상 느려진 항목 목록'''
+    regressions = []
+    for name, cur in current["results"].items() :
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("median_s") :
+            continue
+        ratio = cur["median_s"] / base["median_s"]
+        cur["vs_baseline"] = round(ratio, 3)
+        if ratio > 1 + threshold :
+            regressions.append(f"{name} : {base['median_s']:.4f}s -> {cur['median_s']:.4f}s ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: list = None) -> int :
+    '''명령행 실행 (python -m bench.run_bench, cli bench 명령), return : 종료코드 (회귀 감지시 1)'''
+    parser = argparse.ArgumentParser(prog="bench", description="RSS 수집기 오프라인 벤치마크")
+    parser.add_argument("--entries", type=int, default=2500, help="카테고리 피드당 기사 수 (카테고리 4개)")
+    parser.add_argument("--big-entries", type=int, default=10000, help="parse_feed 측정용 피드 기사 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="로컬 서버 요청당 지연(초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 표준출력만)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 비율 (기본 0.2 = 20%% 느려짐)")
+    parser.add_argument("--verbose", action="store_true", help="수집기 로그 출력")
+    args = parser.parse_args(argv)
+
+    # 기사/카테고리별 info 로그가 측정값에 섞이지 않도록 기본은 경고 이상만
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    if not args.verbose :
+        logging.getLogger().setLevel(logging.ERROR)
+
+    report = run(entries=args.entries, big_entries=args.big_entries, repeat=args.repeat, latency=args.latency)
+
+    regressions = []
+    if args.baseline :
+        with open(args.baseline, encoding="utf-8") as f :
+            regressions = compare(report, json.load(f), args.threshold)
+        report["regressions"] = regressions
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output :
+        with open(args.output, "w", encoding="utf-8") as f :
+            f.write(text + "\n")
+    if regressions :
+        print("성능 회귀 감지 :\n  " + "\n  ".join(regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__" :
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""벤치마크용 로컬 HTTP 서버 (boannews.com 대역)
+    /                       -> fixtures/home.html (rss 안내 페이지 <link rel="alternate">)
+    /custom/news_rss.asp    -> fixtures/rss_guide.html ({base} 를 서버 주소로 치환)
+    /rss/recorded.xml       -> fixtures/category.xml (실제 피드 형태 고정본)
+    /rss/recorded_euckr.xml -> fixtures/category_euckr.xml (같은 내용 euc-kr 인코딩)
+    /rss/<이름>.xml          -> make_feed(entries) 가상 피드 (카테고리마다 idx 구간 다르게)
+모든 응답에 ETag 부여, If-None-Match 일치시 304 -> 조건부 GET 경로도 측정 가능
+latency 지정시 요청마다 지연 (네트워크 왕복 흉내, 병렬 다운로드 효과 측정용)
+"""
+
+import hashlib
+import http.server
+import threading
+import time
+
+from .feeds import make_feed, read_fixture
+
+# 녹화 피드 경로 -> fixtures 파일
+RECORDED = {
+    "/rss/recorded.xml": "category.xml",
+    "/rss/recorded_euckr.xml": "category_euckr.xml",
+}
+
+
+class FixtureServer :
+    '''
+    param entries : 가상 카테고리 피드 기사 수
+    param latency : 요청당 지연(초)
+        with FixtureServer(entries=2500) as server :
+            server.base   # "http://127.0.0.1:포트"
+    '''
+    def __init__(self, entries: int = 2500, latency: float = 0.0) :
+        self.entries = entries
+        self.latency = latency
+        self.requests = 0
+        self._bodies: dict[str, bytes] = {}
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.base = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def body(self, path: str) :
+        '''경로별 응답 본문 (처음 요청시 생성 후 재사용)'''
+        if path in self._bodies :
+            return self._bodies[path]
+        if path == "/" :
+            body = read_fixture("home.html")
+        elif path == "/custom/news_rss.asp" :
+            body = read_fixture("rss_guide.html").replace(b"{base}", self.base.encode())
+        elif path in RECORDED :
+            body = read_fixture(RECORDED[path])
+        elif path.startswith("/rss/") and path.endswith(".xml") :
+            name = path[len("/rss/"):-len(".xml")]
+            start_idx = 100000 + (int(hashlib.md5(name.encode()).hexdigest()[:4], 16) * 1000)
+            body = make_feed(self.entries, start_idx=start_idx, category=name)
+        else :
+            return None
+        self._bodies[path] = body
+        return body
+
+    def _handler_class(self) :
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler) :
+            def do_GET(self) :
+                server.requests += 1
+                if server.latency :
+                    time.sleep(server.latency)
+                body = server.body(self.path.split("?", 1)[0])
+                if body is None :
+                    self.send_error(404)
+                    return
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag :
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                ctype = "application/xml" if self.path.endswith(".xml") else "text/html; charset=utf-8"
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) :
+                pass
+
+        return Handler
+
+    def __enter__(self) :
+        threading.Thread(target=self._httpd.serve_forever, name="bench-http", daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) :
+        self._httpd.shutdown()
+        self._httpd.server_close()
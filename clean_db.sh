@@ -1,13 +1,16 @@
 #!/bin/bash
-# 파이썬 코드 거치지 않고 정해진 시간에 MariaDB에 직접 접속 -> Delete명령만 실행시킴
+# 정해진 시간에 보관기간 지난 데이터 정리
+# DELETE 한방 쿼리 대신 pkg.retention 모듈 : 기본키 batch 단위 삭제 + batch 사이 대기 + 시간 예산
+# (batch 크기/대기/시간 예산은 .db_conn_conf.ini [retention] 섹션, 접속 정보는 [mariadb] 섹션 그대로 사용)
+# --table 없으면 boannews_rss + 다중 사이트 공용 테이블 news_rss (있을 때만) 모두 정리
 PROJECT_DIR="/home/rdbbot/rss_collector"
 LOG_FILE="$PROJECT_DIR/logs/app.log"
-MYSQL_BIN="/usr/bin/mysql"              # 리눅스에서 경로확인 which mysql
+PYTHON_BIN="$PROJECT_DIR/.venv/bin/python3"
 
 echo "[$(date '+%Y-%m-%d %H:%M:%S')] [점검] 오전 9시 전 데이터 정리 (14일 경과 대상)" >> $LOG_FILE
 
-# MariaDB 삭제 쿼리 실행
-$MYSQL_BIN -e "DELETE FROM boannews_rss WHERE save_at < DATE_SUB(NOW(), INTERVAL 14 DAY);" news_hub >> $LOG_FILE 2>&1
+# batch 삭제 실행 (python -m 으로 실행해야 pkg 패키지 import 가능 -> 프로젝트 폴더에서 실행)
+cd $PROJECT_DIR && $PYTHON_BIN -m pkg.retention --days 14 >> $LOG_FILE 2>&1
 # 리눅스 명령어 실행 실패시 종료코드 exit code = 0이 아닌 값(보통1)
 if [ $? -eq 0 ]; then
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] [완료] 데이터 삭제 성공 종료." >> $LOG_FILE
@@ -1,13 +1,30 @@
-from pkg.db_conn import load_db_conf, get_connection, insert_news_many
-from pkg.rss_ps import run_collection
-from pkg.logging_config import setup_logging
 import logging
 import os
+import time
 import sys  # 시스템 종료 코드 보냄
 
 logger = logging.getLogger("RSS_collector : " + __name__)
 
-def main() :
+def main(refresh_targets: bool = False, full: bool = False, stream: bool = False, sites: str = None,
+         metrics_textfile: str = None, metrics_json: str = None, conf_path: str = None) :
+    '''
+    param refresh_targets : True면 저장된 카테고리 목록(.rss_targets.json) 무시하고 재탐색
+    param full : True면 증분 상태(.seen_state.json)와 조건부 GET 검증값(.http_cache) 무시하고 피드 내 모든 기사 upsert
+                 (304 로 건너뛰는 카테고리 없음, 이번에 받은 검증값/상태는 그대로 저장)
+    param stream : True면 스트리밍 모드 (파싱되는 즉시 batch 단위로 DB 저장, pipeline 모듈)
+    param sites : 사이트 설정파일(sites.ini) 경로, 지정시 다중 사이트 병렬 수집 -> 공용 테이블 news_rss 저장
+    param metrics_textfile, metrics_json : 실행 끝에 단계별 계측값 저장 경로 (Prometheus textfile / JSON, 실패한 실행도 기록)
+    param conf_path : DB 설정파일 경로 (None이면 main.py 옆 .db_conn_conf.ini)
+    '''
+    # 수집 모듈은 여기서 import (main.py purge/drain/bench 같은 다른 명령은 로딩 안함)
+    # mariadb 커넥터, feedparser/bs4(rss_ps) 는 실제 쓰는 단계에서 import
+    # -> 다른 프로세스 실행중, 수집 기사 없음 같은 조기 종료 경로에서 로딩 비용 없음
+    from pkg.http_cache import HttpCache
+    from pkg.target_registry import TargetRegistry
+    from pkg.seen_state import SeenState
+    from pkg.spool import Spool
+    from pkg.scheduler import file_lock
+    from pkg import metrics
     
     logger.info("main : 보안뉴스 수집 및 db 저장 시작")
     
@@ -16,36 +33,95 @@ def main() :
     # os.path.dirname(os.path.dirname(__file__)) : /home/rdbbot -> db연동 정보 못찾아서 에러남
     # os.path.dirname(__file__): /home/rdbbot/rss_collector  설정파일 여기있음
     # __file__ : /home/rdbbot/rss_collector/main.py
-    conf_path = os.path.join(os.path.dirname(__file__), '.db_conn_conf.ini')
+    conf_path = conf_path or os.path.join(os.path.dirname(__file__), '.db_conn_conf.ini')
+    # 조건부 GET 검증값 캐시 : 변경없는(304) 페이지/카테고리는 다운로드, 파싱, DB저장 생략 (full 이면 조건부 요청 안함)
+    cache = HttpCache(os.path.join(os.path.dirname(__file__), '.http_cache'), refresh=full)
+    # 카테고리 목록 캐시 : ttl 경과 / 주소 연속 실패 / 강제 갱신시에만 홈페이지, rss안내 페이지 재탐색
+    registry = TargetRegistry(os.path.join(os.path.dirname(__file__), '.rss_targets.json'))
+    # 증분 수집 상태 : 카테고리별 idx high-water mark + 최근 기사 해시, 신규/변경 기사만 DB 저장
+    state = SeenState(os.path.join(os.path.dirname(__file__), '.seen_state.json'))
     
-    conn = None
+    handler = None
     
-    try :
-        list_news = run_collection()
-        if not list_news:
-            logger.warning("수집된 뉴스 데이터 없습니다. 작업을 종료합니다.")
-            return  # 에러아님 정상종료(exit 0), 삭제로직 실행가능
+    # 데몬 모드나 이전 cron 실행과 동시에 수집하지 않도록 프로세스 간 잠금
+    with file_lock(os.path.join(os.path.dirname(__file__), '.collector.lock')) as acquired :
+        if not acquired :
+            logger.warning("다른 수집 프로세스 실행중, 이번 실행 건너뜀")
+            return
         
-        # DB 작업
-        db_config = load_db_conf(conf_path)
-        conn = get_connection(db_config)
-        insert_news_many(conn, list_news)
-        logger.info("정상 종료")
+        # 로컬 선기록 스풀 : DB 저장 전에 파싱 결과 보관, DB 장애시 다음 실행에서 재다운로드 없이 저장
+        spool = Spool(os.path.join(os.path.dirname(__file__), '.spool.sqlite'))
+        run_start = time.perf_counter()
+        run_ok = True
+        try :
+            if sites :
+                # 다중 사이트 모드 : 사이트별 어댑터로 병렬 수집, 사이트별 캐시/상태 파일 사용
+                from pkg.db_handler import MariaDBHandler
+                from pkg.sources import load_sites
+                from pkg.multisite import collect_sites
+                adapters = load_sites(sites)
+                handler = MariaDBHandler.from_conf_path(conf_path)
+                results = collect_sites(adapters, handler, os.path.dirname(__file__), full=full, spool=spool)
+                failed = [site for site, r in results.items() if isinstance(r, Exception)]
+                if failed :
+                    raise Exception(f"사이트 수집 실패 : {failed}")
+                logger.info("정상 종료")
+                return
+            
+            if stream :
+                # 스트리밍 모드 : DB 연결 먼저 -> 수집하면서 bounded queue 통해 batch 단위 저장
+                from pkg.db_handler import MariaDBHandler
+                from pkg.pipeline import run_streaming
+                handler = MariaDBHandler.from_conf_path(conf_path)
+                run_streaming(handler, cache=cache, registry=registry, refresh_targets=refresh_targets,
+                              state=None if full else state, spool=spool)
+                # 저장 실패한 batch 는 스풀에 기록됨 -> 검증값, 증분 상태 저장 후 실패로 종료
+                cache.save()
+                state.commit()
+                if spool.pending() :
+                    raise ConnectionError("스트리밍 저장 실패")
+                logger.info("정상 종료")
+                return
+            
+            from pkg.rss_ps import run_collection
+            list_news = run_collection(cache=cache, registry=registry, refresh_targets=refresh_targets,
+                                       state=None if full else state)
+            # 로컬 스풀에 먼저 기록 -> 기록 후에는 검증값, 증분 상태 저장해도 기사 유실 없음
+            # DB 장애로 저장 실패해도 다음 실행에서 다시 다운로드하지 않고 스풀에서 이어서 저장
+            spool.append(list_news)
+            cache.save()
+            state.commit()
+            if not spool.pending() :
+                logger.warning("수집된 뉴스 데이터 없습니다. 작업을 종료합니다.")
+                return  # 에러아님 정상종료(exit 0), 삭제로직 실행가능
+        
+            # DB 작업 : 이전 실행에서 남은 스풀 + 이번 수집분을 오래된 순서로 저장
+            # 커넥션 풀 + chunk 단위 commit + 지수 백오프 재연결
+            from pkg.db_handler import MariaDBHandler
+            handler = MariaDBHandler.from_conf_path(conf_path)
+            spool.drain(handler)
+            logger.info("정상 종료")
         
-    except Exception as e:
-        # 수집,db연결 실패 등 모든 에러 모임
-        # get_connection()에서는 logger.error() 여기서는 critical 로그레벨로 차이를 두어 로그 필터링 고려
-        logger.critical(f"프로젝트 실행 중 오류 발생 실행 중단: {e}")
-        # 연결이 제되로 안되는등 비정상 종료시 데이터 삭제 방지위한 신호 보냄
-        sys.exit(1)
+        except Exception as e:
+            # 수집,db연결 실패 등 모든 에러 모임
+            # get_connection()에서는 logger.error() 여기서는 critical 로그레벨로 차이를 두어 로그 필터링 고려
+            logger.critical(f"프로젝트 실행 중 오류 발생 실행 중단: {e}")
+            if spool.pending() :
+                logger.warning(f"DB 저장 대기 {spool.pending()}건 스풀에 보관, 다음 실행에서 이어서 저장")
+            # 연결이 제되로 안되는등 비정상 종료시 데이터 삭제 방지위한 신호 보냄
+            run_ok = False
+            sys.exit(1)
         
-    finally:
-        if conn:
-            conn.close()
-            logger.info("db연결 안전하게 닫힘")
+        finally:
+            if handler:
+                handler.close()
+            metrics.observe("run_seconds", time.perf_counter() - run_start)
+            metrics.set_gauge("last_run_success", 1 if run_ok else 0)
+            metrics.set_gauge("last_run_timestamp_seconds", time.time())
+            spool.close()
+            metrics.export(textfile=metrics_textfile, json_path=metrics_json)
             
 if __name__ == "__main__" :
-    main_abs_path = os.path.dirname(os.path.abspath(__file__)) # 현재 main.py 위치 기준 절대 경로 생성
-    log_abs_path = os.path.join(main_abs_path,"logs","app.log") # # /home/rdbbot/rss_collector/logs/app.log 생성
-    setup_logging(log_path=log_abs_path)
-    main()
+    # 명령행 해석, 명령별 지연 import 는 pkg.cli (python main.py [collect|discover|purge|drain|bench] [--profile])
+    from pkg.cli import run
+    sys.exit(run(base_dir=os.path.dirname(os.path.abspath(__file__)), collect=main))
@@ -1,2 +1,24 @@
-from .rss_ps import run_collection
-from .db_conn import get_connection, insert_news_many
\ No newline at end of file
+"""rss_collector 패키지
+하위 모듈은 처음 쓸 때 import (PEP 562 모듈 __getattr__)
+-> import pkg.metrics 같은 가벼운 모듈만 쓰는 실행에서 mariadb, feedparser, bs4, requests 로딩 안함
+"""
+
+import importlib
+
+# 패키지 최상위에서 바로 쓰던 이름 -> 실제 위치 모듈
+_EXPORTS = {
+    "run_collection": ".rss_ps",
+    "get_connection": ".db_conn",
+    "insert_news_many": ".db_conn",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) :
+    module = _EXPORTS.get(name)
+    if module is None :
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value   # 다음 접근부터는 바로 반환
+    return value
@@ -0,0 +1,308 @@
+"""cli 모듈 : 수집기 명령행 진입점 (main.py 가 인자 그대로 넘겨줌)
+cron 으로 짧게 자주 실행 -> 인터프리터 시작 + import 시간이 전체 실행시간에서 큰 비중
+-> 이 모듈은 표준 라이브러리만 import, 명령마다 필요한 모듈은 명령 함수 안에서 import
+   (mariadb 커넥터, feedparser, bs4 는 실제 쓰는 단계에서 import -> 조기 종료 경로는 로딩 비용 없음)
+
+명령
+    collect  : 수집 -> 스풀 -> DB 저장 (기본 명령, 기존 main.py 옵션 그대로)
+    discover : 카테고리(피드) 목록 탐색 결과 출력, --save 면 카테고리 목록 파일 갱신 (DB 접속 없음)
+    purge    : 보관기간 지난 기사 batch 삭제 (retention.main() 에 옵션 그대로 전달)
+    drain    : 로컬 스풀(.spool.sqlite)에 남은 기사만 DB 저장 (수집 없음, 스풀 비어있으면 DB 접속 안함)
+    bench    : 오프라인 벤치마크 (bench.run_bench.main() 에 옵션 그대로 전달)
+
+--profile      : 명령을 cProfile 로 실행 -> 끝난 뒤 stderr 에 모듈 import 시간 상위 + 함수 누적시간 상위 출력
+--profile-out  : pstats 파일 저장 경로 (python -m pstats <경로> 로 다시 확인)
+                 인터프리터 자체 시작 단계까지 모듈 단위로 보려면 python -X importtime main.py ...
+
+실행 : python main.py                       # collect (cron, 기존과 동일)
+       python main.py --full                # 명령 없이 옵션만 주면 collect
+       python main.py --profile drain       # 공용 옵션(--profile)은 명령 앞에
+       python main.py purge --days 14
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+COMMANDS = ("collect", "discover", "purge", "drain", "bench")
+PASSTHROUGH = ("purge", "bench")   # 옵션 해석은 해당 모듈 main() 에서
+GLOBAL_FLAGS = ("--profile",)
+GLOBAL_VALUE_OPTIONS = ("--profile-out", "--profile-top", "--conf")
+DEFAULT_PROFILE_TOP = 25
+DEFAULT_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ImportTimer :
+    '''
+    sys.meta_path 맨 앞에 끼워서 모듈 로딩(create_module + exec_module) 시간 기록 (--profile 전용)
+    records : {모듈: [self, total]}
+        total : 하위 import 포함 / self : 하위 import 제외 (python -X importtime 의 cumulative / self 와 같은 의미)
+    '''
+    def __init__(self) :
+        self.records: dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()   # 스레드별 로딩 중 모듈 스택
+
+    def install(self) -> None :
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None :
+        if self in sys.meta_path :
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path, target=None) :
+        # 나머지 finder 로 찾고 loader 만 시간 측정용으로 감쌈
+        for finder in sys.meta_path :
+            if finder is self or not hasattr(finder, "find_spec") :
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None :
+                continue
+            if hasattr(spec.loader, "exec_module") :
+                spec.loader = _TimedLoader(spec.loader, self, name)
+            return spec
+        return None
+
+    @contextmanager
+    def measure(self, name: str) :
+        stack = self._local.__dict__.setdefault("stack", [])
+        frame = [0.0]   # 하위 import 시간 합계
+        stack.append(frame)
+        start = time.perf_counter()
+        try :
+            yield
+        finally :
+            total = time.perf_counter() - start
+            stack.pop()
+            if stack :
+                stack[-1][0] += total
+            with self._lock :
+                record = self.records.setdefault(name, [0.0, 0.0])
+                record[0] += total - frame[0]
+                record[1] += total
+
+    def report(self, top: int = DEFAULT_PROFILE_TOP) -> str :
+        total_self = sum(r[0] for r in self.records.values())
+        lines = [f"import {len(self.records)}개 모듈, 합계 {total_self * 1e3:.1f}ms (cProfile 부하 포함)",
+                 f"{'total(ms)':>10} {'self(ms)':>10}  모듈"]
+        ranked = sorted(self.records.items(), key=lambda item : item[1][1], reverse=True)
+        for name, (self_s, total_s) in ranked[:top] :
+            lines.append(f"{total_s * 1e3:10.1f} {self_s * 1e3:10.1f}  {name}")
+        return "\n".join(lines)
+
+
+class _TimedLoader :
+    '''원래 loader 감싸서 로딩 시간만 기록, 나머지 속성(get_source, get_resource_reader ...)은 그대로 위임'''
+    def __init__(self, loader, timer: ImportTimer, name: str) :
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def __getattr__(self, attr) :
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec) :
+        with self._timer.measure(self._name) :
+            return self._loader.create_module(spec)
+
+    def exec_module(self, module) :
+        with self._timer.measure(self._name) :
+            self._loader.exec_module(module)
+
+
+def _run_profiled(func, args, top: int, out: str = None) -> int :
+    '''func(args) 를 cProfile + ImportTimer 로 실행, 끝나면(예외, sys.exit 포함) stderr 에 보고서 출력'''
+    import cProfile
+    import io
+    import pstats
+
+    startup_cpu = time.process_time()   # 인터프리터 시작 + 진입점 import 까지 쓴 CPU 시간
+    timer = ImportTimer()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    timer.install()
+    profiler.enable()
+    try :
+        return func(args)
+    finally :
+        profiler.disable()
+        timer.uninstall()
+        elapsed = time.perf_counter() - start
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats("cumulative").print_stats(top)
+        if out :
+            stats.dump_stats(out)
+        print(f"\n=== profile : {args.command} {elapsed:.3f}s (명령 시작 전 CPU {startup_cpu:.3f}s) ===\n"
+              f"{timer.report(top)}\n\n{stream.getvalue()}"
+              + (f"pstats 저장 : {out}\n" if out else ""), file=sys.stderr)
+
+
+def _setup_logging(args) -> None :
+    from .logging_config import setup_logging
+    setup_logging(log_path=os.path.join(args.base_dir, "logs", "app.log"))
+
+
+def cmd_collect(args) -> int :
+    _setup_logging(args)
+    if args.daemon :
+        # 데몬 모드는 필요할 때만 import (cron 1회 실행 경로에는 영향 없음)
+        from .daemon import CollectorDaemon
+        CollectorDaemon(args.base_dir, args.conf).run()
+        return 0
+    collect = args.collect
+    if collect is None :
+        # python -m pkg.cli 로 직접 실행한 경우 프로젝트 폴더의 main.py 사용
+        sys.path.insert(0, args.base_dir)
+        from main import main as collect
+    collect(refresh_targets=args.refresh_targets, full=args.full, stream=args.stream, sites=args.sites,
+            conf_path=args.conf, metrics_textfile=args.metrics_textfile, metrics_json=args.metrics_json)
+    return 0
+
+
+def cmd_discover(args) -> int :
+    _setup_logging(args)
+    from .rss_ps import resolve_targets
+    from .target_registry import TargetRegistry
+
+    adapter = None
+    registry_path = os.path.join(args.base_dir, '.rss_targets.json')
+    if args.site :
+        from .sources import load_sites
+        adapters = {a.site: a for a in load_sites(os.path.join(args.base_dir, "sites.ini"))}
+        if args.site not in adapters :
+            print(f"sites.ini 에 없는 사이트 : {args.site} (등록된 사이트 {list(adapters)})", file=sys.stderr)
+            return 1
+        adapter = adapters[args.site]
+        registry_path = os.path.join(args.base_dir, f'.rss_targets.{args.site}.json')
+    try :
+        targets = resolve_targets(registry=TargetRegistry(registry_path) if args.save else None,
+                                  refresh_targets=True, adapter=adapter)
+    except Exception as e :
+        logger.critical(f"카테고리 목록 탐색 실패 : {e}")
+        return 1
+    for target in targets :
+        print(f"{target['category']}\t{target['url']}")
+    return 0
+
+
+def cmd_drain(args) -> int :
+    _setup_logging(args)
+    from .scheduler import file_lock
+    from .spool import Spool
+
+    with file_lock(os.path.join(args.base_dir, '.collector.lock')) as acquired :
+        if not acquired :
+            logger.warning("다른 수집 프로세스 실행중, 스풀 저장 건너뜀")
+            return 0
+        with Spool(os.path.join(args.base_dir, '.spool.sqlite')) as spool :
+            pending = spool.pending(site=args.site)
+            if not pending :
+                print("스풀에 남은 기사 없음")
+                return 0
+            from .db_handler import MariaDBHandler
+            try :
+                with MariaDBHandler.from_conf_path(args.conf) as handler :
+                    written = spool.drain(handler, site=args.site)
+            except Exception as e :
+                logger.critical(f"스풀 저장 실패, 남은 기사 {spool.pending(site=args.site)}건 : {e}")
+                return 1
+            print(f"스풀 저장 완료 : {written}건")
+    return 0
+
+
+def cmd_purge(args) -> int :
+    from .retention import main
+    return main(args.extra)
+
+
+def cmd_bench(args) -> int :
+    if args.base_dir not in sys.path :
+        sys.path.insert(0, args.base_dir)   # bench 패키지는 프로젝트 폴더 바로 아래
+    from bench.run_bench import main
+    return main(args.extra)
+
+
+def build_parser(base_dir: str) -> argparse.ArgumentParser :
+    parser = argparse.ArgumentParser(prog="main.py", description="보안뉴스 RSS 수집")
+    parser.add_argument("--profile", action="store_true", help="cProfile + 모듈 import 시간 보고서 (stderr)")
+    parser.add_argument("--profile-out", help="pstats 파일 저장 경로 (--profile 과 함께)")
+    parser.add_argument("--profile-top", type=int, default=DEFAULT_PROFILE_TOP, help="보고서에 출력할 상위 항목 수")
+    parser.add_argument("--conf", default=os.path.join(base_dir, '.db_conn_conf.ini'), help="DB 설정파일 경로")
+    commands = parser.add_subparsers(dest="command", metavar="{" + ",".join(COMMANDS) + "}")
+
+    collect = commands.add_parser("collect", help="수집 -> 스풀 -> DB 저장 (기본)")
+    collect.add_argument("--refresh-targets", action="store_true", help="저장된 카테고리 목록 무시하고 재탐색")
+    collect.add_argument("--full", action="store_true", help="증분 상태, 조건부 GET(304) 무시하고 피드 내 모든 기사 저장")
+    collect.add_argument("--stream", action="store_true", help="스트리밍 모드 (수집하면서 batch 단위로 바로 DB 저장)")
+    collect.add_argument("--sites", nargs="?", const=os.path.join(base_dir, "sites.ini"),
+                         help="다중 사이트 수집 (사이트 설정파일 경로, 생략시 main.py 옆 sites.ini)")
+    collect.add_argument("--daemon", action="store_true", help="상주 실행 모드 (스케줄러로 수집/보관기간 정리 반복)")
+    collect.add_argument("--metrics-textfile", help="단계별 계측값 Prometheus textfile 저장 경로 (node_exporter textfile collector)")
+    collect.add_argument("--metrics-json", help="단계별 계측값 JSON 저장 경로")
+    collect.set_defaults(func=cmd_collect)
+
+    discover = commands.add_parser("discover", help="카테고리(피드) 목록 탐색 결과 출력")
+    discover.add_argument("--site", help="sites.ini 사이트 이름 (생략시 보안뉴스)")
+    discover.add_argument("--save", action="store_true", help="탐색 결과로 카테고리 목록 파일 갱신")
+    discover.set_defaults(func=cmd_discover)
+
+    drain = commands.add_parser("drain", help="로컬 스풀에 남은 기사만 DB 저장")
+    drain.add_argument("--site", help="해당 사이트 기사만 (생략시 전체)")
+    drain.set_defaults(func=cmd_drain)
+
+    # 옵션은 각 모듈 main() 이 해석 (python main.py purge --help)
+    commands.add_parser("purge", help="보관기간 지난 기사 batch 삭제", add_help=False).set_defaults(func=cmd_purge)
+    commands.add_parser("bench", help="오프라인 벤치마크", add_help=False).set_defaults(func=cmd_bench)
+    return parser
+
+
+def run(argv: list = None, base_dir: str = DEFAULT_BASE_DIR, collect = None) -> int :
+    '''
+    param argv : 인자 리스트 (None이면 sys.argv[1:]), 명령 없이 옵션만 있으면 collect 로 처리
+    param base_dir : main.py 위치 (설정, 캐시, 스풀, 로그 폴더 기준)
+    param collect : collect 명령이 호출할 함수 (main.main)
+    return : 종료코드
+    '''
+    argv = list(sys.argv[1:] if argv is None else argv)
+    parser = build_parser(base_dir)
+    if not any(arg in COMMANDS for arg in argv) and not any(arg in ("-h", "--help") for arg in argv) :
+        # 기존 cron 호출 호환 : python main.py [--full ...] -> collect [--full ...]
+        # 공용 옵션(--profile ...)은 명령 앞, 나머지는 collect 뒤로
+        globals_, rest = _split_global_options(argv)
+        argv = globals_ + ["collect"] + rest
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command not in PASSTHROUGH :
+        parser.error(f"알 수 없는 인자 : {' '.join(extra)}")
+    args.extra = extra
+    args.base_dir = base_dir
+    args.collect = collect
+    if args.profile :
+        return _run_profiled(args.func, args, args.profile_top, args.profile_out)
+    return args.func(args)
+
+
+def _split_global_options(argv: list) -> tuple :
+    '''argv -> (공용 옵션 인자, 나머지 인자)'''
+    globals_, rest = [], []
+    pos = 0
+    while pos < len(argv) :
+        arg = argv[pos]
+        if arg in GLOBAL_VALUE_OPTIONS and pos + 1 < len(argv) :
+            globals_ += argv[pos:pos + 2]
+            pos += 2
+            continue
+        name = arg.split("=", 1)[0]
+        (globals_ if name in GLOBAL_FLAGS or name in GLOBAL_VALUE_OPTIONS else rest).append(arg)
+        pos += 1
+    return globals_, rest
+
+
+if __name__ == "__main__" :
+    sys.exit(run())
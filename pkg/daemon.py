@@ -0,0 +1,145 @@
+"""daemon 모듈 : main.py --daemon 상주 실행 모드
+cron으로 매번 새 파이썬 프로세스 띄우면 라이브러리 import, 설정파일 읽기, DB 접속을 매번 반복함
+-> 프로세스 하나가 계속 떠서 캐시/상태/DB 커넥션 풀/HTTP 세션(keep-alive)을 유지한 채 스케줄러로 작업 반복
+
+작업
+    collect : tick 주기로 깨어나서 수집 주기가 도래한 카테고리만 수집 -> 로컬 스풀 기록 -> DB 저장
+              DB 장애시 기사는 스풀(.spool.sqlite)에 남아서 다음 주기에 재다운로드 없이 저장
+    purge   : 매일 purge_at 시각에 보관기간(retention_days) 지난 기사 batch 단위 삭제 (boannews_rss, 있으면 news_rss) (retention 모듈, clean_db.sh 역할)
+              batch 크기/대기/시간 예산은 설정파일 [retention] 섹션
+              직전 수집이 실패한 경우 run_rss.sh 와 같이 데이터 보호를 위해 건너뜀
+
+설정파일 [daemon] 섹션 선택 항목 (없으면 기본값)
+    interval = 600            ; 카테고리 기본 수집 주기(초)
+    interval.IT = 1800        ; 카테고리별 수집 주기 (interval.<카테고리 이름>)
+    tick = 60                 ; 수집 주기 확인 간격(초)
+    purge_at = 08:50          ; 매일 보관기간 정리 시각
+    retention_days = 14
+    metrics_port = 9108       ; 계측 HTTP 엔드포인트 포트 (/metrics, /metrics.json), 0 이면 사용 안함
+    metrics_host = 127.0.0.1
+    metrics_textfile = /var/lib/node_exporter/rss_collector.prom   ; 수집 주기마다 textfile 갱신 (선택)
+
+SIGTERM / SIGINT : 실행중 작업 마치고 캐시 저장, 커넥션 풀/스풀 닫은 뒤 종료
+"""
+
+import logging
+import os
+import signal
+import time
+
+from .db_conn import load_db_conf
+from .db_handler import MariaDBHandler
+from . import http_client
+from . import metrics
+from .http_cache import HttpCache
+from .rss_ps import run_collection
+from .scheduler import Scheduler, file_lock
+from .seen_state import SeenState
+from .spool import Spool
+from .target_registry import TargetRegistry
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_INTERVAL = 600
+DEFAULT_TICK = 60
+DEFAULT_PURGE_AT = "08:50"
+DEFAULT_RETENTION_DAYS = 14
+
+
+class CollectorDaemon :
+    '''
+    param base_dir : main.py 위치 (캐시, 상태, 잠금 파일 저장 폴더)
+    param conf_path : .db_conn_conf.ini 경로
+    '''
+    def __init__(self, base_dir: str, conf_path: str) :
+        self.config = load_db_conf(conf_path)
+        self.interval = self.config.getfloat('daemon', 'interval', fallback=DEFAULT_INTERVAL)
+        self.tick = self.config.getfloat('daemon', 'tick', fallback=DEFAULT_TICK)
+        self.purge_at = self.config.get('daemon', 'purge_at', fallback=DEFAULT_PURGE_AT)
+        self.retention_days = self.config.getint('daemon', 'retention_days',
+                                                 fallback=self.config.getint('retention', 'days',
+                                                                             fallback=DEFAULT_RETENTION_DAYS))
+        self.metrics_port = self.config.getint('daemon', 'metrics_port', fallback=0)
+        self.metrics_host = self.config.get('daemon', 'metrics_host', fallback="127.0.0.1")
+        self.metrics_textfile = self.config.get('daemon', 'metrics_textfile', fallback=None)
+
+        # 프로세스가 살아있는 동안 계속 재사용 (warm 상태 유지)
+        self.cache = HttpCache(os.path.join(base_dir, '.http_cache'))
+        self.registry = TargetRegistry(os.path.join(base_dir, '.rss_targets.json'))
+        self.state = SeenState(os.path.join(base_dir, '.seen_state.json'))
+        self.handler = MariaDBHandler(self.config)
+        self.spool = Spool(os.path.join(base_dir, '.spool.sqlite'))
+        self.lock_path = os.path.join(base_dir, '.collector.lock')
+
+        self._next_due: dict[str, float] = {}   # {카테고리: 다음 수집 시각}
+        self._last_collect_ok = True
+        self.scheduler = Scheduler()
+
+    def _interval_for(self, category: str) -> float :
+        # configparser 키는 소문자로 저장/조회됨 -> 카테고리 이름 대소문자 무관
+        return self.config.getfloat('daemon', f'interval.{category}', fallback=self.interval)
+
+    def _due_targets(self, targets: list) -> list :
+        '''수집 주기 도래한 카테고리만 선택하고 다음 수집 시각 갱신 (처음 보는 카테고리는 바로 수집)'''
+        now = time.time()
+        due = [t for t in targets if self._next_due.get(t['category'], 0) <= now]
+        for t in due :
+            self._next_due[t['category']] = now + self._interval_for(t['category'])
+        return due
+
+    def collect_job(self) -> None :
+        with file_lock(self.lock_path) as acquired :
+            if not acquired :
+                logger.warning("다른 수집 프로세스 실행중, 이번 주기 건너뜀")
+                return
+            start = time.perf_counter()
+            try :
+                list_news = run_collection(cache=self.cache, registry=self.registry, state=self.state,
+                                           select=self._due_targets)
+                # 스풀 기록 후 검증값/증분 상태 저장 -> DB 저장 실패해도 다음 주기에 스풀에서 이어서 저장
+                self.spool.append(list_news)
+                self.cache.save()
+                self.state.commit()
+                self.spool.drain(self.handler)
+                self._last_collect_ok = True
+            except Exception :
+                # 스풀 기록 전에 실패한 경우 저장 안된 검증값/증분 상태 버림 -> 다음 주기에 같은 기사 다시 받아서 저장 시도
+                # (스풀 기록 후 DB 저장만 실패한 경우는 이미 저장된 파일을 다시 읽으므로 영향 없음)
+                self.cache.reload()
+                self.state.reload()
+                self._last_collect_ok = False
+                raise
+            finally :
+                metrics.observe("run_seconds", time.perf_counter() - start)
+                metrics.set_gauge("last_run_success", 1 if self._last_collect_ok else 0)
+                metrics.set_gauge("last_run_timestamp_seconds", time.time())
+                metrics.export(textfile=self.metrics_textfile)
+
+    def purge_job(self) -> None :
+        if not self._last_collect_ok :
+            logger.warning("직전 수집 실패, 데이터 보호를 위해 보관기간 정리 건너뜀")
+            return
+        self.handler.purge_all(days=self.retention_days)   # boannews_rss + (있으면) 다중 사이트 news_rss
+
+    def _on_signal(self, signum, frame) -> None :
+        logger.info(f"종료 시그널 수신({signal.Signals(signum).name}), 실행중 작업 마치고 종료")
+        self.scheduler.stop()
+
+    def run(self) -> None :
+        signal.signal(signal.SIGTERM, self._on_signal)
+        signal.signal(signal.SIGINT, self._on_signal)
+        self.scheduler.every(self.tick, "collect", self.collect_job, run_now=True)
+        self.scheduler.daily(self.purge_at, "purge", self.purge_job)
+        logger.info(f"데몬 모드 시작 (기본 주기 {self.interval:.0f}s, 정리 {self.purge_at}, 보관 {self.retention_days}일)")
+        metrics_server = metrics.serve(self.metrics_port, self.metrics_host) if self.metrics_port else None
+        try :
+            self.scheduler.run_forever()
+        finally :
+            if metrics_server is not None :
+                metrics_server.shutdown()
+                metrics_server.server_close()
+            self.cache.save()
+            self.handler.close()
+            self.spool.close()
+            http_client.close_session()
+            logger.info("데몬 모드 정상 종료")
@@ -1,4 +1,3 @@
-import mariadb
 import logging
 import os
 import configparser
@@ -41,6 +40,7 @@ def get_connection(config, retries=3, delay=2):
     param config : 메인에서 load_db_conf()가 반환한 config : ConfigParser 객체
     return conn : connect()결과 생성된 연결 객체
     """
+    import mariadb   # 접속할 때만 import (설정파일 검증, 쿼리 생성만 쓰는 경로는 커넥터 로딩 안함)
     for i in range(retries) :
         try:
             conn = mariadb.connect(
@@ -59,6 +59,62 @@ def get_connection(config, retries=3, delay=2):
                 raise ConnectionError(f"DB접속 최종 실패({retries}회 시도)") from e
 
 
+NEWS_COLUMNS = 7   # 기본 뉴스 튜플 길이, 8번째 값이 있으면 description_full (요약 압축 원문)
+
+
+def merge_stored_categories(cursor, table_name : str, rows : list, site : str = None) -> list :
+    '''
+    이미 저장된 기사의 category 를 읽어서 새 값과 값 단위로 합친 튜플 리스트 반환 (upsert 직전, 같은 트랜잭션)
+    FIND_IN_SET() 은 첫 인자를 값 1개로 보기 때문에 "IT,SW" 같은 다중 값은 SQL 로 합치면 중복이 쌓임
+    -> dedup.merge_categories() 로 값마다 비교 ("보안,IT" + "IT,SW" -> "보안,IT,SW"), 같은 행 다시 저장해도 결과 같음
+    SELECT ... FOR UPDATE 로 읽은 행은 commit 까지 잠금 (읽고 쓰는 사이 다른 저장과 섞이지 않음)
+    param rows : 뉴스 튜플 리스트 (site 붙이기 전)
+    param site : 다중 사이트 공용 테이블이면 사이트 키
+    '''
+    from .dedup import CATEGORY, IDX, merge_categories
+    if not rows :
+        return rows
+    holders = ", ".join(["%s"] * len(rows))
+    params = [row[IDX] for row in rows]
+    where = f"idx IN ({holders})"
+    if site is not None :
+        where = "site = %s AND " + where
+        params = [site] + params
+    cursor.execute(f"SELECT idx, category FROM {table_name} WHERE {where} FOR UPDATE", params)
+    stored = {idx : category for idx, category in cursor.fetchall() if category}
+    if not stored :
+        return rows
+    return [row[:CATEGORY] + (merge_categories(stored[row[IDX]], row[CATEGORY]),) + row[CATEGORY + 1:]
+            if row[IDX] in stored else row for row in rows]
+
+
+def build_upsert_sql(table_name : str = "boannews_rss", with_site : bool = False, with_full : bool = False) -> str :
+    '''
+    뉴스 튜플 (idx, title, link, creator, written_dt, description, category) upsert 쿼리 생성
+    insert_news_many(), db_handler.MariaDBHandler 공용
+    category 는 "보안,IT" 형태 다중 값 (dedup 모듈) -> 기존 값과 합치는 건 merge_stored_categories() 가 먼저 수행
+        쿼리는 합쳐진 값으로 덮어씀 (빈 값이 들어오면 기존 값 유지)
+    param with_site : True면 다중 사이트 공용 테이블(news_rss)용, 튜플 맨 앞에 site 컬럼 추가 (키 : site + idx)
+    param with_full : True면 튜플 맨 뒤 description_full 컬럼 추가 (sources 어댑터 description_full 설정)
+    '''
+    site_col, site_val = ("site, ", "%s, ") if with_site else ("", "")
+    full_col, full_val, full_set = (", description_full", ", %s",
+                                    "\n        description_full = VALUES(description_full),") if with_full else ("", "", "")
+    return f"""
+    INSERT INTO {table_name} (
+{site_col}idx, title, link, creator, written_dt, description, category{full_col}
+    ) VALUES ({site_val}%s, %s, %s, %s, %s, %s, %s{full_val})
+    ON DUPLICATE KEY UPDATE
+        title = VALUES(title),
+        link = VALUES(link),
+        creator = VALUES(creator),
+        written_dt = VALUES(written_dt),
+        description = VALUES(description),{full_set}
+        category = CASE WHEN VALUES(category) IS NULL OR VALUES(category) = '' THEN category ELSE VALUES(category) END,
+        save_at = CURRENT_TIMESTAMP        
+    """
+
+
 def insert_news_many(conn, data_list : list, table_name : str = "boannews_rss") :
     '''
     대량 뉴스 데이터 한번에 Mariadb서버에 저장
@@ -69,6 +125,7 @@ def insert_news_many(conn, data_list : list, table_name : str = "boannews_rss")
     
     param conn : get_connection()으로 생성한 연결 객체
     param data_list : rss_ps모듈에 parse_feed()에서 만든 리스트[튜플묶음]
+    Raises : 드라이버 에러 그대로 (rollback 후 전파)
     '''
     sql: str=" "
     
@@ -76,28 +133,17 @@ def insert_news_many(conn, data_list : list, table_name : str = "boannews_rss")
         logger.warning("저장 데이터가 없음 작업 중단")
         return
     
-    sql = f"""
-    INSERT INTO {table_name} (
-idx, title, link, creator, written_dt, description, category
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-    ON DUPLICATE KEY UPDATE
-        title = VALUES(title),
-        link = VALUES(link),
-        creator = VALUES(creator),
-        written_dt = VALUES(written_dt),
-        description = VALUES(description),
-        category = VALUES(category),
-        save_at = CURRENT_TIMESTAMP        
-    """
+    sql = build_upsert_sql(table_name, with_full=len(data_list[0]) > NEWS_COLUMNS)
     
     try :
         # with문 : 커서 생성 ~ 자동 닫기(with블록 벗어날때)
         with conn.cursor() as cursor :
-            cursor.executemany(sql, data_list)
+            cursor.executemany(sql, merge_stored_categories(cursor, table_name, data_list))
             conn.commit()
             logger.info(f"DB에 데이터 저장 완료")
             
-    except mariadb.Error as e:
+    except Exception as e:
+        # 에러 종류는 드라이버마다 다름 (mariadb.Error, 벤치마크 sqlite 대역 sqlite3.Error) -> 커넥터 import 없이 전부 rollback
         conn.rollback()
         logger.error(f"데이터 일괄 저장 중 오류 발생으로 rollback 수행 : {e}")
         raise e
@@ -2,10 +2,241 @@
 기존 db_conn.py의 함수들을 MariaDBHandler 클래스화
 기능 확장시 코드 재사용성, DB연결,해제,삽입,설정로드 등 응집 측면에서 유용함
 
+- 연결 : mariadb.ConnectionPool 사용, 매 작업마다 새로 접속하지 않고 풀에서 빌려쓰고 반납
+- 재연결 : 접속/통신 실패시 지수 백오프(1s, 2s, 4s ... 최대 max_delay) + 지터로 재시도 -> 동시 재접속 폭주 방지
+- 저장 : batch_size 단위로 나눠서 chunk마다 commit -> 거대한 트랜잭션 방지, 실패 chunk만 재시도
+- 통계 : 저장 건수, chunk 수, 재시도 횟수, 초당 처리 건수 (metrics 모듈 stage_seconds{stage="db"}, db_rows_total 에도 기록)
+
+설정파일 [mariadb] 섹션 선택 항목 (없으면 기본값)
+    pool_size = 3
+    batch_size = 500
 """
 
 import mariadb
 import logging
 import os
+import random
 import time
 
+from . import metrics
+from . import retention
+from .db_conn import load_db_conf, build_upsert_sql, merge_stored_categories, NEWS_COLUMNS
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_POOL_SIZE = 3
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_RETRIES = 5
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+
+# 연결 끊김, 서버 재시작 등 다시 시도하면 성공 가능한 에러만 재시도 (문법/제약조건 에러는 바로 전파)
+TRANSIENT_ERRORS = (mariadb.OperationalError, mariadb.InterfaceError, mariadb.PoolError)
+
+
+class MariaDBHandler :
+    '''
+    param config : load_db_conf()가 반환한 ConfigParser 객체
+    param pool_size : 커넥션 풀 크기 (None이면 설정파일 pool_size, 없으면 기본값)
+    param batch_size : upsert chunk 크기 (None이면 설정파일 batch_size, 없으면 기본값)
+    param retries : 접속/chunk 저장 최대 시도 횟수
+    param base_delay, max_delay : 지수 백오프 시작/최대 대기(초)
+    '''
+    def __init__(self, config, pool_size: int = None, batch_size: int = None, retries: int = DEFAULT_RETRIES,
+                 base_delay: float = DEFAULT_BASE_DELAY, max_delay: float = DEFAULT_MAX_DELAY,
+                 pool_name: str = "rss_collector") :
+        self.config = config
+        self.pool_size = pool_size or config.getint('mariadb', 'pool_size', fallback=DEFAULT_POOL_SIZE)
+        self.batch_size = batch_size or config.getint('mariadb', 'batch_size', fallback=DEFAULT_BATCH_SIZE)
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.pool_name = pool_name
+        self._pool = None
+        self.stats = {"rows": 0, "chunks": 0, "retries": 0, "elapsed": 0.0}
+
+    @classmethod
+    def from_conf_path(cls, conf_path: str, **kwargs) :
+        '''설정파일 경로로 바로 생성 (load_db_conf() 검증 재사용)'''
+        return cls(load_db_conf(conf_path), **kwargs)
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self, exc_type, exc, tb) :
+        self.close()
+
+    def _conn_params(self) -> dict :
+        conf = self.config['mariadb']
+        return {
+            "user": conf['user'],
+            "password": conf['password'].strip("'").strip(),  # 따옴표,공백 제거
+            "host": conf['host'],
+            "port": int(conf['port']),
+            "database": conf['database'],
+        }
+
+    def _backoff(self, attempt: int) -> None :
+        '''attempt번째 실패 후 대기 : base_delay * 2^attempt (최대 max_delay) + 지터'''
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt)) + random.uniform(0, self.base_delay)
+        self.stats["retries"] += 1
+        metrics.inc("db_retries_total")
+        time.sleep(delay)
+
+    def _ensure_pool(self) :
+        if self._pool is not None :
+            return self._pool
+        for i in range(self.retries) :
+            try :
+                self._pool = mariadb.ConnectionPool(pool_name=self.pool_name, pool_size=self.pool_size,
+                                                    **self._conn_params())
+                logger.info(f"DB 커넥션 풀 생성 (pool_size={self.pool_size})")
+                return self._pool
+            except mariadb.Error as e :
+                if i < (self.retries - 1) :
+                    logger.warning(f"DB 커넥션 풀 생성 실패({i + 1}/{self.retries}) 재시도 : {e}")
+                    self._backoff(i)
+                else :
+                    logger.error(f"연결 가능한 접속 시도 횟수 초과")
+                    raise ConnectionError(f"DB접속 최종 실패({self.retries}회 시도)") from e
+
+    def get_connection(self) :
+        '''
+        풀에서 연결 빌려오기 (사용 후 conn.close() 하면 풀로 반납)
+        풀이 비어있거나 연결 실패시 백오프 재시도
+        '''
+        pool = self._ensure_pool()
+        for i in range(self.retries) :
+            try :
+                conn = pool.get_connection()
+                if conn is None :
+                    raise mariadb.PoolError("풀에 사용 가능한 연결 없음")
+                try :
+                    conn.ping()   # 풀에 남아있던 끊긴 연결 걸러냄
+                except mariadb.Error :
+                    conn.close()
+                    raise
+                return conn
+            except mariadb.Error as e :
+                if i < (self.retries - 1) :
+                    logger.warning(f"풀 연결 획득 실패({i + 1}/{self.retries}) 재시도 : {e}")
+                    self._backoff(i)
+                else :
+                    raise ConnectionError(f"DB 풀 연결 획득 최종 실패({self.retries}회 시도)") from e
+
+    def _write_chunk(self, sql: str, chunk: list, table_name: str, site: str = None) -> None :
+        '''
+        chunk 하나 기존 category 합치기 + executemany + commit, 일시적 에러는 재연결 후 재시도 (upsert라 재실행해도 안전)
+        param site : 공용 테이블 저장시 사이트 키, 튜플 맨 앞에 붙여서 저장
+        '''
+        for i in range(self.retries) :
+            conn = self.get_connection()
+            try :
+                with conn.cursor() as cursor :
+                    rows = merge_stored_categories(cursor, table_name, chunk, site=site)
+                    if site is not None :
+                        rows = [(site,) + row for row in rows]
+                    cursor.executemany(sql, rows)
+                conn.commit()
+                return
+            except TRANSIENT_ERRORS as e :
+                try :
+                    conn.rollback()
+                except mariadb.Error :
+                    pass   # 연결 자체가 끊긴 경우 rollback도 실패, 서버쪽에서 트랜잭션 폐기됨
+                if i < (self.retries - 1) :
+                    logger.warning(f"chunk 저장 실패({i + 1}/{self.retries}) 재연결 후 재시도 : {e}")
+                    self._backoff(i)
+                else :
+                    logger.error(f"chunk 저장 재시도 횟수 초과 : {e}")
+                    raise
+            except mariadb.Error as e :
+                conn.rollback()
+                logger.error(f"데이터 일괄 저장 중 오류 발생으로 rollback 수행 : {e}")
+                raise
+            finally :
+                conn.close()   # 풀로 반납
+
+    def upsert_news(self, data_list: list, table_name: str = "boannews_rss", site: str = None) -> int :
+        '''
+        뉴스 튜플 리스트를 batch_size 단위로 나눠 upsert, chunk마다 commit
+        param data_list : rss_ps.parse_feed()에서 만든 리스트[튜플묶음]
+        param site : 다중 사이트 공용 테이블(news_rss) 저장시 사이트 키, 튜플 맨 앞에 붙여서 저장
+        return : 저장 요청한 행 수
+        '''
+        if not data_list :
+            logger.warning("저장 데이터가 없음 작업 중단")
+            return 0
+
+        sql = build_upsert_sql(table_name, with_site=site is not None, with_full=len(data_list[0]) > NEWS_COLUMNS)
+        start = time.perf_counter()
+        for pos in range(0, len(data_list), self.batch_size) :
+            chunk = data_list[pos:pos + self.batch_size]
+            self._write_chunk(sql, chunk, table_name, site=site)
+            self.stats["chunks"] += 1
+            self.stats["rows"] += len(chunk)
+        elapsed = time.perf_counter() - start
+        self.stats["elapsed"] += elapsed
+        metrics.observe("stage_seconds", elapsed, stage="db")
+        metrics.inc("db_rows_total", len(data_list), table=table_name)
+        logger.info(f"DB에 데이터 저장 완료 : {len(data_list)}건 ({self.summary()})")
+        return len(data_list)
+
+    def purge_expired(self, table_name: str = "boannews_rss", days: int = None) -> int :
+        '''
+        보관기간(days) 지난 기사 기본키 batch 단위 삭제 (retention.purge_expired(), 설정파일 [retention] 섹션 적용)
+        param days : None이면 설정파일 [retention] days
+        return : 삭제된 행 수
+        '''
+        policy = retention.load_policy(self.config)
+        if days is not None :
+            policy["days"] = days
+        conn = self.get_connection()
+        try :
+            return retention.purge_expired(conn, table_name=table_name, **policy)["deleted"]
+        except mariadb.Error as e :
+            logger.error(f"보관기간 경과 데이터 삭제 실패 : {e}")
+            raise
+        finally :
+            conn.close()
+
+    def purge_all(self, days: int = None) -> int :
+        '''
+        retention.DEFAULT_TABLES 중 DB에 있는 테이블 전부 purge_expired() (다중 사이트 공용 테이블 news_rss 포함)
+        return : 삭제된 행 수 합계
+        '''
+        conn = self.get_connection()
+        try :
+            tables = retention.existing_tables(conn)
+        finally :
+            conn.close()
+        return sum(self.purge_expired(table_name=table, days=days) for table in tables)
+
+    def rows_per_sec(self) -> float :
+        return self.stats["rows"] / self.stats["elapsed"] if self.stats["elapsed"] else 0.0
+
+    def summary(self) -> str :
+        return (f"누적 {self.stats['rows']}건, chunk {self.stats['chunks']}개, "
+                f"재시도 {self.stats['retries']}회, {self.rows_per_sec():.1f} rows/s")
+
+    def close(self) -> None :
+        if self._pool is not None :
+            self._pool.close()
+            self._pool = None
+            logger.info("db 커넥션 풀 안전하게 닫힘")
+
+
+if __name__ == "__main__" :
+    current_dir_path = os.path.dirname(os.path.abspath(__file__))
+    test_conf_path = os.path.join(os.path.dirname(current_dir_path), ".db_conn_conf.ini")
+    try :
+        with MariaDBHandler.from_conf_path(test_conf_path, batch_size=1) as handler :
+            test_data = [
+                (999999, "테스트 제목 1", "https://t.com/1", "관리자", "2026-01-15 10:00:00", "내용1", "TEST"),
+                (999998, "테스트 제목 2", "https://t.com/2", "관리자", "2026-01-15 10:00:00", "내용2", "TEST")
+            ]
+            print("[*] chunk 단위 데이터 삽입 시도 중...")
+            handler.upsert_news(test_data, table_name="test_news_tb")
+            print(f"[+] 테스트 성공: {handler.summary()}")
+    except Exception as e :
+        print(f"[-] 테스트 실패: {e}")
@@ -0,0 +1,51 @@
+"""dedup 모듈 : DB 저장 전 카테고리 간 중복 기사 병합
+같은 기사가 여러 카테고리 피드에 동시에 실림 -> 카테고리별 리스트를 그대로 합치면 같은 idx 가 여러번 upsert
+    - executemany 데이터 중복, 같은 행 잠금 반복
+    - category 컬럼은 마지막에 저장된 카테고리만 남음
+dedup_rows() : idx 기준으로 기사 1건만 남기고 category 는 "보안,IT" 처럼 합친 다중 값으로
+    같은 idx 인데 내용(제목, 링크, 작성자, 날짜, 요약) 해시가 다르면 먼저 나온(카테고리 목록 순서) 기사 내용 유지
+실행 사이에 다른 카테고리로 다시 들어온 기사는 upsert 직전에 저장된 category 값과 합침 (db_conn.merge_stored_categories)
+"""
+
+import logging
+
+from . import metrics
+from .seen_state import entry_digest
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+CATEGORY_SEP = ","   # MariaDB FIND_IN_SET() 검색 구분자와 같아야 함
+IDX, CATEGORY = 0, 6  # 뉴스 튜플 (idx, title, link, creator, written_dt, description, category) 위치
+
+
+def merge_categories(current: str, extra: str) -> str :
+    '''"보안" + "IT,보안" -> "보안,IT" (순서 유지, 중복 제거)'''
+    values = current.split(CATEGORY_SEP) if current else []
+    for value in extra.split(CATEGORY_SEP) if extra else [] :
+        if value and value not in values :
+            values.append(value)
+    return CATEGORY_SEP.join(values)
+
+
+def dedup_rows(rows: list) -> list :
+    '''
+    param rows : 뉴스 튜플 리스트 (카테고리 순서대로 합친 것)
+    return : idx 당 1건, 처음 나온 순서 유지, category 병합
+    '''
+    merged: dict[int, tuple] = {}
+    duplicates = conflicts = 0
+    for row in rows :
+        idx = row[IDX]
+        first = merged.get(idx)
+        if first is None :
+            merged[idx] = row
+            continue
+        duplicates += 1
+        if entry_digest(*first[1:CATEGORY]) != entry_digest(*row[1:CATEGORY]) :
+            conflicts += 1   # 피드마다 요약 길이 등이 다른 경우, 첫번째 내용 유지
+        merged[idx] = first[:CATEGORY] + (merge_categories(first[CATEGORY], row[CATEGORY]),) + first[CATEGORY + 1:]
+    if duplicates :
+        metrics.inc("dedup_rows_total", duplicates)
+        logger.info(f"중복 기사 {duplicates}건 병합 ({len(rows)}건 -> {len(merged)}건"
+                    f"{f', 내용 다른 중복 {conflicts}건은 첫번째 유지' if conflicts else ''})")
+    return list(merged.values())
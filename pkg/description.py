@@ -0,0 +1,78 @@
+"""description 모듈 : 기사 요약(description) 정리 + 길이 제한
+피드 summary 는 html 조각(<p>, <img>, 엔티티)이 섞인 원문 -> 그대로 저장하면 executemany 데이터, 테이블 크기 증가
+compact()  : 태그 제거 -> 엔티티 변환 -> 공백 정리 -> max_chars 글자로 자르기
+             keep_full=True 면 원문 전체를 zlib 압축한 bytes 도 함께 반환 (description_full 컬럼 저장용)
+             같은 원문은 sha1 해시 기준 LRU 캐시 재사용 (데몬 모드에서 매 주기 같은 기사 다시 처리하지 않음)
+             증분 모드(SeenState)에서는 변경없는 기사가 이 단계 전에 이미 걸러짐
+expand()   : 압축 원문 복원
+"""
+
+import hashlib
+import html
+import re
+import threading
+import zlib
+from collections import OrderedDict
+
+DEFAULT_MAX_CHARS = 500     # 0 이면 자르지 않음 (태그/공백 정리만)
+DEFAULT_CACHE_SIZE = 8192
+ELLIPSIS = "…"
+
+_SCRIPT = re.compile(r"<(script|style)\b.*?</\1\s*>", re.I | re.S)
+_TAG = re.compile(r"<[^>]*>")
+_SPACE = re.compile(r"\s+")
+
+_lock = threading.Lock()
+_cache: OrderedDict = OrderedDict()   # {(원문 sha1, max_chars, keep_full): (text, blob)}
+
+
+def strip_markup(raw: str) -> str :
+    '''html 조각 -> 한 줄 평문 (script/style 내용 제거, 태그 자리는 공백)'''
+    if "<" in raw :
+        raw = _TAG.sub(" ", _SCRIPT.sub(" ", raw))
+    if "&" in raw :
+        raw = html.unescape(raw)
+    return _SPACE.sub(" ", raw).strip()
+
+
+def truncate(text: str, max_chars: int) -> str :
+    '''max_chars 글자 초과시 마지막 공백에서 자르고 "…" (공백이 너무 앞이면 글자 단위)'''
+    if not max_chars or len(text) <= max_chars :
+        return text
+    cut = text[:max_chars - len(ELLIPSIS)]
+    space = cut.rfind(" ")
+    if space > len(cut) * 0.8 :
+        cut = cut[:space]
+    return cut.rstrip() + ELLIPSIS
+
+
+def compact(raw: str, max_chars: int = DEFAULT_MAX_CHARS, keep_full: bool = False) -> tuple :
+    '''
+    return : (정리된 text, 압축 원문 bytes 또는 None, 캐시 적중 여부)
+    '''
+    key = (hashlib.sha1(raw.encode("utf-8")).digest(), max_chars, keep_full)
+    with _lock :
+        value = _cache.get(key)
+        if value is not None :
+            _cache.move_to_end(key)
+            return value[0], value[1], True
+    text = truncate(strip_markup(raw), max_chars)
+    blob = zlib.compress(raw.encode("utf-8")) if keep_full else None
+    with _lock :
+        _cache[key] = (text, blob)
+        if len(_cache) > DEFAULT_CACHE_SIZE :
+            _cache.popitem(last=False)
+    return text, blob, False
+
+
+def expand(blob: bytes) -> str :
+    '''description_full 컬럼 값 -> 원문'''
+    return zlib.decompress(blob).decode("utf-8") if blob else ""
+
+
+if __name__ == "__main__" :
+    sample = ('<p>국내 제조업체를 노린 <b>랜섬웨어</b> 공격&nbsp;정황이   포착됐다.</p>'
+              '<img src="https://www.boannews.com/img/1.jpg"><script>var a = 1;</script>' + " 본문" * 400)
+    text, blob, hit = compact(sample, max_chars=80, keep_full=True)
+    print(repr(text), len(sample.encode()), "->", len(text.encode()), f"(압축 원문 {len(blob)} bytes)")
+    print(compact(sample, max_chars=80, keep_full=True)[2], expand(blob) == sample)
@@ -0,0 +1,187 @@
+"""fastfeed 모듈 : 형식 알려진 피드용 가벼운 xml 파서 (feedparser 대체 빠른 경로)
+feedparser.parse() 는 인코딩 추정, html 정화(sanitize), 모든 태그의 FeedParserDict 생성까지 수행
+-> 수집기가 쓰는 필드는 제목, 링크, 작성자, 날짜, 요약 뿐
+
+parse_entries()  : xml.etree iterparse 로 기사(item/entry) 하나씩 읽어서 필요한 필드만 FastEntry 로 반환
+                   기사 처리 끝난 element 는 바로 비워서 대용량 피드도 트리 전체를 메모리에 올리지 않음
+    RSS 2.0 / RSS 1.0(RDF) : item - title, link, author|dc:creator, pubDate|dc:date, description
+    Atom                   : entry - title, link[rel=alternate], author/name, published|updated, summary|content
+                   expat 이 직접 못읽는 인코딩(euc-kr, cp949 등 멀티바이트) 선언 문서는 먼저 utf-8 로 바꿔서 파싱
+load_entries()   : parse_entries() 실패시(깨진 xml, 모르는 형식, 디코딩 안되는 본문) feedparser 로 다시 파싱
+                   -> 항상 기사 목록 반환
+
+FastEntry 는 feedparser 기사 객체처럼 entry.title / entry.get('summary') 로 접근 (iter_feed, 어댑터 코드 그대로 사용)
+차이점 : summary 는 원문 그대로 (feedparser 의 html 정화 없음)
+"""
+
+import codecs
+import io
+import logging
+import re
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+BACKENDS = ("fast", "feedparser")
+
+# xml 선언 인코딩 (문서 맨 앞만 검사)
+_XML_DECL = re.compile(rb"""^(\s*<\?xml[^>]*?encoding\s*=\s*["'])([A-Za-z][\w.:-]*)(["'])""")
+# expat 이 직접 읽는 인코딩 (그대로 전달)
+_EXPAT_CODECS = {"utf-8", "utf-16", "latin-1", "ascii"}
+
+_ITEM_TAGS = {"item", "entry"}
+_FEED_TAGS = {"rss", "RDF", "feed"}
+# 로컬 태그 이름 -> FastEntry 필드 (먼저 나온 값 우선)
+_FIELDS = {
+    "title": "title",
+    "author": "author",
+    "creator": "author",
+    "pubDate": "published",
+    "published": "published",
+    "date": "published",
+    "updated": "published",
+    "description": "summary",
+    "summary": "summary",
+    "content": "summary",
+}
+
+
+class FastParseError(ValueError) :
+    '''빠른 경로로 파싱 불가 (feedparser 로 대체)'''
+
+
+class FastEntry(dict) :
+    '''feedparser 기사 객체와 같은 방식(속성/get)으로 접근하는 dict, 없는 속성은 AttributeError'''
+    __slots__ = ()
+
+    def __getattr__(self, name) :
+        try :
+            return self[name]
+        except KeyError :
+            raise AttributeError(name) from None
+
+
+def _local(tag: str) -> str :
+    # "{http://purl.org/dc/elements/1.1/}creator" -> "creator"
+    return tag.rsplit("}", 1)[-1] if tag[:1] == "{" else tag
+
+
+def _iso_parsed(raw: str) :
+    '''Atom 날짜(ISO 8601) -> feedparser 와 같은 UTC struct_time (실패시 None)'''
+    try :
+        value = datetime.fromisoformat(raw.strip().replace("Z", "+00:00"))
+    except ValueError :
+        return None
+    if value.tzinfo is None :
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).timetuple()
+
+
+def _to_utf8(content: bytes) -> bytes :
+    '''
+    선언 인코딩이 expat 미지원(euc-kr, cp949 ...)이면 본문 디코딩 -> utf-8 재인코딩 + 선언을 utf-8 로 교체
+    국내 사이트 피드는 euc-kr 선언이 흔함 -> 매번 feedparser 로 대체하지 않도록
+    Raises : FastParseError (모르는 인코딩 이름, 선언과 다른 본문)
+    '''
+    m = _XML_DECL.match(content[:256])
+    if m is None :
+        return content
+    name = m.group(2).decode("ascii")
+    try :
+        codec = codecs.lookup(name).name
+    except LookupError as e :
+        raise FastParseError(f"알 수 없는 인코딩 {name}") from e
+    if codec in _EXPAT_CODECS or codec.startswith("utf-16") :
+        return content
+    try :
+        text = content[m.end():].decode(codec)
+    except UnicodeDecodeError as e :
+        raise FastParseError(f"{name} 디코딩 실패 : {e}") from e
+    return m.group(1) + b"utf-8" + m.group(3) + text.encode("utf-8")
+
+
+def _entry_from(elem) -> FastEntry :
+    entry = FastEntry()
+    for child in elem :
+        name = _local(child.tag)
+        if name == "link" :
+            # RSS : <link>주소</link> / Atom : <link rel="alternate" href="주소"/>
+            href = child.get("href")
+            if href is None :
+                if child.text and "link" not in entry :
+                    entry["link"] = child.text.strip()
+            elif child.get("rel", "alternate") == "alternate" or "link" not in entry :
+                entry["link"] = href.strip()
+            continue
+        field = _FIELDS.get(name)
+        if field is None or field in entry :
+            continue
+        if name == "author" and len(child) :
+            # Atom : <author><name>이름</name></author>
+            text = next((c.text for c in child if _local(c.tag) == "name"), None)
+        else :
+            text = child.text
+        if text is not None :
+            entry[field] = text
+    if "published" in entry and "T" in entry["published"] :
+        parsed = _iso_parsed(entry["published"])
+        if parsed is not None :
+            entry["published_parsed"] = parsed
+    return entry
+
+
+def parse_entries(content: bytes) -> list :
+    '''
+    피드 xml bytes -> [FastEntry] (문서 순서)
+    Raises : FastParseError (xml 문법 오류, rss/rdf/feed 가 아닌 문서, 디코딩 안되는 본문)
+    '''
+    content = _to_utf8(content)
+    entries = []
+    parents = []   # 열린 element 스택 (처리 끝난 기사를 부모에서 떼어내기 위해)
+    try :
+        for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")) :
+            if event == "start" :
+                if not parents and _local(elem.tag) not in _FEED_TAGS :
+                    raise FastParseError(f"피드 문서 아님 (최상위 태그 {_local(elem.tag)})")
+                parents.append(elem)
+                continue
+            parents.pop()
+            if _local(elem.tag) in _ITEM_TAGS :
+                entries.append(_entry_from(elem))
+                elem.clear()
+                if parents :
+                    parents[-1].remove(elem)   # 채널에 처리 끝난 기사 누적 방지
+    except ET.ParseError as e :
+        raise FastParseError(str(e)) from e
+    except FastParseError :
+        raise
+    except ValueError as e :
+        # _to_utf8() 가 못바꾼 멀티바이트 인코딩 ("multi-byte encodings are not supported")
+        raise FastParseError(str(e)) from e
+    return entries
+
+
+def load_entries(content: bytes, backend: str = "fast", label: str = "") -> list :
+    '''
+    피드 기사 목록 (backend="fast" 면 parse_entries(), 실패시 feedparser)
+    param label : 대체 경고 로그용 카테고리 이름
+    '''
+    if backend == "fast" :
+        try :
+            return parse_entries(content)
+        except FastParseError as e :
+            logger.warning(f"[{label}] 빠른 파서 실패, feedparser 로 대체 : {e}")
+    import feedparser   # 대체 경로에서만 import (빠른 경로만 쓰는 실행은 feedparser 로딩 비용 없음)
+    return feedparser.parse(content).entries
+
+
+if __name__ == "__main__" :
+    sample = (b'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>t</title>'
+              b'<item><title>A &amp; B</title><link>https://www.boannews.com/media/view.asp?idx=1</link>'
+              b'<description><![CDATA[<p>html</p>]]></description><pubDate>Mon, 13 Oct 2026 10:00:00 +0900</pubDate>'
+              b'</item></channel></rss>')
+    start = time.perf_counter()
+    print(parse_entries(sample), f"{(time.perf_counter() - start) * 1e3:.2f}ms")
+    print(load_entries(b"<rss><channel><item><title>broken</channel>", label="test"))
@@ -0,0 +1,214 @@
+"""fetcher 모듈 : 카테고리별 rss.xml 동시 다운로드 엔진
+fetch_all()      : 스레드풀로 여러 카테고리 xml 문서를 병렬 다운로드 -> 원본 bytes 결과 리스트 반환
+iter_fetched()   : fetch_all()의 generator 버전, 다운로드 끝난 순서대로 결과 하나씩 yield
+fetch_url()      : 단일 url 다운로드 (통신 부분만 담당, 파싱은 rss_ps.parse_feed()에서)
+                   HttpCache 전달시 조건부 GET, 304 응답이면 결과 not_modified=True
+                   검증값은 결과 dict(etag, last_modified)로만 돌려줌 -> 파싱 끝낸 호출부에서 cache.store(url, 결과)
+                   (deadline 초과로 버려진 응답의 검증값은 캐시에 남지 않음)
+
+- workers   : 동시에 실행되는 다운로드 스레드 수
+- per_host  : 같은 호스트에 동시에 붙는 연결 수 제한 (서버 부하, 차단 방지)
+- rate_limit: 같은 호스트에 초당 보내는 요청 수 제한 (다중 사이트 수집시 사이트별 설정)
+- deadline  : 전체 다운로드 마감 시간(초), 초과한 카테고리는 실패 처리하고 나머지 결과만 반환
+
+Raises: 개별 카테고리 실패는 결과 dict의 error에 기록, 예외를 밖으로 던지지 않음
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+import requests
+from . import http_cache
+from . import http_client
+from . import metrics
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_PER_HOST = 2
+DEFAULT_DEADLINE = 30   # 전체 다운로드 마감(초)
+DEFAULT_TIMEOUT = 10    # 요청 1건 타임아웃(초)
+
+
+class HostLimiter :
+    '''
+    호스트별 동시 연결 수 제한 : 호스트 이름마다 세마포어 하나씩 생성해서 공유
+    호스트별 요청 간격 제한 : rate 지정시 같은 호스트 요청 시작 간격을 1/rate 초 이상으로 유지
+    param per_host : 호스트당 최대 동시 연결 수
+    param rate : 호스트당 초당 최대 요청 수 (None이면 제한 없음)
+    '''
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, rate: float = None) :
+        self.per_host = max(1, per_host)
+        self.min_interval = 1.0 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._sems: dict[str, threading.BoundedSemaphore] = {}
+        self._next_at: dict[str, float] = {}
+
+    def wait_turn(self, url: str) -> None :
+        '''rate 제한 : 이 호스트의 다음 요청 가능 시각까지 대기 (순서표 발급 방식, 대기는 lock 밖에서)'''
+        if not self.min_interval :
+            return
+        host = urlparse(url).netloc.lower()
+        with self._lock :
+            now = time.monotonic()
+            start_at = max(now, self._next_at.get(host, now))
+            self._next_at[host] = start_at + self.min_interval
+        if start_at > now :
+            time.sleep(start_at - now)
+
+    def get(self, url: str) -> threading.BoundedSemaphore :
+        host = urlparse(url).netloc.lower()
+        with self._lock :
+            if host not in self._sems :
+                self._sems[host] = threading.BoundedSemaphore(self.per_host)
+            return self._sems[host]
+
+
+def fetch_url(url: str, timeout: float = DEFAULT_TIMEOUT, cache: http_cache.HttpCache = None) -> dict :
+    '''
+    url 하나 다운로드 (xml 인코딩 판단은 feedparser에 맡김)
+    param url : 카테고리 rss.xml 주소
+    param timeout : 요청 타임아웃(초)
+    param cache : HttpCache (None이면 매번 전체 다운로드)
+    return : http_cache.fetch() 결과 {'content': bytes, 'encoding', 'not_modified': bool, 'etag', 'last_modified'}
+    '''
+    return http_cache.fetch(url, cache=cache, timeout=timeout, store=False)
+
+
+def _fetch_one(target: dict, limiter: HostLimiter, timeout: float, deadline_at: float,
+               cache: http_cache.HttpCache = None) -> dict :
+    '''
+    스레드풀 작업 단위 : 호스트 슬롯 확보 -> 남은 마감시간 안에서 다운로드 -> 결과 dict 반환
+    '''
+    result = {"target": target, "content": None, "not_modified": False, "error": None, "elapsed": 0.0,
+              "encoding": None, "etag": None, "last_modified": None}
+    sem = limiter.get(target['url'])
+    with sem :
+        limiter.wait_turn(target['url'])
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0 :
+            result["error"] = "deadline 초과 (다운로드 시작 전)"
+            return result
+        start = time.perf_counter()
+        try :
+            fetched = fetch_url(target['url'], timeout=min(timeout, remaining), cache=cache)
+            for key in ("content", "not_modified", "encoding", "etag", "last_modified") :
+                result[key] = fetched[key]
+        except requests.exceptions.RequestException as e :
+            result["error"] = str(e)
+        result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def _log_result(result: dict) -> None :
+    category = result["target"]['category']
+    metrics.observe("fetch_seconds", result["elapsed"], category=category)
+    if result["error"] :
+        metrics.inc("fetch_errors_total", category=category)
+        logger.warning(f"[{category}] 다운로드 실패 : {result['error']}")
+    elif result["not_modified"] :
+        logger.info(f"[{category}] 304 변경없음 {result['elapsed']:.2f}s")
+    else :
+        logger.info(f"[{category}] 다운로드 {result['elapsed']:.2f}s ({len(result['content'])} bytes)")
+
+
+def iter_fetched(targets: list, workers: int = DEFAULT_WORKERS, per_host: int = DEFAULT_PER_HOST,
+                 deadline: float = DEFAULT_DEADLINE, timeout: float = DEFAULT_TIMEOUT,
+                 cache: http_cache.HttpCache = None, rate_limit: float = None) :
+    '''
+    카테고리 목록 전체를 병렬 다운로드하면서 끝난 순서대로 결과 yield
+    1. 카테고리마다 _fetch_one() 작업을 스레드풀에 제출
+    2. deadline 까지 완료된 작업부터 차례로 yield, 남은 작업은 error="deadline 초과"로 yield (부분 결과)
+       yield 한 작업은 바로 놓아줌 -> 호출부가 결과를 버리면 xml 본문도 해제 (전체 결과를 들고 있지 않음)
+    3. 카테고리별 소요시간 로그 + 전체 소요시간/순차 합계 비교 로그
+    param targets : get_rss()가 반환한 [{'category': 'IT', 'url': '...'}] 리스트
+    param cache : HttpCache 전달시 조건부 GET (304 카테고리는 not_modified=True)
+    param rate_limit : 호스트당 초당 최대 요청 수 (None이면 제한 없음)
+    yield : {'target', 'content'(bytes|None), 'not_modified'(bool), 'error'(str|None), 'elapsed'(float),
+             'encoding', 'etag', 'last_modified'} -> 파싱 성공 후 cache.store(target['url'], 결과)
+    '''
+    if not targets :
+        return
+
+    limiter = HostLimiter(per_host, rate=rate_limit)
+    http_client.get_session(pool_size=max(workers, per_host))   # 공용 세션 연결 풀을 동시 다운로드 수에 맞춤
+    deadline_at = time.monotonic() + deadline
+    wall_start = time.perf_counter()
+    serial = 0.0
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="rss-fetch")
+    # 작업 -> 카테고리, 끝난 작업은 yield 직전에 꺼냄
+    # as_completed() 는 넘겨받은 작업 전체를 끝까지 참조하므로 wait() 로 남은 작업만 들고 기다림
+    futures = {executor.submit(_fetch_one, t, limiter, timeout, deadline_at, cache): t for t in targets}
+    try :
+        while futures :
+            # yield 하는 동안(호출부에서 파싱중) 흐른 시간도 마감에 포함
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0 :
+                break
+            done, _ = wait(futures, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done :
+                break
+            for future in done :
+                del futures[future]
+                result = future.result()
+                _log_result(result)
+                serial += result["elapsed"]
+                yield result
+        for target in futures.values() :
+            result = {"target": target, "content": None, "not_modified": False,
+                      "error": f"deadline 초과 ({deadline}s)", "elapsed": deadline}
+            _log_result(result)
+            serial += result["elapsed"]
+            yield result
+    finally :
+        # 마감 이후 아직 대기중인 작업은 취소, 실행중 스레드는 타임아웃으로 알아서 종료됨(기다리지 않음)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    wall = time.perf_counter() - wall_start
+    metrics.observe("stage_seconds", wall, stage="fetch")
+    logger.info(f"카테고리 {len(targets)}개 다운로드 완료 : 전체 {wall:.2f}s (순차 합계 {serial:.2f}s, workers={workers})")
+
+
+def fetch_all(targets: list, workers: int = DEFAULT_WORKERS, per_host: int = DEFAULT_PER_HOST,
+              deadline: float = DEFAULT_DEADLINE, timeout: float = DEFAULT_TIMEOUT,
+              cache: http_cache.HttpCache = None, rate_limit: float = None) -> list :
+    '''
+    iter_fetched() 결과를 모두 모아 targets 순서대로 정렬해서 반환
+    return : targets 순서 그대로 [{'target', 'content'(bytes|None), 'not_modified'(bool), 'error'(str|None), 'elapsed'(float)}]
+    '''
+    order = {id(t): i for i, t in enumerate(targets)}
+    results = list(iter_fetched(targets, workers=workers, per_host=per_host, deadline=deadline,
+                                timeout=timeout, cache=cache, rate_limit=rate_limit))
+    results.sort(key=lambda r: order[id(r["target"])])
+    return results
+
+
+if __name__ == "__main__" :
+    # 로컬 HTTP 서버(지연 응답)로 병렬 다운로드 / deadline 부분결과 확인
+    import http.server
+
+    class SlowHandler(http.server.BaseHTTPRequestHandler) :
+        def do_GET(self) :
+            delay = float(self.path.rsplit("/", 1)[-1] or 0)
+            time.sleep(delay)
+            body = b"<rss><channel></channel></rss>"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) :
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    logging.basicConfig(level=logging.INFO)
+    test_targets = [{"category": f"cat{i}", "url": f"{base}/{d}"} for i, d in enumerate([0.5, 0.5, 0.5, 3])]
+    test_results = fetch_all(test_targets, workers=4, per_host=4, deadline=1.5)
+    print([(r["target"]["category"], r["error"] is None) for r in test_results])  # 마지막 카테고리만 실패
+    server.shutdown()
@@ -0,0 +1,192 @@
+"""http_cache 모듈 : 조건부 GET(ETag / Last-Modified) 검증값 디스크 캐시
+HttpCache        : url별 응답 본문 + 검증값(ETag, Last-Modified) 저장, 용량/경과일 기준 정리
+fetch()          : 캐시에 검증값 있으면 If-None-Match / If-Modified-Since 붙여 요청,
+                   304 응답이면 네트워크 본문 없이 캐시 본문 재사용
+decode_text()    : fetch() 결과를 html 파싱용 문자열로 변환 (requests의 response.text 역할)
+
+캐시 디렉토리 구조
+    index.json       : {url: {etag, last_modified, encoding, file, size, stored_at, used_at}}
+    <sha1(url)>.body : 응답 본문 원본 bytes
+
+index.json 은 save() 호출시에만 기록 -> main에서 DB 저장 성공 후 save() 하면
+DB 저장 실패한 실행의 검증값은 남지 않아 다음 실행에서 다시 다운로드 받음
+카테고리 피드는 fetch(store=False) 로 받고, 파싱까지 끝난 카테고리만 호출부에서 store()
+-> deadline 초과로 버려진 응답의 검증값이 남아서 다음 실행에서 304 로 건너뛰는 일 없음
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from . import http_client
+from . import metrics
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024     # 캐시 본문 전체 최대 용량 50MB
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60       # 마지막 사용 후 7일 지난 항목 삭제
+
+
+class HttpCache :
+    '''
+    url 단위 HTTP 검증값 캐시 (fetcher 스레드에서 동시에 사용 -> 내부 lock)
+    param cache_dir : 캐시 저장 폴더 (없으면 생성)
+    param max_bytes : 본문 파일 전체 용량 상한, 초과시 오래 안쓴 항목부터 삭제
+    param max_age : 마지막 사용 후 경과 시간(초) 상한
+    param refresh : True면 조건부 요청 안함 (304 없이 전부 다시 다운로드, 받은 검증값은 그대로 저장) -> main --full
+    '''
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE,
+                 refresh: bool = False) :
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.refresh = refresh
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    def _load_index(self) -> dict :
+        try :
+            with open(self._index_path, encoding="utf-8") as f :
+                return json.load(f)
+        except FileNotFoundError :
+            return {}
+        except (OSError, ValueError) as e :
+            # 인덱스 깨진 경우 캐시 없이 진행 (전체 재다운로드)
+            logger.warning(f"HTTP 캐시 인덱스 읽기 실패, 캐시 초기화 : {e}")
+            return {}
+
+    def reload(self) -> None :
+        '''save() 안된 변경(이번 실행에서 받은 검증값) 버리고 파일 기준으로 되돌림 (데몬 모드 DB 저장 실패시)'''
+        with self._lock :
+            self._index = self._load_index()
+
+    def _body_path(self, name: str) -> str :
+        return os.path.join(self.cache_dir, name)
+
+    def conditional_headers(self, url: str) -> dict :
+        '''저장된 검증값으로 조건부 요청 헤더 생성 (캐시 없거나 본문 파일 없거나 refresh 면 빈 dict)'''
+        if self.refresh :
+            return {}
+        with self._lock :
+            entry = self._index.get(url)
+        if not entry or not os.path.exists(self._body_path(entry["file"])) :
+            return {}
+        headers = {}
+        if entry.get("etag") :
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified") :
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def load(self, url: str) -> tuple :
+        '''304 응답시 호출 : (본문 bytes, encoding) 반환 + 마지막 사용 시간 갱신'''
+        with self._lock :
+            entry = self._index[url]
+            entry["used_at"] = time.time()
+        with open(self._body_path(entry["file"]), "rb") as f :
+            return f.read(), entry.get("encoding")
+
+    def store(self, url: str, fetched: dict) -> None :
+        '''
+        fetch() 결과 중 200 응답 + 검증값(ETag, Last-Modified) 있는 것만 저장 (304 결과는 무시)
+        param fetched : fetch() 결과 또는 같은 키(content, encoding, etag, last_modified, not_modified)를 가진 dict
+        '''
+        etag = fetched.get("etag")
+        last_modified = fetched.get("last_modified")
+        if fetched.get("not_modified") or (not etag and not last_modified) :
+            return
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest() + ".body"
+        content = fetched["content"]
+        with open(self._body_path(name), "wb") as f :
+            f.write(content)
+        now = time.time()
+        with self._lock :
+            self._index[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "encoding": fetched.get("encoding"),
+                "file": name,
+                "size": len(content),
+                "stored_at": now,
+                "used_at": now,
+            }
+
+    def evict(self) -> int :
+        '''
+        캐시 정리 : 1) max_age 지난 항목 삭제 2) 용량 초과시 used_at 오래된 순으로 삭제
+        return : 삭제한 항목 수
+        '''
+        now = time.time()
+        removed = 0
+        with self._lock :
+            for url in [u for u, e in self._index.items() if now - e["used_at"] > self.max_age] :
+                self._remove(url)
+                removed += 1
+            total = sum(e["size"] for e in self._index.values())
+            for url in sorted(self._index, key=lambda u: self._index[u]["used_at"]) :
+                if total <= self.max_bytes :
+                    break
+                total -= self._index[url]["size"]
+                self._remove(url)
+                removed += 1
+        if removed :
+            logger.info(f"HTTP 캐시 정리 : {removed}개 항목 삭제")
+        return removed
+
+    def _remove(self, url: str) -> None :
+        entry = self._index.pop(url)
+        try :
+            os.remove(self._body_path(entry["file"]))
+        except FileNotFoundError :
+            pass
+
+    def save(self) -> None :
+        '''정리(evict) 후 인덱스 파일 기록 (임시파일 -> rename 으로 중간에 깨진 파일 방지)'''
+        self.evict()
+        tmp_path = self._index_path + ".tmp"
+        with self._lock :
+            with open(tmp_path, "w", encoding="utf-8") as f :
+                json.dump(self._index, f, ensure_ascii=False)
+        os.replace(tmp_path, self._index_path)
+
+
+def fetch(url: str, cache: HttpCache = None, timeout: float = 10, headers: dict = None, store: bool = True) -> dict :
+    '''
+    조건부 GET 다운로드 (http_client 공용 Session 사용)
+    param cache : HttpCache (None이면 일반 GET)
+    param store : False면 검증값을 캐시에 바로 저장하지 않음 -> 결과를 쓴 뒤 호출부에서 cache.store(url, 결과)
+    return : {'content': bytes, 'encoding': str|None, 'not_modified': bool, 'etag': str|None, 'last_modified': str|None}
+    Raises : requests.exceptions.RequestException (통신 실패, 4xx/5xx)
+    '''
+    req_headers = dict(headers or {})
+    if cache is not None :
+        req_headers.update(cache.conditional_headers(url))
+
+    response = http_client.get(url, timeout=timeout, headers=req_headers)
+    metrics.inc("http_responses_total", status=response.status_code)
+    if response.status_code == 304 and cache is not None :
+        content, encoding = cache.load(url)
+        logger.debug(f"304 Not Modified, 캐시 본문 사용 : {url}")
+        return {"content": content, "encoding": encoding, "not_modified": True, "etag": None, "last_modified": None}
+
+    response.raise_for_status()
+    metrics.inc("http_bytes_total", len(response.content))
+    fetched = {"content": response.content, "encoding": response.encoding, "not_modified": False,
+               "etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+    if cache is not None and store :
+        cache.store(url, fetched)
+    return fetched
+
+
+def decode_text(fetched: dict) :
+    '''
+    fetch() 결과 본문을 응답 헤더 인코딩으로 디코딩 (response.text와 동일한 결과)
+    인코딩 정보 없으면 bytes 그대로 반환 -> BeautifulSoup이 meta charset 보고 판단
+    '''
+    if fetched["encoding"] :
+        return fetched["content"].decode(fetched["encoding"], errors="replace")
+    return fetched["content"]
@@ -0,0 +1,211 @@
+"""metrics 모듈 : 수집 단계별 소요시간/건수 계측 (프로세스 공용 저장소 1개)
+로그 문장 대신 숫자로 남겨서 어느 단계가 느린지 비교, 느린 실행 알림(Prometheus)에 사용
+
+기록
+    inc()        : 카운터 증가 (기사 수, 다운로드 bytes ...)
+    timer()      : with 블록 소요시간 기록 (횟수/합계/최대)
+    set_gauge()  : 마지막 값 기록 (마지막 실행 성공 여부, 시각 ...)
+내보내기
+    write_textfile() : Prometheus textfile (node_exporter textfile collector 가 읽어감) -> cron 1회 실행 끝에
+    write_json()     : 같은 내용 JSON
+    serve()          : 데몬 모드 HTTP 엔드포인트 /metrics (Prometheus), /metrics.json
+
+이름은 접두어(rss_collector_) 없이 기록, 내보낼 때 붙임. 라벨은 키워드 인자
+    metrics.inc("entries_seen_total", 30, category="IT")
+    with metrics.timer("stage_seconds", stage="discover") : ...
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+PREFIX = "rss_collector_"
+
+# Prometheus HELP 문구 (없는 이름은 HELP 생략)
+HELP = {
+    "stage_seconds": "단계별 소요시간 (discover, fetch, parse, db, retention)",
+    "fetch_seconds": "카테고리별 다운로드 소요시간",
+    "parse_seconds": "카테고리별 파싱 소요시간",
+    "run_seconds": "수집 1회 전체 소요시간",
+    "http_responses_total": "HTTP 응답 수 (status 별)",
+    "http_bytes_total": "다운로드한 본문 bytes (304 캐시 본문 제외)",
+    "fetch_errors_total": "카테고리 다운로드 실패 수",
+    "entries_seen_total": "피드에서 읽은 기사 수",
+    "entries_warnings_total": "정규화 경고 기사 수 (idx_missing 은 건너뜀, date_* 는 실행시각 대체)",
+    "entries_classified_total": "증분 판정 결과 기사 수 (new, updated, skipped)",
+    "db_rows_total": "DB upsert 요청 행 수",
+    "description_bytes_total": "요약 원문(raw) / 정리 후 저장(stored) bytes",
+    "dedup_rows_total": "카테고리 간 중복으로 병합된 기사 수",
+    "db_retries_total": "DB 재접속/재시도 횟수",
+    "retention_rows_total": "보관기간 경과로 삭제한 행 수",
+    "spool_rows_total": "로컬 스풀 기록(append) / DB 저장(drain) 행 수",
+    "spool_rows_pending": "로컬 스풀에 남은 (DB 저장 대기) 행 수",
+    "last_run_success": "마지막 실행 성공 1 / 실패 0",
+    "last_run_timestamp_seconds": "마지막 실행 종료 시각 (unix time)",
+}
+
+_lock = threading.Lock()
+_counters: dict[tuple, float] = {}
+_gauges: dict[tuple, float] = {}
+_timers: dict[tuple, list] = {}     # {키: [횟수, 합계, 최대]}
+
+
+def _key(name: str, labels: dict) -> tuple :
+    return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+def inc(name: str, value: float = 1, **labels) -> None :
+    key = _key(name, labels)
+    with _lock :
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def set_gauge(name: str, value: float, **labels) -> None :
+    with _lock :
+        _gauges[_key(name, labels)] = value
+
+
+def observe(name: str, seconds: float, **labels) -> None :
+    key = _key(name, labels)
+    with _lock :
+        stat = _timers.setdefault(key, [0, 0.0, 0.0])
+        stat[0] += 1
+        stat[1] += seconds
+        stat[2] = max(stat[2], seconds)
+
+
+@contextmanager
+def timer(name: str, **labels) :
+    '''with 블록 소요시간 observe() (예외로 빠져나가도 기록)'''
+    start = time.perf_counter()
+    try :
+        yield
+    finally :
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def reset() -> None :
+    with _lock :
+        _counters.clear()
+        _gauges.clear()
+        _timers.clear()
+
+
+def snapshot() -> dict :
+    '''현재 값 전체 (JSON 변환 가능한 dict)'''
+    with _lock :
+        counters = [{"name": n, "labels": dict(l), "value": v} for (n, l), v in _counters.items()]
+        gauges = [{"name": n, "labels": dict(l), "value": v} for (n, l), v in _gauges.items()]
+        timers = [{"name": n, "labels": dict(l), "count": s[0], "sum": round(s[1], 6),
+                   "max": round(s[2], 6)} for (n, l), s in _timers.items()]
+    return {"timestamp": time.time(), "counters": counters, "gauges": gauges, "timers": timers}
+
+
+def _escape(value) -> str :
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels: dict) -> str :
+    if not labels :
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def render_prometheus() -> str :
+    '''Prometheus text exposition format (타이머는 summary 의 _count/_sum + 최대값 gauge)'''
+    snap = snapshot()
+    lines = []
+    declared = set()
+
+    def declare(name: str, kind: str) :
+        if name in declared :
+            return
+        declared.add(name)
+        if name in HELP :
+            lines.append(f"# HELP {PREFIX}{name} {HELP[name]}")
+        lines.append(f"# TYPE {PREFIX}{name} {kind}")
+
+    for item in sorted(snap["counters"], key=lambda i: i["name"]) :
+        declare(item["name"], "counter")
+        lines.append(f"{PREFIX}{item['name']}{_fmt_labels(item['labels'])} {item['value']:g}")
+    for item in sorted(snap["gauges"], key=lambda i: i["name"]) :
+        declare(item["name"], "gauge")
+        lines.append(f"{PREFIX}{item['name']}{_fmt_labels(item['labels'])} {item['value']:g}")
+    for item in sorted(snap["timers"], key=lambda i: i["name"]) :
+        declare(item["name"], "summary")
+        labels = _fmt_labels(item["labels"])
+        lines.append(f"{PREFIX}{item['name']}_count{labels} {item['count']}")
+        lines.append(f"{PREFIX}{item['name']}_sum{labels} {item['sum']:g}")
+    for item in sorted(snap["timers"], key=lambda i: i["name"]) :
+        declare(item["name"] + "_max", "gauge")
+        lines.append(f"{PREFIX}{item['name']}_max{_fmt_labels(item['labels'])} {item['max']:g}")
+    return "\n".join(lines) + "\n"
+
+
+def _atomic_write(path: str, text: str) -> None :
+    # node_exporter 가 쓰다 만 파일을 읽지 않도록 임시파일에 쓰고 교체
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f :
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def write_textfile(path: str) -> None :
+    _atomic_write(path, render_prometheus())
+    logger.debug(f"계측값 textfile 저장 : {path}")
+
+
+def write_json(path: str) -> None :
+    _atomic_write(path, json.dumps(snapshot(), ensure_ascii=False, indent=2) + "\n")
+    logger.debug(f"계측값 JSON 저장 : {path}")
+
+
+def export(textfile: str = None, json_path: str = None) -> None :
+    '''설정된 경로로만 내보내기, 실패해도 수집 결과에는 영향 없도록 경고만'''
+    try :
+        if textfile :
+            write_textfile(textfile)
+        if json_path :
+            write_json(json_path)
+    except OSError as e :
+        logger.warning(f"계측값 저장 실패 : {e}")
+
+
+def serve(port: int, host: str = "127.0.0.1") :
+    '''
+    /metrics, /metrics.json 엔드포인트 백그라운드 스레드로 시작 (데몬 모드)
+    http.server 는 여기서만 import (cron 1회 실행은 HTTP 서버 모듈 로딩 안함)
+    return : http.server.ThreadingHTTPServer (종료시 shutdown(), server_close())
+    '''
+    import http.server
+
+    class _Handler(http.server.BaseHTTPRequestHandler) :
+        def do_GET(self) :
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics" :
+                body, ctype = render_prometheus().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json" :
+                body, ctype = json.dumps(snapshot(), ensure_ascii=False).encode("utf-8"), "application/json"
+            else :
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) :
+            pass   # 수집 주기마다 긁어가는 요청은 로그에 남기지 않음
+
+    server = http.server.ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"계측 엔드포인트 시작 : http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,77 @@
+"""multisite 모듈 : 다중 사이트 동시 수집 (main.py --sites)
+sites.ini 에 등록된 사이트 어댑터마다 수집 작업 하나씩 스레드풀로 병렬 실행
+    사이트별 분리 : HTTP 캐시(.http_cache/<site>), 카테고리 목록(.rss_targets.<site>.json), 증분 상태(.seen_state.<site>.json)
+    사이트별 제한 : 어댑터 rate_limit (호스트당 초당 요청 수)
+    저장 : 공용 테이블 news_rss (site + idx 유일키, sql/news_rss.sql)
+한 사이트 실패해도 나머지 사이트는 계속 진행, 실패한 사이트는 캐시/상태 저장 안함 -> 다음 실행에서 재수집
+spool 지정시 수집 결과를 스풀에 먼저 기록 후 캐시/상태 저장 -> DB 저장만 실패한 사이트는 다음 실행에서 스풀로 이어서 저장
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import fetcher
+from .http_cache import HttpCache
+from .rss_ps import run_collection
+from .seen_state import SeenState
+from .target_registry import TargetRegistry
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_MAX_SITES = 4
+SHARED_TABLE = "news_rss"
+
+
+def collect_site(adapter, handler, base_dir: str, full: bool = False, table_name: str = SHARED_TABLE,
+                 workers: int = fetcher.DEFAULT_WORKERS, spool = None) -> int :
+    '''
+    사이트 하나 수집 -> 공용 테이블 저장 -> 캐시/상태 저장
+    param full : True면 증분 상태, 조건부 GET 검증값 무시 (main --full)
+    param spool : spool.Spool, 지정시 수집 -> 스풀 기록 -> 캐시/상태 저장 -> 스풀에서 사이트 기사 저장
+    return : 저장한 기사 수
+    '''
+    cache = HttpCache(os.path.join(base_dir, '.http_cache', adapter.site), refresh=full)
+    registry = TargetRegistry(os.path.join(base_dir, f'.rss_targets.{adapter.site}.json'))
+    state = SeenState(os.path.join(base_dir, f'.seen_state.{adapter.site}.json'))
+
+    list_news = run_collection(workers=workers, cache=cache, registry=registry,
+                               state=None if full else state, adapter=adapter)
+    if spool is not None :
+        spool.append(list_news, table_name=table_name, site=adapter.site)
+        cache.save()
+        state.commit()
+        return spool.drain(handler, site=adapter.site)
+    saved = handler.upsert_news(list_news, table_name=table_name, site=adapter.site) if list_news else 0
+    cache.save()
+    state.commit()
+    return saved
+
+
+def collect_sites(adapters: list, handler, base_dir: str, max_sites: int = DEFAULT_MAX_SITES,
+                  full: bool = False, table_name: str = SHARED_TABLE, spool = None) -> dict :
+    '''
+    사이트 여러개 병렬 수집
+    param adapters : sources.load_sites() 결과
+    param handler : db_handler.MariaDBHandler (사이트 스레드끼리 커넥션 풀 공유)
+    param max_sites : 동시에 수집하는 사이트 수
+    param spool : spool.Spool (사이트 스레드끼리 공유)
+    return : {site: 저장 건수 또는 실패 예외}
+    '''
+    start = time.perf_counter()
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_sites), thread_name_prefix="rss-site") as executor :
+        futures = {executor.submit(collect_site, a, handler, base_dir, full, table_name, spool=spool): a for a in adapters}
+        for future, adapter in futures.items() :
+            try :
+                results[adapter.site] = future.result()
+                logger.info(f"[{adapter.site}] 사이트 수집 완료 : {results[adapter.site]}건 저장")
+            except Exception as e :
+                # 사이트 하나 실패해도 다른 사이트 결과는 유지
+                results[adapter.site] = e
+                logger.error(f"[{adapter.site}] 사이트 수집 실패 : {e}")
+
+    failed = [site for site, r in results.items() if isinstance(r, Exception)]
+    logger.info(f"다중 사이트 수집 종료 : {len(adapters)}개 사이트 (실패 {len(failed)}개), {time.perf_counter() - start:.2f}s")
+    return results
@@ -0,0 +1,143 @@
+"""normalize 모듈 : 기사 1건마다 반복되는 정규화 작업 빠른 경로
+id_pattern()   : 링크 질의문 고유번호 추출 정규식 (키별로 한번만 컴파일) -> urlparse() + parse_qs() 대체
+Normalizer     : 수집 1회(run) 단위 정규화 도구
+    written_dt()   : 작성일시 문자열 (MariaDB DATETIME 형식), 항상 지정 시간대(tz) 기준, 실행 서버의 시간대(TZ)와 무관
+                     1) published 원본 문자열 RFC-822 파싱 -> 피드에 적힌 시차로 시각 계산 후 tz 변환 (같은 문자열은 캐시 재사용)
+                     2) 안되면 published_parsed(UTC struct_time, feedparser / Atom ISO-8601) -> tz 변환
+                     3) 둘 다 실패하면 실행 시작 시각(run_ts, tz 기준, 실행당 1번만 계산)
+                     -> 같은 시각은 형식과 상관없이 같은 값 (공용 테이블에서 사이트끼리 비교 가능)
+    description()  : 요약 태그 제거/길이 제한 (description 모듈, 원문 해시 캐시) + 줄어든 bytes 집계
+    count()        : 기사별 경고(idx 추출 실패, 날짜 대체 등)를 로그 대신 집계
+    log_summary()  : 집계된 경고를 실행 끝에 한 줄로 기록 + 계측 카운터(entries_warnings_total)에 반영
+"""
+
+import calendar
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_tz
+from functools import lru_cache
+
+from . import description as desc
+from . import metrics
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DATETIME_FMT = '%Y-%m-%d %H:%M:%S'   # MariaDB DATETIME 형식
+DEFAULT_TIMEZONE = "+09:00"   # 시간대 정보 없는 날짜(published_parsed, 대체값) 저장 기준, 수집 대상이 국내 사이트라 한국 시간
+
+_OFFSET = re.compile(r"^([+-])(\d{2}):?(\d{2})$")
+
+# 경고 종류 -> 계측 라벨 (metrics entries_warnings_total{reason=...})
+WARNING_REASONS = {
+    "idx 추출 실패": "idx_missing",
+    "날짜 변환 실패": "date_fallback",
+    "날짜 없음": "date_missing",
+}
+
+
+@lru_cache(maxsize=32)
+def id_pattern(param: str) -> re.Pattern :
+    '''?idx=123 / &idx=123 형태에서 숫자만 추출하는 정규식 (키 이름별 1회 컴파일)'''
+    return re.compile(r"[?&]" + re.escape(param) + r"=(\d+)")
+
+
+@lru_cache(maxsize=16)
+def get_timezone(name: str) :
+    '''
+    "+09:00" / "-0500" 형태 고정 시차 또는 "Asia/Seoul" 같은 IANA 이름 -> tzinfo
+    Raises : ValueError (알 수 없는 시간대)
+    '''
+    m = _OFFSET.match(name.strip())
+    if m :
+        sign = -1 if m.group(1) == "-" else 1
+        return timezone(sign * timedelta(hours=int(m.group(2)), minutes=int(m.group(3))))
+    # 이름 지정시에만 사용 (tzdata 없는 환경에서도 고정 시차는 동작)
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    try :
+        return ZoneInfo(name.strip())
+    except (ZoneInfoNotFoundError, ValueError) as e :
+        raise ValueError(f"알 수 없는 시간대 : {name}") from e
+
+
+@lru_cache(maxsize=4096)
+def parse_rfc822(raw: str, tz = timezone.utc) :
+    '''
+    "Mon, 13 Oct 2026 10:00:00 +0900" 형태 -> tz 기준 DATETIME 문자열 (실패시 None)
+    피드에 적힌 시차(parsedate_tz 10번째 값)로 시각 계산 -> tz 변환, 실행 서버 시간대(localtime) 안씀
+        "Mon, 13 Oct 2026 01:00:00 GMT", tz +09:00 -> "2026-10-13 10:00:00"
+    시차 없는 문자열은 UTC 로 봄 (parsedate_tz, feedparser published_parsed 와 같은 기준)
+    같은 기사가 여러 카테고리에 실리면 같은 문자열이 반복되므로 결과 캐시
+    '''
+    parsed = parsedate_tz(raw)
+    if parsed is None :
+        return None
+    try :
+        value = datetime(*parsed[:6])
+        if parsed[9] is not None :
+            value = value.replace(tzinfo=timezone(timedelta(seconds=parsed[9]))).astimezone(tz)
+        return value.strftime(DATETIME_FMT)
+    except (ValueError, OverflowError) :   # 31 Feb 같은 범위 밖 날짜/시차
+        return None
+
+
+class Normalizer :
+    '''
+    수집 1회 동안 공유 (run_collection() / pipeline.run_streaming() 에서 생성)
+    param tz : 시간대 정보 없는 날짜 저장 기준 ("+09:00" / "Asia/Seoul", None이면 DEFAULT_TIMEZONE, 사이트별 sites.ini timezone)
+    '''
+    def __init__(self, tz: str = None) :
+        self.tz = get_timezone(tz or DEFAULT_TIMEZONE)
+        self.run_ts = datetime.now(self.tz).strftime(DATETIME_FMT)   # 날짜 대체값, 실행당 1번만 계산
+        self.counts: dict[str, int] = {}
+        self.samples: dict[str, str] = {}
+        self.desc_stats = {"count": 0, "cached": 0, "raw_bytes": 0, "stored_bytes": 0}
+
+    def count(self, kind: str, sample: str = "") -> None :
+        '''경고 1건 집계 (종류별 첫 사례만 예시로 보관)'''
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self.samples.setdefault(kind, sample)
+
+    def written_dt(self, entry) -> str :
+        raw = entry.get('published', '')
+        if raw :
+            value = parse_rfc822(raw, self.tz)
+            if value :
+                return value
+        parsed = entry.get('published_parsed')
+        if parsed :
+            # feedparser / fastfeed(ISO-8601) 는 published_parsed 를 UTC 기준 struct_time 으로 제공
+            return datetime.fromtimestamp(calendar.timegm(parsed), self.tz).strftime(DATETIME_FMT)
+        if raw :
+            self.count("날짜 변환 실패", raw)
+        else :
+            self.count("날짜 없음")
+        return self.run_ts
+
+    def description(self, raw: str, max_chars: int = desc.DEFAULT_MAX_CHARS, keep_full: bool = False) -> tuple :
+        '''
+        return : (정리된 요약, 압축 원문 bytes 또는 None)
+        '''
+        text, blob, cached = desc.compact(raw or "", max_chars=max_chars, keep_full=keep_full)
+        stats = self.desc_stats
+        stats["count"] += 1
+        stats["cached"] += cached
+        stats["raw_bytes"] += len(raw.encode("utf-8")) if raw else 0
+        stats["stored_bytes"] += len(text.encode("utf-8")) + (len(blob) if blob is not None else 0)
+        return text, blob
+
+    def log_summary(self) -> None :
+        stats = self.desc_stats
+        if stats["count"] :
+            saved = stats["raw_bytes"] - stats["stored_bytes"]
+            metrics.inc("description_bytes_total", stats["raw_bytes"], kind="raw")
+            metrics.inc("description_bytes_total", stats["stored_bytes"], kind="stored")
+            logger.info(f"요약 정리 : {stats['count']}건 {stats['raw_bytes']} -> {stats['stored_bytes']} bytes "
+                        f"({saved} bytes 절약, 캐시 재사용 {stats['cached']}건)")
+        if not self.counts :
+            return
+        for kind, cnt in self.counts.items() :
+            metrics.inc("entries_warnings_total", cnt, reason=WARNING_REASONS.get(kind, kind))
+        detail = ", ".join(f"{kind} {cnt}건(예: {self.samples[kind][:30]!r})" if self.samples[kind]
+                           else f"{kind} {cnt}건" for kind, cnt in self.counts.items())
+        logger.warning(f"정규화 경고 요약 : {detail} / 날짜 대체값 {self.run_ts}")
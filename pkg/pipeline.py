@@ -0,0 +1,190 @@
+"""pipeline 모듈 : 스트리밍 수집 모드 (main.py --stream)
+run_collection()은 모든 카테고리 기사를 하나의 리스트에 모은 뒤에야 DB 저장 시작
+-> 카테고리 수, description 크기만큼 메모리 증가 + 가장 느린 피드 끝날 때까지 DB 저장 0건
+
+스트리밍 흐름
+    fetcher.iter_fetched() 병렬 다운로드 -> 끝난 카테고리부터 iter_feed() 파싱
+    -> 기사 튜플 하나씩 bounded queue(maxsize=queue_size)에 put
+    -> DB writer 스레드가 batch_size 만큼 모이면(또는 flush_interval 동안 새 기사 없으면) upsert
+큐가 가득 차면(DB 저장이 느리면) put()에서 대기 -> 파싱 속도가 DB 속도에 맞춰짐 (backpressure)
+
+Raises: DB 저장 실패시 남은 기사는 버리고 수집 종료 후 마지막 에러를 호출부로 전파
+        spool 지정시에는 실패한 batch 부터 로컬 스풀(spool.Spool)에 기록하고 수집 계속 (에러 전파 안함)
+        스풀 기록까지 실패하면(디스크 부족 등) 남은 기사는 버리고 스풀 에러 전파
+        어느 경우든 writer 스레드는 _DONE 까지 큐를 계속 비움 -> 생산자가 put()에서 멈추지 않음
+"""
+
+import logging
+import queue
+import threading
+import time
+
+from . import fetcher
+from . import http_cache
+from . import metrics
+from .normalize import Normalizer
+from .dedup import dedup_rows
+from .rss_ps import iter_feed, resolve_targets
+from .seen_state import SeenState
+from .target_registry import TargetRegistry
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_QUEUE_SIZE = 2000       # 큐에 대기 가능한 기사 수 (메모리 상한)
+DEFAULT_FLUSH_INTERVAL = 2.0    # 새 기사 없이 이 시간(초) 지나면 모인 만큼 바로 저장
+
+_DONE = object()   # 생산 종료 신호
+
+
+class DBWriter(threading.Thread) :
+    '''
+    큐에서 기사 튜플 꺼내서 batch 단위로 handler.upsert_news() 호출하는 저장 스레드
+    param handler : db_handler.MariaDBHandler
+    param rows : 기사 튜플 큐
+    param batch_size : 한번에 저장할 기사 수
+    param spool : spool.Spool, 저장 실패 이후 batch 를 버리지 않고 스풀에 기록
+    '''
+    def __init__(self, handler, rows: queue.Queue, batch_size: int, table_name: str = "boannews_rss",
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, site: str = None, spool = None) :
+        super().__init__(name="rss-db-writer", daemon=True)
+        self.handler = handler
+        self.rows = rows
+        self.batch_size = batch_size
+        self.table_name = table_name
+        self.site = site
+        self.spool = spool
+        self.spooled = 0
+        self.spool_error = None   # 스풀 기록 실패 (이후 batch 는 버림)
+        self.dropped = 0
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.error = None
+        self.first_write_at = None
+
+    def _flush(self, batch: list) -> None :
+        if not batch :
+            return
+        if self.error is not None :
+            if self.spool is None or self.spool_error is not None :
+                self.dropped += len(batch)
+                return
+            try :
+                # DB 장애 이후 batch 는 스풀에 순서대로 기록 -> 다음 실행에서 이어서 저장
+                self.spooled += self.spool.append(dedup_rows(batch), table_name=self.table_name, site=self.site)
+            except Exception as e :
+                # 여기서 스레드가 죽으면 생산자가 put()에서 영원히 대기 (잠금 파일 잡은 채로) -> 기록하고 큐는 계속 비움
+                logger.error(f"스풀 기록 실패, 이후 기사는 저장하지 않음 : {e}")
+                self.spool_error = e
+                self.dropped += len(batch)
+            return
+        try :
+            # batch 안의 중복만 병합, batch 사이 중복은 저장 직전에 기존 category 와 합침 (db_conn.merge_stored_categories)
+            batch = dedup_rows(batch)
+            self.handler.upsert_news(batch, table_name=self.table_name, site=self.site)
+            self.written += len(batch)
+            if self.first_write_at is None :
+                self.first_write_at = time.perf_counter()
+        except Exception as e :
+            # 에러 이후에도 큐는 계속 비워줌 -> 생산자가 put()에서 영원히 멈추지 않도록
+            logger.error(f"스트리밍 저장 실패, 이후 기사는 {'스풀에 기록' if self.spool is not None else '저장하지 않음'} : {e}")
+            self.error = e
+            self._flush(batch)
+
+    def run(self) -> None :
+        batch = []
+        while True :
+            try :
+                row = self.rows.get(timeout=self.flush_interval)
+            except queue.Empty :
+                self._flush(batch)
+                batch = []
+                continue
+            if row is _DONE :
+                self._flush(batch)
+                return
+            batch.append(row)
+            if len(batch) >= self.batch_size :
+                self._flush(batch)
+                batch = []
+
+
+def run_streaming(handler, workers: int = fetcher.DEFAULT_WORKERS, per_host: int = fetcher.DEFAULT_PER_HOST,
+                  deadline: float = fetcher.DEFAULT_DEADLINE, cache: http_cache.HttpCache = None,
+                  registry: TargetRegistry = None, refresh_targets: bool = False, state: SeenState = None,
+                  select = None, batch_size: int = None, queue_size: int = DEFAULT_QUEUE_SIZE,
+                  table_name: str = "boannews_rss", adapter = None, spool = None) -> int :
+    '''
+    스트리밍 수집 + 저장 (인자는 rss_ps.run_collection()과 동일 + DB/큐 설정)
+    param handler : db_handler.MariaDBHandler (수집 시작 전에 생성해서 전달)
+    param batch_size : writer 저장 단위 (None이면 handler.batch_size)
+    param queue_size : 큐 최대 기사 수
+    param adapter : sources.SourceAdapter (None이면 보안뉴스), 공용 테이블 저장시 site 컬럼 값
+    param spool : spool.Spool, 시작 전에 남은 스풀 먼저 저장, DB 저장 실패 이후 기사는 스풀에 기록
+    return : DB에 저장한 기사 수
+    Raises : writer 저장 실패 에러 (spool 없을 때, 또는 스풀 기록도 실패했을 때)
+             cache.save(), state.commit()은 호출부에서 성공시에만
+    '''
+    logger.info("보안뉴스 RSS 스트리밍 수집 시작")
+    start = time.perf_counter()
+    targets = resolve_targets(cache=cache, registry=registry, refresh_targets=refresh_targets, select=select,
+                              adapter=adapter)
+
+    rows = queue.Queue(maxsize=queue_size)
+    writer = DBWriter(handler, rows, batch_size or handler.batch_size, table_name=table_name,
+                      site=adapter.site if adapter is not None else None, spool=spool)
+    if spool is not None and spool.pending() :
+        # 이전 실행에서 남은 기사 먼저 저장 (같은 기사는 이번 수집분이 나중에 저장되도록)
+        try :
+            spool.drain(handler)
+        except Exception as e :
+            logger.error(f"남은 스풀 저장 실패, 이번 수집분도 스풀에 기록 : {e}")
+            writer.error = e
+    writer.start()
+
+    produced = 0
+    results = []   # registry.report() 용 {'target', 'error'} 만 보관 (xml 본문은 카테고리 파싱 후 바로 해제)
+    normalizer = Normalizer(adapter.timezone if adapter is not None else None)
+    parse_start = time.perf_counter()
+    try :
+        for result in fetcher.iter_fetched(targets, workers=workers, per_host=per_host,
+                                           deadline=deadline, cache=cache,
+                                           rate_limit=adapter.rate_limit if adapter is not None else None) :
+            target = result["target"]
+            results.append({"target": target, "error": result["error"]})
+            if result["error"] or result["not_modified"] :
+                continue
+            logger.info(f"[*] 카테고리 수집 중: {target['category']}")
+            # 스트리밍 모드 파싱 시간에는 큐 대기(backpressure) 시간도 포함
+            with metrics.timer("parse_seconds", category=target['category']) :
+                for row in iter_feed(target, result["content"], state=state, adapter=adapter,
+                                     normalizer=normalizer) :
+                    rows.put(row)   # 큐 가득 차면 writer가 비울 때까지 대기 (backpressure)
+                    produced += 1
+            if cache is not None :
+                cache.store(target['url'], result)   # 파싱까지 끝난 카테고리만 검증값 기록
+            del result   # 다음 다운로드 기다리는 동안 이 카테고리 xml 본문 붙잡지 않음
+            if writer.error is not None and (spool is None or writer.spool_error is not None) :
+                break   # DB 저장 실패 (스풀 기록도 실패) -> 나머지 카테고리 파싱 중단
+    finally :
+        rows.put(_DONE)
+        writer.join()
+        metrics.observe("stage_seconds", time.perf_counter() - parse_start, stage="parse")
+
+    normalizer.log_summary()
+    if registry is not None :
+        registry.report(results)
+    if writer.error is not None :
+        if spool is None :
+            raise writer.error
+        if writer.spool_error is not None :
+            logger.error(f"DB 저장, 스풀 기록 모두 실패 : 스풀 {writer.spooled}건, 버림 {writer.dropped}건")
+            raise writer.spool_error
+        logger.warning(f"DB 저장 실패로 {writer.spooled}건 스풀에 기록")
+
+    first = f"{writer.first_write_at - start:.2f}s" if writer.first_write_at else "-"
+    logger.info(f"스트리밍 수집 완료: 파싱 {produced}건, 저장 {writer.written}건, "
+                f"전체 {time.perf_counter() - start:.2f}s (첫 저장까지 {first})")
+    if state is not None :
+        logger.info(state.summary())
+        state.export_metrics()
+    return writer.written
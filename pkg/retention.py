@@ -0,0 +1,310 @@
+"""retention 모듈 : 보관기간 지난 기사 삭제 (clean_db.sh / run_rss.sh 의 DELETE 한방 쿼리 대체)
+DELETE ... WHERE save_at < 14일전 한번에 실행하면 대상 행 전부를 하나의 트랜잭션으로 지움
+-> 잠금 오래 유지, undo log 증가, 그 사이 수집기 upsert 대기
+
+purge_expired()  : 기본키 batch 단위 삭제
+    1. 기준시각(cutoff)을 DB 시계로 1번만 계산 (DATE_SUB(NOW(), INTERVAL days DAY))
+    2. save_at < cutoff 인 행의 기본키 batch_size 개 조회 -> 그 기본키만 DELETE -> commit
+       (조회 후 삭제 전에 upsert로 save_at 갱신된 기사는 삭제 조건 재확인으로 보존)
+    3. batch 사이 pause 초 쉬면서 다른 트랜잭션에 기회 -> time_budget 초 넘으면 중단, 나머지는 다음 실행에서
+    save_at 인덱스 있어야 batch 조회가 빠름 (sql/news_rss.sql 의 KEY idx_save_at 참고)
+drop_expired_partitions()  : (선택) 날짜 RANGE 파티션 테이블이면 cutoff 이전 파티션 통째로 DROP
+    PARTITION BY RANGE (TO_DAYS(save_at)) 형식만 DROP, 파티션 없는 테이블은 아무것도 안함
+    MariaDB는 파티션 컬럼이 기본키에 포함되어야 함 -> idx 기본키 테이블은 written_dt 같은 다른 컬럼으로 나눠야 할 수 있음
+    다른 컬럼 파티션을 DROP 하면 save_at 기준 보관기간 안의 행(다시 수집돼서 save_at 갱신된 기사)까지 지워지고
+    뒤의 batch 삭제로 되돌릴 수 없음 -> 파티션 컬럼이 save_at 이 아니면 DROP 안하고 경고만 (batch 삭제만 수행)
+add_partitions()  : (선택) 앞으로 ahead_days 일치 일별 파티션 미리 생성 (pmax 파티션 REORGANIZE)
+
+설정파일 [retention] 섹션 선택 항목 (없으면 기본값)
+    days = 14
+    batch_size = 1000
+    pause = 0.2          ; batch 사이 대기(초)
+    time_budget = 300    ; 1회 실행 최대 시간(초)
+    partitions = false   ; true면 파티션 DROP/생성 먼저 수행
+
+대상 테이블 : --table 지정 안하면 DEFAULT_TABLES 중 DB에 있는 테이블 전부
+    (boannews_rss : 단일 사이트 수집, news_rss : main.py --sites 다중 사이트 공용 테이블)
+
+실행 : python -m pkg.retention [--days 14] [--table boannews_rss --table news_rss] [--conf .db_conn_conf.ini]
+       python main.py purge [같은 옵션]
+       종료코드 0 정상(시간 예산 초과로 일부 남아도 정상), 1 에러
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+from datetime import date, timedelta
+
+import mariadb
+
+from . import metrics
+from .db_conn import load_db_conf, get_connection
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_DAYS = 14
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_PAUSE = 0.2
+DEFAULT_TIME_BUDGET = 300.0
+DEFAULT_AHEAD_DAYS = 3
+
+DEFAULT_TABLES = ("boannews_rss", "news_rss")   # 단일 사이트 테이블, 다중 사이트 공용 테이블 (multisite.SHARED_TABLE)
+
+_IDENT = re.compile(r"^\w+$")
+_TO_DAYS = re.compile(r"to_days\s*\(\s*`?(\w+)`?\s*\)", re.I)
+RETENTION_COLUMN = "save_at"   # 보관기간 기준 컬럼 (batch 삭제 조건, 파티션 DROP 허용 컬럼)
+
+
+def _check_ident(name: str) -> str :
+    # 테이블/컬럼 이름은 쿼리에 직접 들어가므로 영문/숫자/_ 만 허용
+    if not _IDENT.match(name) :
+        raise ValueError(f"허용되지 않는 이름 : {name!r}")
+    return name
+
+
+def load_policy(config) -> dict :
+    '''설정파일 [retention] 섹션 -> purge_expired() 인자 dict (없는 항목은 기본값)'''
+    return {
+        "days": config.getint('retention', 'days', fallback=DEFAULT_DAYS),
+        "batch_size": config.getint('retention', 'batch_size', fallback=DEFAULT_BATCH_SIZE),
+        "pause": config.getfloat('retention', 'pause', fallback=DEFAULT_PAUSE),
+        "time_budget": config.getfloat('retention', 'time_budget', fallback=DEFAULT_TIME_BUDGET),
+        "partitions": config.getboolean('retention', 'partitions', fallback=False),
+    }
+
+
+def existing_tables(conn, tables = DEFAULT_TABLES) -> list :
+    '''tables 중 현재 DB에 있는 테이블만 (순서 유지, 다중 사이트 수집 안쓰는 서버는 news_rss 없음)'''
+    with conn.cursor() as cursor :
+        cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE()")
+        found = {row[0] for row in cursor.fetchall()}
+    return [t for t in tables if t in found]
+
+
+def primary_key(conn, table_name: str) -> list :
+    '''기본키 컬럼 목록 (boannews_rss -> [idx], news_rss -> [site, idx])'''
+    with conn.cursor() as cursor :
+        cursor.execute(
+            "SELECT COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY' "
+            "ORDER BY ORDINAL_POSITION", (table_name,))
+        columns = [row[0] for row in cursor.fetchall()]
+    if not columns :
+        raise ValueError(f"{table_name} 테이블 기본키 없음 (batch 삭제 불가)")
+    return columns
+
+
+def cutoff_time(conn, days: int) :
+    '''삭제 기준시각 (기존 쿼리와 같은 DB 시계 기준, 실행 중 고정)'''
+    with conn.cursor() as cursor :
+        cursor.execute("SELECT DATE_SUB(NOW(), INTERVAL %s DAY)", (days,))
+        return cursor.fetchone()[0]
+
+
+def _delete_batch(conn, table_name: str, key_cols: list, cutoff, batch_size: int) -> tuple :
+    '''기본키 batch 1개 조회 + 삭제 + commit, return : (조회 행 수, 삭제 행 수)'''
+    cols = ", ".join(key_cols)
+    try :
+        with conn.cursor() as cursor :
+            cursor.execute(f"SELECT {cols} FROM {table_name} WHERE save_at < %s ORDER BY save_at LIMIT %s",
+                           (cutoff, batch_size))
+            keys = cursor.fetchall()
+            if not keys :
+                return 0, 0
+            if len(key_cols) == 1 :
+                holders = ", ".join(["%s"] * len(keys))
+                params = [k[0] for k in keys]
+                cond = f"{key_cols[0]} IN ({holders})"
+            else :
+                row_holder = "(" + ", ".join(["%s"] * len(key_cols)) + ")"
+                holders = ", ".join([row_holder] * len(keys))
+                params = [v for k in keys for v in k]
+                cond = f"({cols}) IN ({holders})"
+            # 조회 이후 다시 수집돼서 save_at 갱신된 기사는 지우지 않음
+            cursor.execute(f"DELETE FROM {table_name} WHERE {cond} AND save_at < %s", (*params, cutoff))
+            deleted = cursor.rowcount
+        conn.commit()
+        return len(keys), deleted
+    except mariadb.Error :
+        conn.rollback()
+        raise
+
+
+def purge_expired(conn, table_name: str = "boannews_rss", days: int = DEFAULT_DAYS,
+                  batch_size: int = DEFAULT_BATCH_SIZE, pause: float = DEFAULT_PAUSE,
+                  time_budget: float = DEFAULT_TIME_BUDGET, partitions: bool = False) -> dict :
+    '''
+    보관기간(days) 지난 기사 기본키 batch 단위 삭제
+    param conn : db_conn.get_connection() 연결 또는 MariaDBHandler.get_connection() 풀 연결
+    param batch_size : batch 1번에 지우는 최대 행 수 (트랜잭션 크기 상한)
+    param pause : batch 사이 대기(초)
+    param time_budget : 1회 실행 최대 시간(초), 초과시 남은 행은 다음 실행으로
+    param partitions : True면 만료 파티션 DROP + 앞으로 쓸 파티션 생성 먼저 수행
+    return : {'deleted', 'batches', 'dropped_partitions', 'elapsed', 'complete'(다 지웠으면 True)}
+    Raises : mariadb.Error (해당 batch rollback 후 전파, 이전 batch 삭제분은 이미 commit)
+    '''
+    _check_ident(table_name)
+    start = time.perf_counter()
+    report = {"deleted": 0, "batches": 0, "dropped_partitions": [], "elapsed": 0.0, "complete": False}
+
+    cutoff = cutoff_time(conn, days)
+    if partitions :
+        report["dropped_partitions"] = drop_expired_partitions(conn, table_name, cutoff)
+        add_partitions(conn, table_name)
+
+    key_cols = [_check_ident(c) for c in primary_key(conn, table_name)]
+    while True :
+        found, deleted = _delete_batch(conn, table_name, key_cols, cutoff, batch_size)
+        report["deleted"] += deleted
+        if found :
+            report["batches"] += 1
+        if found < batch_size :
+            report["complete"] = True
+            break
+        if time.perf_counter() - start + pause > time_budget :
+            logger.warning(f"보관기간 정리 시간 예산({time_budget:.0f}s) 초과, 남은 행은 다음 실행에서 삭제")
+            break
+        time.sleep(pause)
+
+    report["elapsed"] = time.perf_counter() - start
+    metrics.inc("retention_rows_total", report["deleted"], table=table_name)
+    metrics.observe("stage_seconds", report["elapsed"], stage="retention")
+    logger.info(f"{days}일 경과 데이터 {report['deleted']}건 삭제 ({table_name}, batch {report['batches']}개, "
+                f"파티션 DROP {len(report['dropped_partitions'])}개, {report['elapsed']:.1f}s"
+                f"{'' if report['complete'] else ', 미완료'})")
+    return report
+
+
+def _range_partitions(conn, table_name: str) -> tuple :
+    '''
+    return : (파티션 컬럼, [(파티션 이름, 상한 TO_DAYS 값 또는 None(MAXVALUE))])
+             RANGE(TO_DAYS()) 파티션 아니면 (None, [])
+    '''
+    with conn.cursor() as cursor :
+        cursor.execute(
+            "SELECT PARTITION_NAME, PARTITION_METHOD, PARTITION_EXPRESSION, PARTITION_DESCRIPTION "
+            "FROM information_schema.PARTITIONS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s "
+            "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION", (table_name,))
+        rows = cursor.fetchall()
+    parts = []
+    column = None
+    for name, method, expr, desc in rows :
+        m = _TO_DAYS.search(expr or "")
+        if method != "RANGE" or not m :
+            return None, []
+        column = m.group(1)
+        parts.append((name, None if desc == "MAXVALUE" else int(desc)))
+    return column, parts
+
+
+def _to_days(value) -> int :
+    # MariaDB TO_DAYS() 와 같은 값 (0000-00-00 기준 일수 = 서기 1년 1월 1일 ordinal + 365)
+    return value.toordinal() + 365
+
+
+def drop_expired_partitions(conn, table_name: str, cutoff) -> list :
+    '''
+    상한이 cutoff 날짜 이하인(모든 행이 cutoff 이전인) 파티션 DROP, return : DROP 한 파티션 이름 목록
+    파티션 컬럼이 RETENTION_COLUMN(save_at) 아니면 DROP 안함 (보관기간 기준이 달라짐)
+    '''
+    _check_ident(table_name)
+    column, parts = _range_partitions(conn, table_name)
+    if parts and column.lower() != RETENTION_COLUMN :
+        logger.warning(f"{table_name} 파티션 컬럼이 {column} ({RETENTION_COLUMN} 아님), 파티션 DROP 건너뜀 -> batch 삭제만 수행")
+        return []
+    limit = _to_days(cutoff.date() if hasattr(cutoff, "date") else cutoff)
+    expired = [name for name, bound in parts if bound is not None and bound <= limit]
+    if not expired :
+        return []
+    with conn.cursor() as cursor :
+        cursor.execute(f"ALTER TABLE {table_name} DROP PARTITION {', '.join(expired)}")
+    logger.info(f"만료 파티션 DROP ({table_name}) : {expired}")
+    return expired
+
+
+def add_partitions(conn, table_name: str, ahead_days: int = DEFAULT_AHEAD_DAYS) -> list :
+    '''
+    오늘부터 ahead_days 일 뒤까지 일별 파티션(pYYYYMMDD, 해당일 다음날 0시 미만) 없으면 pmax 에서 분리 생성
+    MAXVALUE 파티션이 있는 RANGE(TO_DAYS()) 테이블만 대상, return : 생성한 파티션 이름 목록
+    '''
+    _check_ident(table_name)
+    _, parts = _range_partitions(conn, table_name)
+    if not parts or parts[-1][1] is not None :
+        return []
+    maxvalue_name = _check_ident(parts[-1][0])
+    last_bound = max((b for _, b in parts if b is not None), default=0)
+    new_parts = []
+    for offset in range(ahead_days + 1) :
+        day = date.today() + timedelta(days=offset)
+        bound = _to_days(day + timedelta(days=1))
+        if bound > last_bound :
+            new_parts.append((f"p{day:%Y%m%d}", day + timedelta(days=1)))
+            last_bound = bound
+    if not new_parts :
+        return []
+    defs = ", ".join(f"PARTITION {name} VALUES LESS THAN (TO_DAYS('{upper:%Y-%m-%d}'))" for name, upper in new_parts)
+    with conn.cursor() as cursor :
+        cursor.execute(f"ALTER TABLE {table_name} REORGANIZE PARTITION {maxvalue_name} INTO "
+                       f"({defs}, PARTITION {maxvalue_name} VALUES LESS THAN MAXVALUE)")
+    names = [name for name, _ in new_parts]
+    logger.info(f"파티션 생성 ({table_name}) : {names}")
+    return names
+
+
+def main(argv: list = None) -> int :
+    '''
+    명령행 실행 (python -m pkg.retention, cli purge 명령)
+    param argv : 인자 리스트 (None이면 sys.argv)
+    return : 종료코드 0 정상, 1 에러
+    '''
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(prog="purge", description="보관기간 지난 기사 batch 삭제")
+    parser.add_argument("--conf", default=os.path.join(base_dir, ".db_conn_conf.ini"))
+    parser.add_argument("--table", action="append", dest="tables",
+                        help="정리할 테이블 (여러번 지정 가능, 기본 DEFAULT_TABLES 중 있는 테이블 전부)")
+    parser.add_argument("--days", type=int, help="보관 일수 (기본 설정파일 [retention] days)")
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--pause", type=float)
+    parser.add_argument("--time-budget", type=float)
+    parser.add_argument("--partitions", action="store_true", help="만료 파티션 DROP / 파티션 생성 먼저 수행")
+    args = parser.parse_args(argv)
+
+    from .logging_config import setup_logging
+    setup_logging(log_path=os.path.join(base_dir, "logs", "app.log"))
+    conn = None
+    try :
+        config = load_db_conf(args.conf)
+        policy = load_policy(config)
+        for key in ("days", "batch_size", "pause", "time_budget") :
+            if getattr(args, key) is not None :
+                policy[key] = getattr(args, key)
+        policy["partitions"] = policy["partitions"] or args.partitions
+        conn = get_connection(config)
+        tables = args.tables or existing_tables(conn)
+        failed = []
+        for table in tables :
+            # 테이블 하나 실패해도 나머지 테이블은 정리
+            try :
+                result = purge_expired(conn, table_name=table, **policy)
+            except Exception as e :
+                logger.error(f"보관기간 정리 실패 ({table}) : {e}")
+                failed.append(table)
+                continue
+            print(f"table={table} deleted={result['deleted']} batches={result['batches']} complete={result['complete']}")
+        if failed :
+            logger.critical(f"보관기간 정리 실패 테이블 : {failed}")
+            return 1
+        return 0
+    except Exception as e :
+        logger.critical(f"보관기간 정리 실패 : {e}")
+        return 1
+    finally :
+        if conn is not None :
+            conn.close()
+
+
+if __name__ == "__main__" :
+    sys.exit(main())
@@ -1,54 +1,97 @@
-import re
+from html.parser import HTMLParser
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
 import logging
+from . import http_cache
 
 logger = logging.getLogger("RSS_collector : " + __name__)
 
-def discover_feeds(page_url: str, timeout: int = 10) :
+FEED_TYPES = ("application/rss+xml", "application/atom+xml", "application/rdf+xml", "text/xml", "application/xml")
+SCAN_CHUNK = 64 * 1024   # 스캐너에 한번에 넣는 글자 수 (head 끝나고 표준 피드 찾았으면 나머지 본문은 읽지 않음)
+
+
+class FeedLinkScanner(HTMLParser) :
+    '''
+    <link rel="alternate">, <a href> 태그 속성만 모으는 스트리밍 스캐너
+    BeautifulSoup 처럼 문서 전체 트리를 만들지 않음 -> 홈페이지가 커도 필요한 태그만 처리
+    '''
+    def __init__(self) :
+        super().__init__(convert_charrefs=True)
+        self.alternates: list[str] = []   # 표준 피드 href
+        self.anchors: list[str] = []      # 모든 <a> href (휴리스틱용)
+        self.head_done = False
+
+    def handle_starttag(self, tag, attrs) :
+        if tag == "link" :
+            attr = dict(attrs)
+            rel = (attr.get("rel") or "").lower().split()
+            typ = (attr.get("type") or "").lower().strip()
+            href = (attr.get("href") or "").strip()
+            if "alternate" in rel and href and typ in FEED_TYPES :
+                self.alternates.append(href)
+        elif tag == "a" :
+            href = (dict(attrs).get("href") or "").strip()
+            if href :
+                self.anchors.append(href)
+
+    def handle_endtag(self, tag) :
+        if tag == "head" :
+            self.head_done = True
+
+
+def scan_feed_links(html) -> FeedLinkScanner :
+    '''
+    html(str|bytes) 조각씩 스캔, head 가 끝났고 표준 피드를 이미 찾았으면 거기서 중단
+    bytes 면 meta charset 보고 디코딩 (BeautifulSoup 과 같은 UnicodeDammit)
+    '''
+    if isinstance(html, bytes) :
+        from bs4.dammit import UnicodeDammit   # bytes 입력일 때만 필요 (bs4 패키지 import 비용)
+        html = UnicodeDammit(html, is_html=True).unicode_markup or ""
+    scanner = FeedLinkScanner()
+    for pos in range(0, len(html), SCAN_CHUNK) :
+        scanner.feed(html[pos:pos + SCAN_CHUNK])
+        if scanner.head_done and scanner.alternates :
+            break
+    else :
+        scanner.close()
+    return scanner
+
+def discover_feeds(page_url: str, timeout: int = 10, cache: http_cache.HttpCache = None) :
     """
     page_url(웹페이지)에서 RSS/Atom 피드 링크를 발견해서 절대 URL 목록으로 반환.
     우선순위
       1) <link rel="alternate" type="application/rss+xml|application/atom+xml"...>
       2) 본문 <a href="...rss|atom|feed|.xml"> 형태 휴리스틱
+    표준 피드는 <head> 안에 있으므로 head 에서 찾으면 나머지 본문은 스캔하지 않음
+    cache : HttpCache 전달시 조건부 GET (304면 캐시된 홈페이지 본문으로 탐색)
     """
-    headers = {"User-Agent": "Mozilla/5.0 (RSS-Discovery/1.0)"}
     ## 외부 통신 부분 
-    # TODO : 재시도 로직 전략 Retry기능(표준화) : requests.adapters -> HTTPAdapter, urllib3.util.retry -> Retry, requests.Session()
+    # 재시도(Retry), 연결 재사용(Session), User-Agent 는 http_client 공용 Session 에서 표준화
     try :
         logger.info(f"피드 탐색 시도 : {page_url}")
-        r = requests.get(page_url, headers=headers, timeout=timeout)
-        r.raise_for_status()
+        fetched = http_cache.fetch(page_url, cache=cache, timeout=timeout)
     except requests.exceptions.RequestException as e :
         # 접속실패.. 프로그램 죽지 않게 하며 로그만 남김
         logger.error(f"페이지 접속 실패 ({page_url}) : {e}")
         raise e
     
-    soup = BeautifulSoup(r.text, "html.parser")
+    # 전체 트리(BeautifulSoup) 대신 link/a 태그만 보는 스트리밍 스캔
+    scanner = scan_feed_links(http_cache.decode_text(fetched))
     feeds: list[str] = []  
 
     # 1) 표준 feed discovery
-    for link in soup.find_all("link", attrs={"rel": re.compile(r"\balternate\b", re.I)}):
-        
-        typ = (link.get("type") or "").lower().strip()
-        href = (link.get("href") or "").strip()
-        
-        if not href: 
-            continue
-        if typ in ("application/rss+xml", "application/atom+xml", "application/rdf+xml", "text/xml", "application/xml"):
-            full_url = feeds.append(urljoin(page_url, href))   # 경로 완성
-            logger.debug(f"표준 피드 발견 : {full_url}")
+    for href in scanner.alternates :
+        full_url = urljoin(page_url, href)   # 경로 완성
+        feeds.append(full_url)
+        logger.debug(f"표준 피드 발견 : {full_url}")
 
     # 2) 휴리스틱 (일부 사이트는 <a>로만 걸어둠)
     if not feeds:
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip() # href=True 조건으로 속성 없는경우 대해 이미 필터링 함.
-            if not href:             # 속성에 해당하는 value없는 경우 continue 진행
-                continue
+        for href in scanner.anchors :   # 스캐너에서 href 없는/빈 값은 이미 걸러냄
             h = href.lower()
             if any(k in h for k in ("rss", "atom", "feed")) or h.endswith((".rss", ".xml")):
-                full_url = feeds.append(urljoin(page_url, href))
+                full_url = urljoin(page_url, href)
+                feeds.append(full_url)
                 logger.debug(f"휴리스틱 피드 발견 : {full_url}")
 
     uniq = []
@@ -1,32 +1,39 @@
 """rss_ps 모듈 전체 실행 흐름
-run_collection() 시작 -> get_rss() 호출 -> parse_feed()호출 -> 모든 데이터 하나의 리스트로 병합 -> main 반환
+run_collection() 시작 -> get_rss() 호출(TargetRegistry 저장 목록 있으면 생략) -> fetcher.fetch_all() 병렬 다운로드 -> parse_feed()호출 -> 모든 데이터 하나의 리스트로 병합 -> 중복 기사 병합(dedup) -> main 반환
 get_rss()            : rss모듈의 discover_feeds() 통해서 url 홈페이지 내 rss안내 페이지 url 추출 반환
+fetch_all()          : fetcher 모듈, 카테고리별 xml 문서 동시 다운로드 (workers, per_host, deadline)
 parse_feed()         : idx, title, link, written_dt등 DB컬럼에 맞는 데이터 추출하여 튜플로 구성 반환
+iter_feed()          : parse_feed()의 generator 버전, 스트리밍 모드(pipeline 모듈)에서 사용
 
 Raises: 해당 모듈 내 발생하는 모든 에러는 main으로 전파
 
 """
 
 import logging
+import time
 from . import rss
-import feedparser
+from . import fetcher
+from . import fastfeed
+from . import http_cache
+from . import metrics
+from .target_registry import TargetRegistry
+from .seen_state import SeenState, entry_digest
 import requests
-from urllib.parse import urlparse, parse_qs
-from datetime import datetime # datetime 모듈 안에서 datetime 클래스만 가져옴
-from bs4 import BeautifulSoup
+from .normalize import Normalizer
+from .dedup import dedup_rows
 
 logger = logging.getLogger("RSS_collector : " + __name__) # 현재 모듈에 적용할 로거 생성
 
-def get_rss() :
+def get_rss(cache: http_cache.HttpCache = None, url: str = "https://www.boannews.com/") :
     '''
     보안뉴스 rss안내 페이지에서 카테고리별 xml주소 리스트 생성
     1. 메인에서 rss페이지 링크 검색 
     2. 카테고리별 xml주소와 이름 
+    param cache : HttpCache 전달시 홈페이지, rss안내 페이지 모두 조건부 GET
+    param url : 보안뉴스 홈페이지 주소 (sources.boannews 어댑터 base_url)
     '''
     # 1.
-    url = "https://www.boannews.com/"
-    
-    rss_asp_list = rss.discover_feeds(url) # discover_feeds()에러 발생시 바로 호출부 이동 -> rss_collection()
+    rss_asp_list = rss.discover_feeds(url, cache=cache) # discover_feeds()에러 발생시 바로 호출부 이동 -> rss_collection()
     if not rss_asp_list :
         # rss.py에서 에러처리 하여 error로그 찍었음. 여기서는 흐름만 기록
         logger.warning("활성화된 rss 안내 페이지 찾지 못했습니다.")
@@ -39,135 +46,229 @@ def get_rss() :
     # TODO : 예외처리(Exception Handling) 네트워크연결끊김 or 서버에러시 프로그램 중단 방지 등 try영역 실행중 에러발생시 except로 점프 
     # 직접 통신부분만 예외처리 유지
     try :
-        response = requests.get(rss_asp, timeout = 10)
-        response.raise_for_status()
+        fetched = http_cache.fetch(rss_asp, cache=cache, timeout = 10)
     
     except requests.exceptions.RequestException as e:
         logger.error(f"rss안내 페이지 ({rss_asp}) 접속 실패 : {e}")
         raise e
     
-    html = response.text
-    soup = BeautifulSoup(html,"html.parser")          # BeautifulSoup 객체 soup 생성
+    # bs4 는 카테고리 목록 재탐색할 때만 필요 -> 저장된 목록 쓰는 실행에서는 import 생략
+    from bs4 import BeautifulSoup, SoupStrainer
+    html = http_cache.decode_text(fetched)
+    # 표(tr) 부분만 트리로 만들어서 먼저 시도 (SoupStrainer), 페이지 구조가 달라 못찾으면 전체 트리로 재시도
+    rss_targets = _extract_targets(BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("tr")))
+    if not rss_targets :
+        logger.debug("tr 부분 파싱으로 메인 카테고리 못찾음, 전체 페이지 파싱으로 재시도")
+        rss_targets = _extract_targets(BeautifulSoup(html, "html.parser"))
+
+    if rss_targets is None :
+        # 메인 카테고리 자체를 찾지 못한 경우
+        logger.error("메인 카테고리 태그 찾지 못함(사이트 구조 변경 의심)")
+        raise Exception("메인 카테고리 태그를 찾을 수 없습니다.")
+    # 태그는 찾았는데 결과 리스트가 비어있는 경우
+    if not rss_targets :
+        raise Exception("메인 카테고리 내 카테고리별 rss.xml 주소 리스트 찾지 못했습니다.")
+
+    logger.info("메인 카테고리 내 카테고리별 rss.xml 주소 리스트 추출 성공 합니다")
+    return rss_targets
+
+def _extract_targets(soup) :
+    '''
+    rss안내 페이지 soup 에서 "메인 카테고리" 표의 카테고리별 xml 주소 추출
+    return : [{'category', 'url'}], 메인 카테고리 태그 없거나 표 구조 다르면 None
+    '''
     main_tag = soup.find("h1", string="메인 카테고리")  # "메인 카테고리"라는 텍스트가 들어있는 태그
+    if not main_tag :
+        return None
+    # h1 태그의 부모(td) -> 그 부모(tr)
+    title_tr = main_tag.find_parent("tr")
+    # 바로 아래에 실제 데이터가 있는 다음 줄(tr)로 이동
+    data_tr = title_tr.find_next_sibling("tr") if title_tr else None
+    if data_tr is None :
+        return None
 
-    if main_tag:
-        # h1 태그의 부모(td) -> 그 부모(tr)
-        title_tr = main_tag.find_parent("tr")
-    
-        # 바로 아래에 실제 데이터가 있는 다음 줄(tr)로 이동
-        data_tr = title_tr.find_next_sibling("tr")
-    
-        # rss 주소찾기 : input태그 중에서 rss주소 있는거
-        target_inputs = data_tr.select('input[name="rss"]')
-    
-        rss_targets = []
-        for inp in target_inputs:
-            xml_url = inp.get('value')
-        
-            # 카테고리 이름은 같은 행(tr)의 첫 번째 칸(td)에서 가져옴.
-            parent_tr = inp.find_parent('tr')
-            category_name = parent_tr.find('td').get_text(strip=True)
-        
-            rss_targets.append({
-                "category": category_name,
-                "url": xml_url
-            })
-        # 태그는 찾았는데 결과 리스트가 비어있는 경우
-        if not rss_targets :
-            raise Exception("메인 카테고리 내 카테고리별 rss.xml 주소 리스트 찾지 못했습니다.")
-        
-        logger.info("메인 카테고리 내 카테고리별 rss.xml 주소 리스트 추출 성공 합니다")        
-        return rss_targets
-    # 메인 카테고리 자체를 찾지 못한 경우
-    logger.error("메인 카테고리 태그 찾지 못함(사이트 구조 변경 의심)")
-    raise Exception("메인 카테고리 태그를 찾을 수 없습니다.")
+    # rss 주소찾기 : input태그 중에서 rss주소 있는거
+    rss_targets = []
+    for inp in data_tr.select('input[name="rss"]'):
+        xml_url = inp.get('value')
+        # 카테고리 이름은 같은 행(tr)의 첫 번째 칸(td)에서 가져옴.
+        parent_tr = inp.find_parent('tr')
+        category_name = parent_tr.find('td').get_text(strip=True)
+        rss_targets.append({
+            "category": category_name,
+            "url": xml_url
+        })
+    return rss_targets
+
+def _default_adapter() :
+    # 어댑터 지정 안하면 보안뉴스 어댑터 (sources.boannews 가 rss_ps를 import 하므로 사용 시점에 import)
+    from .sources import get_adapter
+    return get_adapter("boannews")
 
-def parse_feed(target) :
+def iter_feed(target, content: bytes = None, state: SeenState = None, adapter = None,
+              normalizer: Normalizer = None) :
     '''
-    1. feedparser.parse() : 세부 카테고리의 url에 네트워크 통신접속 xml 데이터 다운로드 파이썬 객체로 파싱, 규격화된 구조 -> feedparser 사용
+    parse_feed()의 generator 버전 : 기사 튜플을 하나씩 yield (스트리밍 모드에서 파싱 즉시 DB 저장 단계로 전달)
+    1. fastfeed.load_entries() : fetcher가 내려받은 xml bytes(content)에서 기사 필드만 빠르게 파싱 (iterparse)
+                            깨진 xml 이거나 adapter.parser == "feedparser" 면 feedparser.parse()
+                            content 없으면 기존처럼 feedparser가 세부 카테고리의 url에 직접 접속해서 다운로드
     2. 규격화된 rss/atom피드 전용 태그들 파싱
-        2-1. urllib.parse 라이브러리 urlparse(),parse_qs() : db테이블 컬럼에 맞는 데이터 분리
-        2-2. datetime 라이브러리 strptime() : datetime 객체로 반환 , 날짜 시간 형식 변환 
-    3. return : 1개의 기사에 대한 컬럼 데이터 튜플들의 리스트로 구성(없으면 [])  -> run_collection()
+        2-1. adapter.extract_id() : 사이트별 고유번호 추출 (보안뉴스는 미리 컴파일한 정규식으로 ?idx= 값)
+        2-2. normalizer.written_dt() : published 원본(안되면 published_parsed) 시각을 adapter.timezone 기준 날짜 시간 형식으로 변환
+        2-3. normalizer.description() : 요약 태그 제거, 공백 정리, adapter.description_max 글자로 제한
+    3. yield : 1개의 기사에 대한 컬럼 데이터 튜플 (없으면 아무것도 yield 하지 않음)
                 튜플 구조 (idx(int), title(str), link(str), creator(str), written_dt(str), description(str), category(str))
     param target : run_collection()에서 전달받은 카테고리 security, it, safety, SecurityWorld 순서로 {'category': 'IT', 'url': '...'} 형태
+    param content : fetcher.fetch_all()로 미리 받아둔 xml 원본 bytes (None이면 url 직접 접속)
+    param state : SeenState 전달시 증분 모드, 신규/변경 기사만 변환해서 반환 (변경없는 기사는 idx 추출 직후 건너뜀)
+    param adapter : sources.SourceAdapter, 사이트별 고유번호 추출(extract_id)/튜플 구성(map_entry) (None이면 보안뉴스)
+    param normalizer : normalize.Normalizer, 실행 단위 날짜 대체값/경고 집계 공유 (None이면 이 카테고리 전용으로 생성 후 끝에 요약 로그)
     '''
-    collected_data = []
+    adapter = adapter or _default_adapter()
+    own_normalizer = normalizer is None
+    if own_normalizer :
+        normalizer = Normalizer(adapter.timezone)
     logger.debug(f"파싱시작 카테고리 {target['category']}")
     
     # 1. rss 데이터 로드
-    feed = feedparser.parse(target['url'])  # feedparser 내부적으로 네트워크 연결 실패시 빈 feed객체 반환
-    if not feed.entries:
-        logger.info(f"해당 [{target['category']}]에 새로운 기사가 없습니다.")
-        return []
+    category = target['category']
+    if content is not None :
+        entries = fastfeed.load_entries(content, backend=adapter.parser, label=category)
+    else :
+        # feedparser 내부적으로 네트워크 연결 실패시 빈 feed객체 반환
+        import feedparser
+        entries = feedparser.parse(target['url']).entries
+    if not entries:
+        logger.info(f"해당 [{category}]에 새로운 기사가 없습니다.")
+        return
+    metrics.inc("entries_seen_total", len(entries), category=category)
     
     # 2. 기사 순회 ( 각 기사별 예외 처리 )
-    for entry in feed.entries : # feed.entries 리스트 하나씩 순회하며 개별 기사 접근
+    for entry in entries : # 기사 리스트 하나씩 순회하며 개별 기사 접근
         try :
             target_link = entry.link
             logger.debug(f"접근 대상 기사 : {target_link}")
-            # urllib.parse 라이브러리 : urlparse(), parse_qs() -> url내 ?idx=123 값을 찾아옴
-            # urlparse() : url 에서 ? 뒷부분 질의문을 문자열로 남김
-            target_query = urlparse(target_link).query
-            # parse_qs() : 질의문 문자열을 딕트[list]로 변환, get(key) : key의 value        
-            # get() : idx 키의 value 추출, 없으면 None 비어있으면 '' 반환 
-            target_idx = parse_qs(target_query).get('idx',[None])[0] 
+            # 사이트별 고유번호 추출 : 보안뉴스는 url내 ?idx=123 값 (sources.base.SourceAdapter.extract_id)
+            target_idx = adapter.extract_id(target_link)
             if not target_idx :
-                # None,'',0 등 false -> db저장 불가 해당 기사 건너뛰기
-                logger.warning(f"idx 추출 실패: {target['category']} - {entry.title[:15]}")
+                # None,'',0 등 false -> db저장 불가 해당 기사 건너뛰기 (경고는 집계 후 실행 끝에 한 줄로)
+                normalizer.count("idx 추출 실패", f"{category} - {entry.title[:15]}")
                 continue
-            # 날짜 변환 (실패시 현재 시간 대체)
-            raw_date = entry.get('published','')
-            written_dt = ""
-            if raw_date :
-                try :
-                    dt_obj = datetime.strptime(raw_date,'%a, %d, %b, %Y, %H:%M:%S %z')
-                    # strftime() : datetime으로 포맷한 객체를 Mariadb DATETIME 형식(YYYY-MM-DD HH:MM:SS)으로 변환 후 문자열로 반환
-                    written_dt = dt_obj.strftime('%Y-%m-%d %H:%M:%S')
-                except Exception as e :
-                    logger.warning(f"날짜 변환 실패 {raw_date}:{e}로 현재시간 대체")
-                    written_dt = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            else :
-                written_dt = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            # 증분 모드 : 원본 필드 해시로 변경 여부 먼저 판단 -> 변경없는 기사는 날짜 변환, 튜플 생성 생략
+            digest = None
+            if state is not None :
+                digest = entry_digest(entry.title, target_link, entry.get('author',''),
+                                      entry.get('published',''), entry.get('summary',''))
+                if state.classify(target['category'], int(target_idx), digest, adapter.monotonic_ids) is None :
+                    continue
+            # 날짜 변환 (실패시 실행 시작 시각 대체) : Mariadb DATETIME 형식(YYYY-MM-DD HH:MM:SS) 문자열
+            written_dt = normalizer.written_dt(entry)
                 
-            news_data_set = (
-            int(target_idx)                         # idx (Unique Key)
-                ,entry.title.strip()                # title
-                ,target_link                        # link
-                ,entry.get('author','보안뉴스')      # creator
-                ,written_dt                         # written_dt (변환된 날짜)
-                ,entry.get('summary','')            # description
-                ,target['category']                 # category
-            )
-            collected_data.append(news_data_set)
+            # 요약 태그 제거/길이 제한 (같은 원문은 해시 캐시 재사용)
+            description, full = normalizer.description(entry.get('summary', ''), adapter.description_max,
+                                                       adapter.description_full)
+            # (idx, title, link, creator, written_dt, description, category) 튜플 구성은 어댑터가 담당
+            news_data_set = adapter.map_entry(entry, int(target_idx), written_dt, target, description=description)
+            if full is not None :
+                news_data_set += (full,)   # description_full 컬럼 (압축 원문)
+            if state is not None :
+                state.stage(target['category'], int(target_idx), digest, adapter.monotonic_ids)  # DB 저장 성공 후 main에서 commit()
         except Exception as e :
             # 기사 한건마다 처리 중 발생하는 모든 예상치 못한 에러에 대해 전체 수집과정 멈추지 않고 지속.
             logger.error(f"기사 처리 중 예외 발생하여 해당 기사 건너뜁니다: {e}")
             continue
-        
-    return collected_data    
+        yield news_data_set
+    if own_normalizer :
+        normalizer.log_summary()
+
+def parse_feed(target, content: bytes = None, state: SeenState = None, adapter = None,
+               normalizer: Normalizer = None) :
+    '''
+    iter_feed() 결과를 리스트로 모아서 반환 (없으면 [])  -> run_collection()
+    튜플 구조 (idx(int), title(str), link(str), creator(str), written_dt(str), description(str), category(str))
+    '''
+    return list(iter_feed(target, content, state=state, adapter=adapter, normalizer=normalizer))
+
+def resolve_targets(cache: http_cache.HttpCache = None, registry: TargetRegistry = None,
+                    refresh_targets: bool = False, select = None, adapter = None) -> list :
+    '''
+    이번 실행에서 수집할 카테고리 목록 결정 (run_collection(), pipeline.run_streaming() 공용)
+    registry 전달시 저장된 목록 사용, ttl 경과/연속 실패/강제 갱신시에만 get_rss()
+    adapter 전달시 get_rss() 대신 adapter.discover()
+    '''
+    def discover() :
+        with metrics.timer("stage_seconds", stage="discover") :
+            return adapter.discover(cache=cache) if adapter is not None else get_rss(cache=cache)
+    # get_rss() 에러 발생시 여기서 바로 호출부로 전파
+    if registry is not None :
+        targets = registry.get_targets(discover, force=refresh_targets)
+    else :
+        targets = discover()
+    if select is not None :
+        targets = select(targets)
+    return targets
 
-def run_collection():
+def run_collection(workers: int = fetcher.DEFAULT_WORKERS, per_host: int = fetcher.DEFAULT_PER_HOST,
+                   deadline: float = fetcher.DEFAULT_DEADLINE, cache: http_cache.HttpCache = None,
+                   registry: TargetRegistry = None, refresh_targets: bool = False, state: SeenState = None,
+                   select = None, adapter = None):
     """
     전체 수집 프로세스
-    1. get_rss() : rss 목록 리스트 가져오기
-    2. parse_feed() : 각 카테고리 대상별 기사 파싱
-    3. return : 최종 리스트 -> main
+    1. get_rss() : rss 목록 리스트 가져오기 (registry 전달시 저장된 목록 사용, ttl 경과/연속 실패/강제 갱신시에만 get_rss())
+    2. fetcher.fetch_all() : 카테고리별 xml 문서 병렬 다운로드 (deadline 초과 카테고리는 건너뛰고 부분 결과 사용)
+    3. parse_feed() : 다운로드 성공한 카테고리 대상별 기사 파싱 (304 변경없음 카테고리는 파싱, DB저장 모두 건너뜀)
+    4. dedup_rows() : 여러 카테고리에 실린 같은 기사(idx) 1건으로 병합, category 는 "보안,IT" 다중 값
+    5. return : 최종 리스트 -> main
+    param workers, per_host, deadline : fetcher.fetch_all() 동시성 설정 그대로 전달
+    param cache : HttpCache 전달시 조건부 GET 사용, 파싱 끝난 카테고리만 검증값 기록(cache.store())
+                  파일 저장(cache.save())은 DB 저장 성공 후 main에서
+    param registry : TargetRegistry (None이면 매번 get_rss())
+    param refresh_targets : True면 registry 저장 목록 무시하고 재탐색
+    param state : SeenState 전달시 증분 모드 (신규/변경 기사만 반환), 상태 저장(state.commit())은 DB 저장 성공 후 main에서
+    param select : 전체 카테고리 목록 받아서 이번에 수집할 목록만 반환하는 함수 (데몬 모드 카테고리별 주기)
+    param adapter : sources.SourceAdapter (None이면 보안뉴스), rate_limit 설정시 호스트별 초당 요청 수 제한
     """
-    logger.info("보안뉴스 RSS 수집 run_collect() 시작")
+    logger.info(f"{adapter.site if adapter is not None else '보안뉴스'} RSS 수집 run_collect() 시작")
     all_collected_data = []
+    normalizer = Normalizer(adapter.timezone if adapter is not None else None)   # 날짜 대체값/경고 집계 실행 단위 공유
     
     # 1. 
     # get_rss() 에러 발생시 여기서 바로 main.py로 향함 아래 for문 실행x
-    targets = get_rss()
+    targets = resolve_targets(cache=cache, registry=registry, refresh_targets=refresh_targets, select=select,
+                              adapter=adapter)
     
     # 2.
-    for target in targets:
+    results = fetcher.fetch_all(targets, workers=workers, per_host=per_host, deadline=deadline, cache=cache,
+                                rate_limit=adapter.rate_limit if adapter is not None else None)
+    if registry is not None :
+        registry.report(results)  # 주소별 연속 실패 기록 -> 다음 실행 재탐색 여부 판단
+    
+    # 3.
+    parse_start = time.perf_counter()
+    for result in results:
+        target = result["target"]
+        if result["error"] :
+            # 실패 카테고리는 fetch_all()에서 warning 로그 남김, 나머지 카테고리는 계속 진행
+            continue
+        if result["not_modified"] :
+            logger.info(f"[-] 카테고리 변경없음(304) 건너뜀: {target['category']}")
+            continue
         logger.info(f"[*] 카테고리 수집 중: {target['category']}")
-        category_news = parse_feed(target)
+        with metrics.timer("parse_seconds", category=target['category']) :
+            category_news = parse_feed(target, result["content"], state=state, adapter=adapter, normalizer=normalizer)
         all_collected_data.extend(category_news) # 리스트 합치기
-        
+        if cache is not None :
+            cache.store(target['url'], result)   # 파싱까지 끝난 카테고리만 검증값 기록
+        result["content"] = None   # 파싱 끝난 xml 본문 해제 (results 는 카테고리 수만큼 남아있음)
+    metrics.observe("stage_seconds", time.perf_counter() - parse_start, stage="parse")
+    
+    # 4.
+    all_collected_data = dedup_rows(all_collected_data)
     logger.info(f"수집 완료: 총 {len(all_collected_data)}건")
+    normalizer.log_summary()
+    if state is not None :
+        logger.info(state.summary())
+        state.export_metrics()
     return all_collected_data
 
 
@@ -0,0 +1,110 @@
+"""scheduler 모듈 : 데몬 모드용 프로세스 내부 스케줄러
+Scheduler.every()  : n초 주기 작업 등록
+Scheduler.daily()  : 매일 HH:MM 작업 등록
+run_forever()      : stop() 호출(SIGTERM 등) 전까지 가장 먼저 도래하는 작업부터 순서대로 실행
+                     작업은 스케줄러 스레드 하나에서 차례로 실행 -> 같은 작업 중복 실행 없음
+file_lock()        : 프로세스 간 중복 실행 방지 파일 잠금 (cron main.py와 데몬이 동시에 수집하지 않도록)
+"""
+
+import fcntl
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+
+class Job :
+    '''
+    param name : 로그 표시용 작업 이름
+    param func : 인자 없는 실행 함수
+    param interval : 주기(초), daily_at과 둘 중 하나
+    param daily_at : 매일 실행 시각 "HH:MM"
+    '''
+    def __init__(self, name: str, func, interval: float = None, daily_at: str = None, run_now: bool = False) :
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.daily_at = daily_at
+        self.next_run = time.time() if run_now else self._next_after(time.time())
+
+    def _next_after(self, now: float) -> float :
+        if self.interval is not None :
+            return now + self.interval
+        hour, minute = map(int, self.daily_at.split(":"))
+        base = datetime.fromtimestamp(now)
+        nxt = base.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if nxt <= base :
+            nxt += timedelta(days=1)
+        return nxt.timestamp()
+
+    def reschedule(self) -> None :
+        # 실행 끝난 시점 기준으로 다음 실행 계산 -> 작업이 길어져도 밀린 실행을 몰아서 하지 않음
+        self.next_run = self._next_after(time.time())
+
+
+class Scheduler :
+    def __init__(self) :
+        self.jobs: list[Job] = []
+        self._stop = threading.Event()
+
+    def every(self, seconds: float, name: str, func, run_now: bool = True) -> Job :
+        job = Job(name, func, interval=seconds, run_now=run_now)
+        self.jobs.append(job)
+        return job
+
+    def daily(self, at: str, name: str, func) -> Job :
+        job = Job(name, func, daily_at=at)
+        self.jobs.append(job)
+        return job
+
+    def stop(self) -> None :
+        '''실행중 작업은 끝까지 마치고 루프 종료 (시그널 핸들러에서 호출)'''
+        self._stop.set()
+
+    @property
+    def stopped(self) -> bool :
+        return self._stop.is_set()
+
+    def run_forever(self) -> None :
+        logger.info(f"스케줄러 시작 : 작업 {[job.name for job in self.jobs]}")
+        while not self._stop.is_set() :
+            job = min(self.jobs, key=lambda j: j.next_run)
+            wait_sec = job.next_run - time.time()
+            # Event.wait()로 대기 -> stop() 호출되면 즉시 깨어남
+            if wait_sec > 0 and self._stop.wait(wait_sec) :
+                break
+            start = time.perf_counter()
+            try :
+                job.func()
+            except Exception as e :
+                # 작업 하나 실패해도 데몬은 계속 유지, 다음 주기에 재시도
+                logger.error(f"[{job.name}] 작업 실패 : {e}")
+            logger.debug(f"[{job.name}] 작업 소요 {time.perf_counter() - start:.2f}s")
+            job.reschedule()
+        logger.info("스케줄러 종료")
+
+
+@contextmanager
+def file_lock(path: str) :
+    '''
+    비차단 파일 잠금 : 잠금 획득시 True, 다른 프로세스가 잡고 있으면 False 로 with 블록 진행
+        with file_lock(lock_path) as acquired :
+            if not acquired : return
+    '''
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try :
+        try :
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError :
+            yield False
+            return
+        try :
+            yield True
+        finally :
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally :
+        os.close(fd)
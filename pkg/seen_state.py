@@ -0,0 +1,122 @@
+"""seen_state 모듈 : 증분 수집용 카테고리별 기사 상태 저장
+카테고리마다 아래 두가지 기록 (.seen_state.json)
+    hwm    : 지금까지 저장한 가장 큰 idx (high-water mark)
+    hashes : 최근 기사 keep개의 {idx: 내용 해시}
+
+classify() 판정 기준
+    - hashes에 있는 idx : 해시 같으면 건너뜀(None), 다르면 "updated"
+    - hwm 이하 idx      : 이미 저장된 오래된 기사 -> 건너뜀(None)
+                          (monotonic=False 면 생략 : 링크 해시 번호처럼 커지는 순서가 아닌 idx, hashes 로만 판정)
+    - 그 외             : "new"
+monotonic=False 카테고리는 hashes 를 idx 크기 대신 마지막 저장 순서로 keep개 유지
+판정 결과는 stage()로 보류해두고 DB 저장 성공 후 commit() 해야 파일에 반영
+-> DB 저장 실패시 다음 실행에서 같은 기사 다시 신규/변경으로 판정
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from . import metrics
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_KEEP = 500  # 카테고리별 해시 보관 기사 수 (피드 1회 기사 수보다 넉넉하게)
+
+
+def entry_digest(*fields) -> str :
+    '''기사 원본 필드(제목, 링크, 작성자, 날짜, 요약)로 내용 해시 생성 -> 변경 여부 판단용'''
+    h = hashlib.sha1()
+    for field in fields :
+        h.update(str(field).encode("utf-8"))
+        h.update(b"\x1f")   # 필드 구분자 (필드 경계 바뀌어도 같은 해시 나오는 것 방지)
+    return h.hexdigest()[:16]
+
+
+class SeenState :
+    '''
+    param path : 상태 저장 json 파일 경로 (main.py 옆 .seen_state.json)
+    param keep : 카테고리별 해시 보관 기사 수
+    '''
+    def __init__(self, path: str, keep: int = DEFAULT_KEEP) :
+        self.path = path
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._data = self._load()
+        self._pending = []   # [(category, idx, digest)]
+        self.stats = {"new": 0, "updated": 0, "skipped": 0}
+
+    def _load(self) -> dict :
+        try :
+            with open(self.path, encoding="utf-8") as f :
+                return json.load(f)
+        except FileNotFoundError :
+            return {}
+        except (OSError, ValueError) as e :
+            # 상태 파일 깨진 경우 전체 기사를 신규로 보고 진행 (DB는 upsert라 안전)
+            logger.warning(f"증분 상태 파일 읽기 실패, 전체 수집 진행 : {e}")
+            return {}
+
+    def reload(self) -> None :
+        '''commit() 안된 보류 상태 버리고 파일 기준으로 되돌림 (데몬 모드 DB 저장 실패시)'''
+        with self._lock :
+            self._data = self._load()
+            self._pending = []
+            self.stats = {"new": 0, "updated": 0, "skipped": 0}
+
+    def classify(self, category: str, idx: int, digest: str, monotonic: bool = True) :
+        '''
+        param monotonic : idx 가 새 기사일수록 커지는 번호인지 (False면 hwm 비교 안함, adapter.monotonic_ids)
+        return : "new" / "updated" / None(변경없음, 건너뜀)
+        '''
+        with self._lock :
+            cat = self._data.get(category)
+            if cat is None :
+                kind = "new"
+            elif str(idx) in cat["hashes"] :
+                kind = None if cat["hashes"][str(idx)] == digest else "updated"
+            elif monotonic and idx <= cat["hwm"] :
+                kind = None
+            else :
+                kind = "new"
+            self.stats[kind or "skipped"] += 1
+        return kind
+
+    def stage(self, category: str, idx: int, digest: str, monotonic: bool = True) -> None :
+        '''DB 저장 대상 기사 상태 보류 (commit() 전까지 파일 반영 안함), monotonic 은 classify() 와 같은 값'''
+        with self._lock :
+            self._pending.append((category, idx, digest, monotonic))
+
+    def commit(self) -> None :
+        '''보류된 기사 상태 반영 + 카테고리별 최근 keep개만 남기고 파일 저장 (DB 저장 성공 후 호출)'''
+        with self._lock :
+            for category, idx, digest, monotonic in self._pending :
+                cat = self._data.setdefault(category, {"hwm": 0, "hashes": {}})
+                cat["hwm"] = max(cat["hwm"], idx)
+                if not monotonic :
+                    cat["monotonic"] = False
+                    cat["hashes"].pop(str(idx), None)   # 다시 저장한 기사는 맨 뒤로 (최근 순서 유지)
+                cat["hashes"][str(idx)] = digest
+            for cat in self._data.values() :
+                if len(cat["hashes"]) > self.keep :
+                    if cat.get("monotonic", True) :
+                        recent = sorted(cat["hashes"], key=int)[-self.keep:]
+                    else :
+                        recent = list(cat["hashes"])[-self.keep:]
+                    cat["hashes"] = {k: cat["hashes"][k] for k in recent}
+            self._pending = []
+            self.stats = {"new": 0, "updated": 0, "skipped": 0}   # 데몬 모드에서 실행마다 새로 집계
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f :
+                json.dump(self._data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def summary(self) -> str :
+        return f"증분 수집 결과 : 신규 {self.stats['new']}건, 변경 {self.stats['updated']}건, 건너뜀 {self.stats['skipped']}건"
+
+    def export_metrics(self) -> None :
+        '''이번 실행 판정 결과를 계측 카운터에 더함 (commit()/reload() 전에 1번만 호출)'''
+        for kind, cnt in self.stats.items() :
+            metrics.inc("entries_classified_total", cnt, result=kind)
@@ -0,0 +1,80 @@
+"""sources 패키지 : 사이트별 수집 어댑터
+get_adapter()  : 어댑터 종류 이름으로 어댑터 객체 생성
+load_sites()   : sites.ini 읽어서 활성화된 사이트 어댑터 목록 반환
+
+sites.ini 형식 (섹션 이름 = 사이트 키)
+    [boannews]
+    adapter = boannews          ; boannews / rss(범용)
+    base_url = https://www.boannews.com/
+    rate_limit = 2              ; 호스트당 초당 최대 요청 수 (선택)
+    parser = fast               ; 피드 파서 fast(기본, 실패시 feedparser) / feedparser (선택)
+    description_max = 500       ; 요약 태그 제거 후 최대 글자 수, 0 이면 자르지 않음 (선택)
+    description_full = false    ; true면 요약 원문 압축본도 description_full 컬럼에 저장 (선택)
+    timezone = +09:00           ; 시간대 없는 작성일시 저장 기준, 고정 시차 또는 Asia/Seoul 같은 이름 (선택)
+    enabled = true
+    ; 범용 어댑터 선택 항목 : id_param, id_pattern, default_creator, feeds(카테고리 = 주소 줄바꿈 구분)
+"""
+
+import configparser
+import logging
+
+from .base import SourceAdapter
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+
+def get_adapter(kind: str, site: str = None, **options) -> SourceAdapter :
+    '''
+    param kind : 어댑터 종류 (boannews, rss)
+    param site : 사이트 키 (None이면 kind 사용)
+    param options : 어댑터 생성자 인자 (base_url, id_param, rate_limit ...)
+    '''
+    # 어댑터 모듈은 사용할 때만 import (boannews 어댑터가 rss_ps를 import 하므로 순환 import 방지)
+    if kind == "boannews" :
+        from .boannews import BoannewsAdapter
+        return BoannewsAdapter(site=site or kind, **options)
+    if kind == "rss" :
+        from .generic import GenericRSSAdapter
+        return GenericRSSAdapter(site=site or kind, **options)
+    raise ValueError(f"알 수 없는 어댑터 종류 : {kind}")
+
+
+def _parse_feeds(raw: str) -> dict :
+    feeds = {}
+    for line in raw.splitlines() :
+        if "=" in line :
+            category, url = line.split("=", 1)
+            feeds[category.strip()] = url.strip()
+    return feeds
+
+
+def load_sites(path: str) -> list :
+    '''
+    sites.ini 읽어서 enabled 사이트 어댑터 목록 반환
+    Raises : FileNotFoundError (설정파일 없음), ValueError (어댑터 종류 오류)
+    '''
+    config = configparser.ConfigParser()
+    if config.read(path, encoding="utf-8") == [] :
+        logger.error(f"사이트 설정 파일 못찾았습니다 : {path}")
+        raise FileNotFoundError(f"사이트 설정파일 없음: {path}")
+
+    adapters = []
+    for site in config.sections() :
+        sec = config[site]
+        if not sec.getboolean("enabled", fallback=True) :
+            continue
+        options = {"base_url": sec["base_url"]}
+        if "rate_limit" in sec :
+            options["rate_limit"] = sec.getfloat("rate_limit")
+        if "description_max" in sec :
+            options["description_max"] = sec.getint("description_max")
+        if "description_full" in sec :
+            options["description_full"] = sec.getboolean("description_full")
+        for key in ("id_param", "id_pattern", "default_creator", "parser", "timezone") :
+            if key in sec :
+                options[key] = sec[key]
+        if "feeds" in sec :
+            options["feeds"] = _parse_feeds(sec["feeds"])
+        adapters.append(get_adapter(sec.get("adapter", "rss"), site=site, **options))
+    logger.info(f"사이트 설정 로드 : {[a.site for a in adapters]}")
+    return adapters
@@ -0,0 +1,79 @@
+"""sources.base 모듈 : 사이트별 수집 어댑터 기본 클래스
+사이트마다 달라지는 부분 3가지만 어댑터로 분리, 나머지(다운로드, 파싱 흐름, DB 저장)는 공용
+    discover()    : 수집 대상 카테고리 목록 [{'category', 'url'}] 생성
+    extract_id()  : 기사 링크에서 사이트 내 고유 번호(int) 추출
+    map_entry()   : 기사 객체(fastfeed.FastEntry / feedparser) -> DB 튜플 (idx, title, link, creator, written_dt, description, category)
+"""
+
+import logging
+
+from ..description import DEFAULT_MAX_CHARS
+from ..fastfeed import BACKENDS
+from ..normalize import id_pattern
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+
+class SourceAdapter :
+    '''
+    param site : 사이트 키 (sites.ini 섹션 이름, 공용 테이블 site 컬럼 값)
+    param base_url : 사이트 홈페이지 주소 (피드 탐색 시작점)
+    param id_param : 기사 링크 질의문에서 고유번호가 들어있는 키 (예: ?idx=123 -> "idx")
+    param default_creator : 작성자 정보 없는 기사에 넣을 값
+    param rate_limit : 사이트 호스트당 초당 최대 요청 수 (None이면 제한 없음)
+    param parser : 피드 파서 "fast"(fastfeed, 실패시 feedparser) / "feedparser"(항상 feedparser)
+    param description_max : 요약 최대 글자 수 (태그 제거 후, 0 이면 자르지 않음)
+    param description_full : True면 요약 원문 전체 zlib 압축본을 튜플 8번째 값으로 추가 (description_full 컬럼)
+    param timezone : 시간대 없는 작성일시 저장 기준 ("+09:00" / "Asia/Seoul", None이면 normalize.DEFAULT_TIMEZONE)
+    monotonic_ids : extract_id() 번호가 새 기사일수록 커지는지 (False면 증분 상태 hwm 비교 안함, seen_state 모듈)
+    '''
+    monotonic_ids = True
+
+    def __init__(self, site: str, base_url: str, id_param: str = "idx", default_creator: str = "",
+                 rate_limit: float = None, parser: str = "fast", description_max: int = DEFAULT_MAX_CHARS,
+                 description_full: bool = False, timezone: str = None) :
+        if parser not in BACKENDS :
+            raise ValueError(f"알 수 없는 파서 : {parser} (선택 : {BACKENDS})")
+        self.site = site
+        self.base_url = base_url
+        self.id_param = id_param
+        self.default_creator = default_creator or site
+        self.rate_limit = rate_limit
+        self.parser = parser
+        self.description_max = description_max
+        self.description_full = description_full
+        self.timezone = timezone
+
+    def __repr__(self) :
+        return f"{type(self).__name__}(site={self.site!r}, base_url={self.base_url!r})"
+
+    def discover(self, cache=None) -> list :
+        '''
+        수집 대상 카테고리 목록 반환 [{'category': '...', 'url': '...'}]
+        param cache : http_cache.HttpCache (조건부 GET)
+        '''
+        raise NotImplementedError
+
+    def extract_id(self, link: str) :
+        '''
+        기사 링크 질의문에서 id_param 숫자 값 추출 (urlparse + parse_qs 대신 미리 컴파일한 정규식)
+        return : int 고유번호, 없으면 None (해당 기사 건너뜀)
+        '''
+        m = id_pattern(self.id_param).search(link)
+        return int(m.group(1)) if m else None
+
+    def map_entry(self, entry, idx: int, written_dt: str, target: dict, description: str = None) -> tuple :
+        '''
+        기사 객체 -> DB 튜플
+        튜플 구조 (idx(int), title(str), link(str), creator(str), written_dt(str), description(str), category(str))
+        param description : Normalizer.description() 로 정리한 요약 (None이면 원문 summary 그대로)
+        '''
+        return (
+            idx
+            ,entry.title.strip()
+            ,entry.link
+            ,entry.get('author', self.default_creator)
+            ,written_dt
+            ,entry.get('summary', '') if description is None else description
+            ,target['category']
+        )
@@ -0,0 +1,18 @@
+"""sources.boannews 모듈 : 보안뉴스(boannews.com) 어댑터 (첫번째 어댑터)
+discover()   : rss_ps.get_rss() 그대로 사용 (홈페이지 -> rss안내 페이지 -> "메인 카테고리" 표)
+extract_id() : 기사 링크 ?idx=123 (기본 동작)
+"""
+
+from .base import SourceAdapter
+from .. import rss_ps
+
+
+class BoannewsAdapter(SourceAdapter) :
+    def __init__(self, site: str = "boannews", base_url: str = "https://www.boannews.com/",
+                 id_param: str = "idx", default_creator: str = "보안뉴스", rate_limit: float = None,
+                 parser: str = "fast", **options) :
+        super().__init__(site, base_url, id_param=id_param, default_creator=default_creator,
+                         rate_limit=rate_limit, parser=parser, **options)
+
+    def discover(self, cache=None) -> list :
+        return rss_ps.get_rss(cache=cache, url=self.base_url)
@@ -0,0 +1,50 @@
+r"""sources.generic 모듈 : 표준 RSS/Atom 사이트용 범용 어댑터
+별도 코드 없이 sites.ini 설정만으로 사이트 추가
+    feeds      : 피드 주소 목록 (카테고리=주소, 줄바꿈 구분), 없으면 홈페이지에서 discover_feeds() 자동 탐색
+    id_param   : 링크 질의문 고유번호 키 (예: idx, no, id)
+    id_pattern : 질의문에 번호가 없는 사이트용 링크 정규식, 첫번째 그룹이 고유번호 (예: /news/(\d+))
+둘 다 못찾으면 링크 sha1 해시 앞 60bit 를 고유번호로 사용 (같은 링크 -> 같은 번호)
+"""
+
+import hashlib
+import re
+
+from .base import SourceAdapter
+from .. import rss
+
+
+class GenericRSSAdapter(SourceAdapter) :
+    '''
+    param feeds : {'카테고리': '피드 주소'} (None이면 base_url 에서 자동 탐색)
+    param id_pattern : 고유번호 추출 정규식 문자열
+    링크 해시 번호는 크기 순서가 없고, 설정한 번호도 기사마다 해시로 대체될 수 있음 -> 증분 상태는 해시 목록으로만 판정
+    '''
+    monotonic_ids = False
+
+    def __init__(self, site: str, base_url: str, feeds: dict = None, id_param: str = None,
+                 id_pattern: str = None, default_creator: str = "", rate_limit: float = None,
+                 parser: str = "fast", **options) :
+        super().__init__(site, base_url, id_param=id_param, default_creator=default_creator,
+                         rate_limit=rate_limit, parser=parser, **options)
+        self.feeds = feeds or {}
+        self.id_re = re.compile(id_pattern) if id_pattern else None
+
+    def discover(self, cache=None) -> list :
+        if self.feeds :
+            return [{"category": category, "url": url} for category, url in self.feeds.items()]
+        found = rss.discover_feeds(self.base_url, cache=cache)
+        if not found :
+            raise Exception(f"[{self.site}] 피드 주소를 찾지 못했습니다 : {self.base_url}")
+        return [{"category": self.site, "url": url} for url in found]
+
+    def extract_id(self, link: str) :
+        if self.id_param :
+            idx = super().extract_id(link)
+            if idx :
+                return idx
+        if self.id_re is not None :
+            m = self.id_re.search(link)
+            if m :
+                return int(m.group(1))
+        # BIGINT 범위 안의 안정적인 번호
+        return int(hashlib.sha1(link.encode("utf-8")).hexdigest()[:15], 16)
@@ -0,0 +1,191 @@
+"""spool 모듈 : DB 저장 전 로컬 선기록(write-ahead) 스풀 (sqlite 파일 1개, .spool.sqlite)
+DB 접속 실패시 이미 다운로드/파싱한 기사를 버리면 다음 실행에서 같은 피드를 다시 받아야 함
+-> 파싱 결과를 먼저 스풀 파일에 기록(append) 후 검증값/증분 상태 저장, DB 저장은 스풀 비우기(drain)로 수행
+
+append()  : 기사 튜플 리스트 1개 = batch 1개, 한 트랜잭션으로 기록 (기록 완료 후에는 프로세스가 죽어도 유지)
+drain()   : 오래된 batch 부터 handler.batch_size 단위로 읽어서 upsert -> 성공한 행만 스풀에서 삭제
+            upsert 라서 삭제 직전에 죽어서 같은 행을 다시 저장해도 결과 같음 (category 는 db_conn.merge_stored_categories() 가 값 단위로 합쳐서 중복 없음)
+            DB 실패시 남은 행은 그대로 -> 다음 실행(다음 데몬 주기)에서 이어서 저장
+pending() : 남은 행 수
+
+테이블
+    batches (id, table_name, site, with_full, created_at)
+    rows    (batch_id, idx, title, link, creator, written_dt, description, category, description_full)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from . import metrics
+from .db_conn import NEWS_COLUMNS
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_TABLE = "boannews_rss"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    site TEXT,
+    with_full INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    batch_id INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    title TEXT,
+    link TEXT,
+    creator TEXT,
+    written_dt TEXT,
+    description TEXT,
+    category TEXT,
+    description_full BLOB
+);
+CREATE INDEX IF NOT EXISTS rows_batch ON rows (batch_id);
+"""
+_COLUMNS = "idx, title, link, creator, written_dt, description, category, description_full"
+
+
+class Spool :
+    '''
+    param path : 스풀 sqlite 파일 경로 (없으면 생성)
+    여러 스레드(다중 사이트 수집)에서 같은 객체 공유 가능, sqlite 접근만 잠금 (DB upsert 중에는 잠금 풀림)
+        spool = Spool(".spool.sqlite")
+        spool.append(list_news)
+        spool.drain(handler)
+    '''
+    def __init__(self, path: str) :
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")   # commit 후 전원이 나가도 batch 유지
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self, exc_type, exc, tb) :
+        self.close()
+
+    def append(self, rows: list, table_name: str = DEFAULT_TABLE, site: str = None) -> int :
+        '''
+        param rows : 뉴스 튜플 리스트 (NEWS_COLUMNS 개, description_full 포함시 1개 더)
+        param site : 다중 사이트 공용 테이블 저장시 사이트 키
+        return : 기록한 행 수
+        '''
+        if not rows :
+            return 0
+        with_full = any(len(row) > NEWS_COLUMNS for row in rows)
+        with self._lock :
+            with self._conn :   # 한 트랜잭션 (batch 정보 + 기사 행)
+                batch_id = self._conn.execute(
+                    "INSERT INTO batches (table_name, site, with_full, created_at) VALUES (?, ?, ?, ?)",
+                    (table_name, site, int(with_full), time.time())).lastrowid
+                self._conn.executemany(f"INSERT INTO rows (batch_id, {_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                       ((batch_id,) + tuple(row) + (None,) * (NEWS_COLUMNS + 1 - len(row)) for row in rows))
+        metrics.inc("spool_rows_total", len(rows), action="append")
+        logger.info(f"스풀 기록 : batch {batch_id}, {len(rows)}건 ({table_name}{f', {site}' if site else ''})")
+        return len(rows)
+
+    def pending(self, site: str = None) -> int :
+        '''남은 행 수 (site 지정시 해당 사이트 batch 만)'''
+        sql = "SELECT COUNT(*) FROM rows JOIN batches ON batches.id = rows.batch_id"
+        with self._lock :
+            if site is None :
+                return self._conn.execute(sql).fetchone()[0]
+            return self._conn.execute(sql + " WHERE batches.site = ?", (site,)).fetchone()[0]
+
+    def _batches(self, site: str = None) -> list :
+        with self._lock :
+            if site is None :
+                return self._conn.execute("SELECT id, table_name, site, with_full FROM batches ORDER BY id").fetchall()
+            return self._conn.execute("SELECT id, table_name, site, with_full FROM batches WHERE site = ? ORDER BY id",
+                                      (site,)).fetchall()
+
+    def _read_chunk(self, batch_id: int, limit: int) -> list :
+        with self._lock :
+            return self._conn.execute(f"SELECT rowid, {_COLUMNS} FROM rows WHERE batch_id = ? ORDER BY rowid LIMIT ?",
+                                      (batch_id, limit)).fetchall()
+
+    def _delete_rows(self, batch_id: int, last_rowid: int) -> None :
+        with self._lock :
+            with self._conn :
+                self._conn.execute("DELETE FROM rows WHERE batch_id = ? AND rowid <= ?", (batch_id, last_rowid))
+
+    def _delete_batch(self, batch_id: int) -> None :
+        with self._lock :
+            with self._conn :
+                self._conn.execute("DELETE FROM rows WHERE batch_id = ?", (batch_id,))
+                self._conn.execute("DELETE FROM batches WHERE id = ?", (batch_id,))
+
+    def drain(self, handler, site: str = None) -> int :
+        '''
+        남은 batch 를 오래된 순서대로 DB upsert (batch 순서 유지 -> 같은 기사는 최신 batch 내용이 마지막에 저장)
+        param handler : db_handler.MariaDBHandler (batch_size 단위로 읽어서 upsert_news 호출)
+        param site : 지정시 해당 사이트 batch 만 (다중 사이트 수집 스레드별 drain)
+        return : 저장한 행 수
+        Raises : handler.upsert_news() 에러 (실패한 chunk 부터 스풀에 남음)
+        '''
+        written = 0
+        start = time.perf_counter()
+        try :
+            for batch_id, table_name, batch_site, with_full in self._batches(site) :
+                while True :
+                    chunk = self._read_chunk(batch_id, handler.batch_size)
+                    if not chunk :
+                        break
+                    rows = [row[1:] if with_full else row[1:NEWS_COLUMNS + 1] for row in chunk]
+                    handler.upsert_news(rows, table_name=table_name, site=batch_site)
+                    # DB commit 후 삭제 -> 여기서 죽으면 다음 drain 에서 같은 행 다시 upsert (결과 같음)
+                    self._delete_rows(batch_id, chunk[-1][0])
+                    written += len(rows)
+                    metrics.inc("spool_rows_total", len(rows), action="drain")
+                self._delete_batch(batch_id)
+        finally :
+            metrics.set_gauge("spool_rows_pending", self.pending())
+        if written :
+            logger.info(f"스풀 저장 완료 : {written}건, {time.perf_counter() - start:.2f}s")
+        return written
+
+    def close(self) -> None :
+        with self._lock :
+            self._conn.close()
+
+
+if __name__ == "__main__" :
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from bench.fake_db import FakeConnection
+    from pkg.db_conn import insert_news_many
+
+    class _Handler :
+        '''MariaDBHandler 대역 : 두번째 upsert 에서 DB 장애'''
+        batch_size = 2
+
+        def __init__(self) :
+            self.conn = FakeConnection()
+            self.calls = 0
+
+        def upsert_news(self, rows, table_name=DEFAULT_TABLE, site=None) :
+            self.calls += 1
+            if self.calls == 2 :
+                raise ConnectionError("DB 접속 실패 (테스트)")
+            insert_news_many(self.conn, rows, table_name=table_name)
+            return len(rows)
+
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), ".spool.sqlite")
+    handler = _Handler()
+    with Spool(path) as spool :
+        spool.append([(i, f"제목{i}", f"https://t.com/{i}", "기자", "2026-10-18 10:00:00", "요약", "보안") for i in range(5)])
+        try :
+            spool.drain(handler)
+        except ConnectionError as e :
+            print("drain 중단 :", e, "/ 남은 행", spool.pending())
+        print("재시도 저장", spool.drain(handler), "/ 남은 행", spool.pending(), "/ DB", handler.conn.count(DEFAULT_TABLE))
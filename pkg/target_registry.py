@@ -0,0 +1,90 @@
+"""target_registry 모듈 : 카테고리별 rss.xml 주소 목록(targets) 파일 캐시
+get_rss()는 홈페이지 + rss안내 페이지 두번 통신하고 html 파싱까지 해야 하는데 결과는 거의 바뀌지 않음
+-> 한번 찾은 목록을 json 파일로 저장해두고 아래 경우에만 다시 탐색
+    1) 마지막 탐색 후 ttl(초) 경과
+    2) force=True (강제 갱신 옵션)
+    3) 저장된 xml 주소가 연속 fail_threshold 회 이상 다운로드 실패 (사이트 구조/주소 변경 의심)
+
+파일 구조 (.rss_targets.json)
+    {"discovered_at": 1700000000.0, "targets": [{"category": "...", "url": "..."}], "failures": {url: 연속실패횟수}}
+"""
+
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger("RSS_collector : " + __name__)
+
+DEFAULT_TTL = 24 * 60 * 60      # 하루 한번 재탐색
+DEFAULT_FAIL_THRESHOLD = 2      # 같은 주소 연속 2회 실패시 재탐색
+
+
+class TargetRegistry :
+    '''
+    param path : 목록 저장 json 파일 경로 (main.py 옆 .rss_targets.json)
+    param ttl : 재탐색 주기(초)
+    param fail_threshold : 재탐색 유발하는 주소별 연속 실패 횟수
+    '''
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL, fail_threshold: int = DEFAULT_FAIL_THRESHOLD) :
+        self.path = path
+        self.ttl = ttl
+        self.fail_threshold = fail_threshold
+        self._data = self._load()
+
+    def _load(self) -> dict :
+        try :
+            with open(self.path, encoding="utf-8") as f :
+                data = json.load(f)
+            if data.get("targets") :
+                return data
+        except FileNotFoundError :
+            pass
+        except (OSError, ValueError) as e :
+            logger.warning(f"카테고리 목록 파일 읽기 실패, 재탐색 진행 : {e}")
+        return {"discovered_at": 0, "targets": [], "failures": {}}
+
+    def is_stale(self) -> bool :
+        '''재탐색 필요 여부 : 목록 없음 / ttl 경과 / 연속 실패 주소 존재'''
+        if not self._data["targets"] :
+            return True
+        if time.time() - self._data["discovered_at"] > self.ttl :
+            return True
+        return any(cnt >= self.fail_threshold for cnt in self._data["failures"].values())
+
+    def get_targets(self, discover, force: bool = False) -> list :
+        '''
+        저장된 목록 반환, 재탐색 필요시 discover() 호출해서 목록 갱신 후 저장
+        param discover : 인자 없이 [{'category', 'url'}] 리스트 반환하는 함수 (rss_ps.get_rss)
+        param force : True면 ttl 무관하게 재탐색
+        '''
+        if not force and not self.is_stale() :
+            logger.info(f"저장된 카테고리 목록 사용 ({len(self._data['targets'])}개)")
+            return self._data["targets"]
+
+        logger.info("카테고리 목록 재탐색 시작" + (" (강제 갱신)" if force else ""))
+        targets = discover()   # 탐색 실패시 예외 그대로 전파 (기존 get_rss() 흐름 유지)
+        self._data = {"discovered_at": time.time(), "targets": targets, "failures": {}}
+        self.save()
+        return targets
+
+    def report(self, results: list) -> None :
+        '''
+        fetcher.fetch_all() 결과로 주소별 연속 실패 횟수 갱신 (성공하면 0으로 초기화) 후 저장
+        '''
+        failures = self._data["failures"]
+        for result in results :
+            url = result["target"]["url"]
+            if result["error"] :
+                failures[url] = failures.get(url, 0) + 1
+                if failures[url] == self.fail_threshold :
+                    logger.warning(f"[{result['target']['category']}] 연속 {failures[url]}회 실패, 다음 실행시 목록 재탐색")
+            else :
+                failures.pop(url, None)
+        self.save()
+
+    def save(self) -> None :
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f :
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
@@ -14,8 +14,9 @@ echo "[$(date '+%Y-%m-%d %H:%M:%S')] === 쉘 스크립트 실행 시작 ===" >>
 $PROJECT_DIR/.venv/bin/python $PROJECT_DIR/main.py >> $LOG_FILE 2>&1 && \
 (
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] [성공] 수집 완료. 14일 전 데이터 정리 시작..." >> $LOG_FILE
-    # .my.cnf 에 유저계정 정보 있음 비밀번호 없이 실행됨.
-    /usr/bin/mysql -e "DELETE FROM boannews_rss WHERE save_at < DATE_SUB(NOW(), INTERVAL 14 DAY);" news_hub >> $LOG_FILE 2>&1
+    # pkg.retention : 기본키 batch 단위 삭제 (수집기 upsert 막지 않도록 batch 사이 대기, 시간 예산 초과시 다음 실행으로)
+    # boannews_rss + 다중 사이트 공용 테이블 news_rss (있을 때만) 모두 정리
+    (cd $PROJECT_DIR && $PROJECT_DIR/.venv/bin/python -m pkg.retention --days 14) >> $LOG_FILE 2>&1
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] [완료] 데이터 정리 공정 종료." >> $LOG_FILE
 ) || \
 (
@@ -0,0 +1,18 @@
+-- 다중 사이트 공용 테이블 (main.py --sites)
+-- 사이트 키(site) + 사이트 내 고유번호(idx) 가 유일키 -> 사이트끼리 번호 겹쳐도 충돌 없음
+CREATE TABLE IF NOT EXISTS news_rss (
+    site        VARCHAR(32)   NOT NULL,
+    idx         BIGINT        NOT NULL,
+    title       VARCHAR(500)  NOT NULL,
+    link        VARCHAR(1000) NOT NULL,
+    creator     VARCHAR(100),
+    written_dt  DATETIME,
+    description TEXT,
+    category    VARCHAR(100),                  -- 여러 카테고리에 실린 기사는 "보안,IT" (FIND_IN_SET 검색)
+    save_at     TIMESTAMP     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (site, idx),
+    KEY idx_save_at (save_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- (선택) 요약 원문 압축본 저장 : sites.ini description_full = true 인 사이트 (description 은 태그 제거 + 길이 제한본)
+-- ALTER TABLE news_rss ADD COLUMN description_full MEDIUMBLOB NULL AFTER description;